@@ -1,7 +1,6 @@
 import argparse
 import json
 import os
-import glob
 from typing import Optional
 from datetime import datetime
 
@@ -67,11 +66,9 @@ def _status(username: str) -> dict:
                 last_dump_label = f"slot {i}.json"
     # Latest backup directory
     bbase = os.path.join("Source", "saves", username, "backups")
-    latest_backup = None
-    if os.path.isdir(bbase):
-        dirs = [d for d in glob.glob(os.path.join(bbase, "*")) if os.path.isdir(d)]
-        if dirs:
-            latest_backup = max(dirs, key=lambda d: os.path.basename(d))
+    from rogueeditor.backup_store import list_snapshot_dirs
+    dirs = list_snapshot_dirs(bbase)
+    latest_backup = dirs[-1] if dirs else None
     return {
         "last_dump_label": last_dump_label or "-",
         "last_dump_time": _human_time(last_dump) if last_dump else "-",
@@ -323,12 +320,13 @@ def main():
         elif cmd == "7":
             # Restore from backup (choose scope)
             import os
-            from rogueeditor.utils import user_save_dir, load_json
+            from rogueeditor.utils import user_save_dir
+            from rogueeditor.backup_store import list_snapshot_dirs, load_backup_json
             base = os.path.join(user_save_dir(username), "backups")
             if not os.path.isdir(base):
                 print("No backups found.")
                 continue
-            dirs = sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+            dirs = list_snapshot_dirs(base)
             if not dirs:
                 print("No backups found.")
                 continue
@@ -352,9 +350,8 @@ def main():
             if scope == "all":
                 editor.restore_from_backup(backup_dir)
             elif scope == "trainer":
-                tp = os.path.join(backup_dir, "trainer.json")
-                if os.path.exists(tp):
-                    data = load_json(tp)
+                data = load_backup_json(backup_dir, "trainer.json")
+                if data is not None:
                     api.update_trainer(data)
                     print("Trainer restored.")
                 else:
@@ -365,9 +362,8 @@ def main():
                 except Exception:
                     print("Invalid slot")
                     continue
-                sp = os.path.join(backup_dir, f"slot {s}.json")
-                if os.path.exists(sp):
-                    data = load_json(sp)
+                data = load_backup_json(backup_dir, f"slot {s}.json")
+                if data is not None:
                     api.update_slot(s, data)
                     print(f"Slot {s} restored.")
                 else:
@@ -465,6 +461,9 @@ def main():
                     from rogueeditor.catalog import build_clean_catalogs_from_tmp
                     build_clean_catalogs_from_tmp()
                     print("Catalogs written to Source/data.")
+                    from rogueeditor.catalog_bundle import build_catalog_bundle
+                    summary = build_catalog_bundle()
+                    print(f"Catalog bundle written: {summary['path']} ({len(summary['files'])} catalogs).")
                 except Exception as e:
                     print(f"[ERROR] Failed to build catalogs: {e}")
             else:
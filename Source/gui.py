@@ -34,6 +34,7 @@ from rogueeditor import PokerogueAPI
 from rogueeditor.editor import Editor
 from rogueeditor.session_manager import SessionManager, SessionObserver, SessionState
 from rogueeditor.save_corruption_prevention import SafeSaveManager
+from rogueeditor.backup_store import list_snapshot_dirs
 # Enhanced item manager import removed - functionality integrated into main item manager
 from rogueeditor.utils import (
     list_usernames,
@@ -613,6 +614,11 @@ class RogueManagerGUI(ttk.Frame):
         ttk.Label(local_btn_frame, text="⚠️ Manual edits may corrupt saves. Proceed at your own risk.",
                  foreground="red", font=('TkDefaultFont', 8)).pack(side=tk.LEFT)
 
+        # Diagnostics
+        diag_f = ttk.LabelFrame(inner, text="Diagnostics")
+        diag_f.pack(fill=tk.X, padx=6, pady=6)
+        ttk.Button(diag_f, text="Network Diagnostics...", command=self._open_api_diagnostics).pack(side=tk.LEFT, padx=4, pady=4)
+
 
     def _build_console(self):
         self.console_frame = ttk.LabelFrame(self.console_col, text="Console")
@@ -759,6 +765,19 @@ class RogueManagerGUI(ttk.Frame):
             self.after(0, finish)
         threading.Thread(target=runner, daemon=True).start()
 
+    def _when_done(self, future, on_done, interval_ms: int = 50):
+        """Call `on_done(future)` on the Tk thread once `future` has finished.
+
+        Polls from the Tk thread instead of using done-callbacks, which would run
+        on the worker thread and must not touch Tk.
+        """
+        def poll():
+            if future.done():
+                on_done(future)
+            else:
+                self.after(interval_ms, poll)
+        poll()
+
     def _safe(self, fn):
         """Simple safe wrapper that handles exceptions without complex feedback."""
         def wrapper():
@@ -1216,7 +1235,12 @@ class RogueManagerGUI(ttk.Frame):
             api = PokerogueAPI(user, pwd)
 
             self._log("[DEBUG] Calling API login...")
-            api.login()
+            try:
+                api.login()
+            except Exception:
+                # Give back the pooled-session reference this client took
+                api.close()
+                raise
 
             self._log("[DEBUG] Login successful, setting up session...")
             # Prefer server-provided clientSessionId; otherwise generate a new one for this session
@@ -1233,8 +1257,7 @@ class RogueManagerGUI(ttk.Frame):
             except Exception as e:
                 self._log(f"Warning: Could not generate client session ID: {e}")
 
-            self.api = api
-            self.editor = Editor(api)
+            self._replace_api(api)
             self.username = user
 
             self._log("[DEBUG] Scheduling login completion...")
@@ -1269,6 +1292,16 @@ class RogueManagerGUI(ttk.Frame):
             self._log(f"[ERROR] Login completion failed: {e}")
             self.feedback.show_error_toast(f"Login completion error: {e}")
 
+    def _replace_api(self, api: PokerogueAPI) -> None:
+        """Make `api` the active client, rebind the editor to it and close the client it replaces."""
+        old, self.api = self.api, api
+        self.editor = Editor(api)
+        if old is not None and old is not api:
+            try:
+                old.close()
+            except Exception as e:
+                self._log(f"Warning: Could not close previous API client: {e}")
+
     def _logout(self):
         """Log out the current user, warning if there are unsent local changes."""
         try:
@@ -1295,6 +1328,11 @@ class RogueManagerGUI(ttk.Frame):
             self._cleanup_session_manager()
         except Exception:
             pass
+        try:
+            if self.api:
+                self.api.close()
+        except Exception:
+            pass
         self.api = None
         self.editor = None
         self.username = None
@@ -1509,7 +1547,11 @@ class RogueManagerGUI(ttk.Frame):
             self._log("Creating new API instance for refresh...")
             # Re-login to obtain a fresh token and possibly server-provided clientSessionId
             api = PokerogueAPI(user, pwd)
-            api.login()
+            try:
+                api.login()
+            except Exception:
+                api.close()
+                raise
 
             # If server did not send csid, generate a fresh one
             try:
@@ -1534,8 +1576,8 @@ class RogueManagerGUI(ttk.Frame):
                     except Exception as e:
                         self._log(f"Warning: Session manager update failed: {e}")
 
-                    # Update references
-                    self.api = api
+                    # Update references (releases the replaced client's pooled session)
+                    self._replace_api(api)
                     self.status_var.set(f"Status: Session refreshed for {user}")
                     # Session ID no longer displayed
                     self._log("Session refreshed.")
@@ -1555,10 +1597,10 @@ class RogueManagerGUI(ttk.Frame):
             self.after(0, done_callback)
 
         except Exception as e:
-            # Handle refresh errors properly
-            def handle_refresh_error():
-                self._log(f"[ERROR] Session refresh failed: {e}")
-                self.feedback.handle_error(e, "Session Refresh", "refreshing session", use_toast=True)
+            # Handle refresh errors properly (bind the error: `e` is unset after the except block)
+            def handle_refresh_error(err=e):
+                self._log(f"[ERROR] Session refresh failed: {err}")
+                self.feedback.handle_error(err, "Session Refresh", "refreshing session", use_toast=True)
                 self.status_var.set(f"Status: Session refresh failed for {user}")
 
             self.after(0, handle_refresh_error)
@@ -1616,33 +1658,16 @@ class RogueManagerGUI(ttk.Frame):
         if not self.feedback.confirm_action("Confirm", "Dump trainer and all slots to local files? Existing files will be overwritten.", "dumping all data"):
             return
 
-        successes: list[str] = []
-        errors: list[str] = []
-        total_files = 6  # trainer + 5 slots max
-        current_file = 0
-
-        # Trainer
+        # Trainer + slots 1..5 are fetched concurrently
+        self._log("Dumping trainer data and slots 1-5...")
         try:
-            current_file += 1
-            self._log(f"Dumping trainer data... ({current_file}/{total_files})")
-            self.editor.dump_trainer()
-            successes.append("trainer")
-            self._log("Dumped trainer data successfully")
+            successes, errors = self.editor.dump_all()
         except Exception as e:
-            errors.append(f"trainer: {e}")
-            self._log(f"Trainer dump failed: {e}")
-
-        # Slots 1..5
-        for i in range(1, 6):
-            try:
-                current_file += 1
-                self._log(f"Dumping slot {i}... ({current_file}/{total_files})")
-                self.editor.dump_slot(i)
-                successes.append(f"slot {i}")
-                self._log(f"Dumped slot {i} successfully")
-            except Exception as e:
-                errors.append(f"slot {i}: {e}")
-                self._log(f"Slot {i} dump failed: {e}")
+            successes, errors = [], [f"all: {e}"]
+        for name in successes:
+            self._log(f"Dumped {name} successfully")
+        for err in errors:
+            self._log(f"Dump failed - {err}")
 
         # Show summary on main thread
         def show_summary():
@@ -1796,9 +1821,13 @@ class RogueManagerGUI(ttk.Frame):
                     data = load_json(tp)
                     if not isinstance(data, dict):
                         raise ValueError("trainer.json must contain a JSON object")
-                    self.api.update_trainer(data)
-                    successes.append("trainer")
-                    self._log("Uploaded trainer data successfully")
+                    diff = self.api.diff_system(data, refresh=True) if self.api.client_session_id else None
+                    if diff is not None and not diff.has_changes:
+                        self._log("Trainer matches the server; skipping upload")
+                    else:
+                        self.api.update_trainer(data)
+                        successes.append("trainer")
+                        self._log("Uploaded trainer data successfully" + (f" ({diff.summary()})" if diff else ""))
                 else:
                     self._log(f"trainer.json not found at {tp}; skipping trainer upload")
             except Exception as e:
@@ -1822,9 +1851,13 @@ class RogueManagerGUI(ttk.Frame):
                     data = load_json(sp)
                     if not isinstance(data, dict):
                         raise ValueError(f"slot {i}.json must contain a JSON object")
+                    diff = self.api.diff_slot(i, data, refresh=True)
+                    if diff is not None and not diff.has_changes:
+                        self._log(f"Slot {i} matches the server; skipping upload")
+                        continue
                     self.api.update_slot(i, data)
                     successes.append(f"slot {i}")
-                    self._log(f"Uploaded slot {i} successfully")
+                    self._log(f"Uploaded slot {i} successfully" + (f" ({diff.summary()})" if diff else ""))
                 except Exception as e:
                     errors.append(f"slot {i}: {e}")
                     self._log(f"Failed to upload slot {i}: {e}")
@@ -2247,7 +2280,7 @@ class RogueManagerGUI(ttk.Frame):
         if not os.path.isdir(base):
             messagebox.showinfo("No backups", "No backups found.")
             return
-        dirs = sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+        dirs = list_snapshot_dirs(base)
         if not dirs:
             messagebox.showinfo("No backups", "No backups found.")
             return
@@ -2291,10 +2324,9 @@ class RogueManagerGUI(ttk.Frame):
                     )
                 elif choice == 'trainer':
                     def work():
-                        from rogueeditor.utils import load_json
-                        tp = os.path.join(backup_dir, 'trainer.json')
-                        if os.path.exists(tp):
-                            data = load_json(tp)
+                        from rogueeditor.backup_store import load_backup_json
+                        data = load_backup_json(backup_dir, 'trainer.json')
+                        if data is not None:
                             self.api.update_trainer(data)
                     self._run_async("Restoring backup (trainer)...", work, lambda: self._log(f"Restored trainer from {backup_dir}"))
                 else:
@@ -2304,10 +2336,9 @@ class RogueManagerGUI(ttk.Frame):
                         messagebox.showwarning("Invalid", "Invalid slot")
                         return
                     def work():
-                        from rogueeditor.utils import load_json
-                        sp = os.path.join(backup_dir, f"slot {s}.json")
-                        if os.path.exists(sp):
-                            data = load_json(sp)
+                        from rogueeditor.backup_store import load_backup_json
+                        data = load_backup_json(backup_dir, f"slot {s}.json")
+                        if data is not None:
                             self.api.update_slot(s, data)
                     self._run_async("Restoring backup (slot)...", work, lambda: self._log(f"Restored slot {s} from {backup_dir}"))
                 opt.destroy(); top.destroy()
@@ -2318,7 +2349,7 @@ class RogueManagerGUI(ttk.Frame):
                 return
             target = lb.get(sel[0])
             backup_dir = os.path.join(base, target)
-            dirs2 = sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+            dirs2 = list_snapshot_dirs(base)
             is_last = len(dirs2) == 1
             is_latest = (dirs2 and target == dirs2[-1])
             msg = f"Delete backup {target}?"
@@ -2345,7 +2376,6 @@ class RogueManagerGUI(ttk.Frame):
         try:
             from rogueeditor.utils import user_save_dir
             from rogueeditor.persistence import persistence_manager
-            import re
             import os
             if not self.username:
                 self.backup_status_var.set("Last backup: none")
@@ -2355,9 +2385,7 @@ class RogueManagerGUI(ttk.Frame):
                 self.backup_status_var.set("Last backup: none")
                 return
             # Only consider timestamped backup folders: YYYYMMDD_HHMMSS
-            all_dirs = [d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))]
-            ts_re = re.compile(r"^\d{8}_\d{6}$")
-            dirs = sorted([d for d in all_dirs if ts_re.match(d)])
+            dirs = list_snapshot_dirs(base)
             
             if dirs:
                 latest_backup = dirs[-1]
@@ -2376,12 +2404,13 @@ class RogueManagerGUI(ttk.Frame):
         self._update_backup_status()
 
     def _restore_dialog2(self):
-        from rogueeditor.utils import user_save_dir, load_json
+        from rogueeditor.utils import user_save_dir
+        from rogueeditor.backup_store import load_backup_json
         base = os.path.join(user_save_dir(self.username or ""), "backups")
         if not os.path.isdir(base):
             messagebox.showinfo("No backups", "No backups found.")
             return
-        dirs = sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+        dirs = list_snapshot_dirs(base)
         if not dirs:
             messagebox.showinfo("No backups", "No backups found.")
             return
@@ -2420,9 +2449,8 @@ class RogueManagerGUI(ttk.Frame):
                     self._run_async("Restoring backup (all)...", lambda: self.editor.restore_from_backup(backup_dir), lambda: [self._log(f"Restored backup {name} (all)"), self._update_backup_status(), self._refresh_slots()])
                 elif choice == 'trainer':
                     def work():
-                        tp = os.path.join(backup_dir, 'trainer.json')
-                        if os.path.exists(tp):
-                            data = load_json(tp)
+                        data = load_backup_json(backup_dir, 'trainer.json')
+                        if data is not None:
                             self.api.update_trainer(data)
                     self._run_async("Restoring trainer...", work, lambda: [self._log(f"Restored trainer from {name}"), self._update_backup_status(), self._refresh_slots()])
                 else:
@@ -2432,9 +2460,8 @@ class RogueManagerGUI(ttk.Frame):
                         messagebox.showwarning("Invalid", "Invalid slot")
                         return
                     def work():
-                        sp = os.path.join(backup_dir, f"slot {s}.json")
-                        if os.path.exists(sp):
-                            data = load_json(sp)
+                        data = load_backup_json(backup_dir, f"slot {s}.json")
+                        if data is not None:
                             self.api.update_slot(s, data)
                     self._run_async("Restoring slot...", work, lambda: [self._log(f"Restored slot {s} from {name}"), self._update_backup_status(), self._refresh_slots()])
                 opt.destroy(); top.destroy()
@@ -2450,7 +2477,7 @@ class RogueManagerGUI(ttk.Frame):
                 return
             target = lb.get(sel[0])
             bdir = os.path.join(base, target)
-            d2 = sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+            d2 = list_snapshot_dirs(base)
             is_last = (len(d2) == 1)
             is_latest = (d2 and target == d2[-1])
             msg = f"Delete backup {target}?"
@@ -2576,19 +2603,36 @@ class RogueManagerGUI(ttk.Frame):
             data[wkey] = val
             from rogueeditor.utils import slot_save_path
             p = slot_save_path(self.api.username, slot)
-            # Use safe save operation with backup
-            backup_path = self.safe_save_manager.safe_dump_json(
-                p, data, f"Weather change to {val} for slot {slot}"
+            # Save with backup on the background writer; offer the upload only once the local save landed
+            future = self.safe_save_manager.safe_dump_json_async(
+                p, data, f"Weather change to {val} for slot {slot}", username=self.api.username
             )
-            self._log(f"Updated weather to {val}; wrote {p} (backup: {backup_path})")
-            if messagebox.askyesno('Upload', 'Upload changes to server?'):
+            apply_btn.configure(state=tk.DISABLED)
+
+            def _saved(fut):
                 try:
-                    self.api.update_slot(slot, data)
-                    messagebox.showinfo('Uploaded', 'Server updated successfully')
+                    res = fut.result()
+                    error = None if res.success else res.error_message
                 except Exception as e:
-                    messagebox.showerror('Upload failed', str(e))
-            top.destroy()
-        ttk.Button(top, text='Apply', command=do_apply).grid(row=1, column=1, padx=6, pady=6, sticky=tk.W)
+                    res, error = None, str(e)
+                if error is not None:
+                    self._log(f"Local save of weather change failed: {error}")
+                    messagebox.showerror('Save failed', f"Local save failed; nothing was uploaded.\n\n{error}")
+                    if top.winfo_exists():
+                        apply_btn.configure(state=tk.NORMAL)
+                    return
+                self._log(f"Updated weather to {val}; wrote {p} (backup: {res.backup_id or 'No backup created'})")
+                if messagebox.askyesno('Upload', 'Upload changes to server?'):
+                    try:
+                        self.api.update_slot(slot, data)
+                        messagebox.showinfo('Uploaded', 'Server updated successfully')
+                    except Exception as e:
+                        messagebox.showerror('Upload failed', str(e))
+                if top.winfo_exists():
+                    top.destroy()
+            self._when_done(future, _saved)
+        apply_btn = ttk.Button(top, text='Apply', command=do_apply)
+        apply_btn.grid(row=1, column=1, padx=6, pady=6, sticky=tk.W)
         self._center_window(top)
 
     def _edit_team_dialog(self):
@@ -2653,6 +2697,12 @@ class RogueManagerGUI(ttk.Frame):
         StartersManagerDialog(self, self.api, self.editor)
         self._log("Opened starters manager")
 
+    def _open_api_diagnostics(self):
+        """Open the network diagnostics window (request timings, retries, bytes, fallbacks)."""
+        from gui.dialogs.api_diagnostics import ApiDiagnosticsDialog
+        ApiDiagnosticsDialog(self, self.api)
+        self._log("Opened network diagnostics")
+
     def _hatch_all_eggs_quick(self):
         """Quick action to hatch all eggs."""
         if not self.editor:
@@ -3,6 +3,8 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk
 
+from rogueeditor.search_index import get_search_index
+
 
 class CatalogSelectDialog(tk.Toplevel):
     """Simple searchable select dialog for name->id catalogs.
@@ -11,11 +13,14 @@ class CatalogSelectDialog(tk.Toplevel):
     debug/docs/GUI_MIGRATION_PLAN.md for line references and context.
     """
 
-    def __init__(self, master, name_to_id: dict[str, int], title: str = 'Select'):
+    def __init__(self, master, name_to_id: dict[str, int], title: str = 'Select',
+                 extra_ids: dict[str, int] | None = None):
         super().__init__(master)
         self.title(title)
         self.geometry('400x400')
         self.name_to_id = name_to_id
+        # Shared prefix/trigram index; `extra_ids` are additional searchable labels for the same ids
+        self._index = get_search_index(name_to_id, extra_ids)
         self._build()
         
         # Center the window relative to parent
@@ -62,43 +67,18 @@ class CatalogSelectDialog(tk.Toplevel):
         self.list.bind('<Return>', lambda e: self._ok())
         ttk.Button(self, text='Select', command=self._ok).pack(pady=6)
         self.var.trace_add('write', self._on_change)
-        self._all = sorted(self.name_to_id.items(), key=lambda kv: kv[0])
-        # Precompute normalized names for better filtering
-        def _norm(s: str) -> str:
-            s = s.strip().lower().replace(' ', '_').replace('-', '_').replace("'", "").replace('.', '')
-            return s
-        self._norm = _norm
-        self._all_norm = [(name, iid, _norm(name)) for name, iid in self._all]
         self._filter('')
         ent.focus_set()
 
     def _on_change(self, *args):
-        self._filter(self.var.get().strip().lower().replace(' ', '_'))
+        self._filter(self.var.get())
 
     def _filter(self, key: str):
-        k = self._norm(key)
+        # Empty query lists the whole catalog; otherwise ranked prefix, substring, then fuzzy matches
+        names = self._index.search(key, limit=None)
         self.list.delete(0, tk.END)
-        # Prefix then substring
-        pref = [e for e in self._all_norm if e[2].startswith(k)]
-        subs = [e for e in self._all_norm if k in e[2] and e not in pref]
-        results = pref + subs
-        if not results:
-            try:
-                import difflib
-                pool = [e[2] for e in self._all_norm]
-                close = difflib.get_close_matches(k, pool, n=20, cutoff=0.6)
-                for ck in close:
-                    for e in self._all_norm:
-                        if e[2] == ck and e not in results:
-                            results.append(e)
-                            if len(results) >= 50:
-                                break
-                    if len(results) >= 50:
-                        break
-            except Exception:
-                pass
-        for name, iid, _ in results:
-            self.list.insert(tk.END, f"{name} ({iid})")
+        for name in names:
+            self.list.insert(tk.END, f"{name} ({self.name_to_id[name]})")
 
     def _ok(self):
         try:
@@ -110,8 +90,9 @@ class CatalogSelectDialog(tk.Toplevel):
         self.destroy()
 
     @classmethod
-    def select(cls, master, name_to_id: dict[str, int], title: str = 'Select') -> int | None:
-        dlg = cls(master, name_to_id, title)
+    def select(cls, master, name_to_id: dict[str, int], title: str = 'Select',
+               extra_ids: dict[str, int] | None = None) -> int | None:
+        dlg = cls(master, name_to_id, title, extra_ids)
         master.wait_window(dlg)
         return getattr(dlg, 'result', None)
 
@@ -0,0 +1,120 @@
+"""
+Network Diagnostics Dialog
+
+Shows per-endpoint latency, retries, bytes and slot endpoint fallback paths
+collected by the API instrumentation layer, plus rate limiter and transfer
+totals, so slow uploads can be traced to the network, the server or retries.
+"""
+
+from __future__ import annotations
+
+import json
+import tkinter as tk
+from tkinter import ttk
+
+from rogueeditor.api_metrics import get_api_metrics
+from rogueeditor.rate_limit import get_rate_limiter
+
+
+class ApiDiagnosticsDialog(tk.Toplevel):
+    """Read-only view of API request metrics with optional auto-refresh."""
+
+    REFRESH_MS = 2000
+
+    def __init__(self, master, api=None):
+        super().__init__(master)
+        self.title("Network Diagnostics")
+        self.geometry("900x520")
+        self.api = api
+        self._auto_var = tk.BooleanVar(value=True)
+        self._after_id = None
+
+        self._build_ui()
+        self._refresh()
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+        try:
+            master._center_window(self, 900, 520)
+        except Exception:
+            pass
+
+    def _build_ui(self):
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X, padx=8, pady=(8, 4))
+        ttk.Button(bar, text="Refresh", command=self._refresh).pack(side=tk.LEFT)
+        ttk.Button(bar, text="Reset", command=self._reset).pack(side=tk.LEFT, padx=(6, 0))
+        ttk.Button(bar, text="Copy JSON", command=self._copy_json).pack(side=tk.LEFT, padx=(6, 0))
+        ttk.Checkbutton(bar, text="Auto-refresh", variable=self._auto_var, command=self._schedule).pack(side=tk.LEFT, padx=(12, 0))
+
+        body = ttk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
+        self.text = tk.Text(body, wrap=tk.NONE, font=("Courier", 9), state=tk.DISABLED)
+        vsb = ttk.Scrollbar(body, orient="vertical", command=self.text.yview)
+        hsb = ttk.Scrollbar(body, orient="horizontal", command=self.text.xview)
+        self.text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        hsb.pack(side=tk.BOTTOM, fill=tk.X)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def _report(self) -> str:
+        parts = [get_api_metrics().format_report()]
+        limiter = get_rate_limiter().stats()
+        if limiter:
+            parts.append("")
+            parts.append("Rate limiter:")
+            for host, st in limiter.items():
+                parts.append(
+                    f"  {host}: rate={st['rate']}/s (max {st['max_rate']}), requests={st['requests']}, "
+                    f"429s={st['throttled']} ({st['throttle_ratio']:.1%}), waited={st['total_wait']}s"
+                )
+        if self.api is not None:
+            try:
+                totals = self.api.transfer_totals()
+                parts.append("")
+                parts.append(
+                    f"Transfers ({self.api.username}): requests={totals['requests']}, "
+                    f"out={totals['bytes_out']} B (wire {totals['bytes_out_wire']} B), "
+                    f"in={totals['bytes_in']} B (wire {totals['bytes_in_wire']} B)"
+                )
+                cache = self.api.response_cache.stats()
+                parts.append(
+                    f"Response cache: entries={cache['entries']}, hits={cache['hits']}, "
+                    f"revalidated={cache['revalidated']}, misses={cache['misses']}, dropped={cache['dropped']}"
+                )
+            except Exception:
+                pass
+        return "\n".join(parts)
+
+    def _refresh(self):
+        report = self._report()
+        self.text.configure(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", report)
+        self.text.configure(state=tk.DISABLED)
+        self._schedule()
+
+    def _schedule(self):
+        if self._after_id is not None:
+            try:
+                self.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if self._auto_var.get():
+            self._after_id = self.after(self.REFRESH_MS, self._refresh)
+
+    def _reset(self):
+        get_api_metrics().reset()
+        self._refresh()
+
+    def _copy_json(self):
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(json.dumps(get_api_metrics().snapshot(), indent=2, default=str))
+        except Exception:
+            pass
+
+    def _close(self):
+        self._auto_var.set(False)
+        self._schedule()
+        self.destroy()
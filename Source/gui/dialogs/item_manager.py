@@ -10,7 +10,7 @@ from rogueeditor import PokerogueAPI
 from rogueeditor.editor import Editor
 from rogueeditor.catalog import (
     DATA_TYPES_JSON, load_nature_catalog, load_berry_catalog, load_types_catalog,
-    get_items_by_category, get_item_display_name, get_item_emoji, get_item_description,
+    get_items_by_category, get_formatted_items_by_category, get_item_display_name, get_item_emoji, get_item_description,
     format_item_for_display, get_form_change_items_for_pokemon
 )
 from rogueeditor.form_persistence import get_pokemon_display_name
@@ -602,8 +602,9 @@ class ItemManagerDialog(tk.Toplevel):
             except Exception:
                 pass
         
-        # Format items via common formatter
-        from rogueeditor.catalog import format_item_for_display
+        # Format items via common formatter (plain entries are prebuilt in the category index)
+        from rogueeditor.catalog import format_item_for_display, load_item_category_index
+        item_index = load_item_category_index()
         formatted_items = []
         for item in items:
             if self._is_pokemon_specific_form_item(item):
@@ -636,7 +637,7 @@ class ItemManagerDialog(tk.Toplevel):
                 except Exception:
                     formatted_items.append(format_item_for_display(item, catalog_label="Form Change"))
             else:
-                formatted_items.append(format_item_for_display(item))
+                formatted_items.append(item_index.display(item))
         
         # Cache the result
         self._item_list_cache[cache_key] = formatted_items
@@ -644,108 +645,31 @@ class ItemManagerDialog(tk.Toplevel):
 
     def _accuracy_items_formatted(self) -> list[str]:
         """Get accuracy items with human-friendly formatting for display."""
-        cache_key = "accuracy_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("accuracy")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("accuracy")
 
     def _experience_items_formatted(self) -> list[str]:
         """Get experience items with human-friendly formatting for display."""
-        cache_key = "experience_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("experience")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("experience")
 
     def _berry_items_formatted(self) -> list[str]:
         """Get berry items with human-friendly formatting for display."""
-        cache_key = "berry_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        try:
-            from rogueeditor.catalog import load_berry_catalog
-            berry_n2i, berry_i2n = load_berry_catalog()
-            
-            formatted_items = []
-            from rogueeditor.catalog import format_item_for_display
-            for name, berry_id in sorted(berry_n2i.items(), key=lambda kv: kv[1]):
-                formatted_items.append(format_item_for_display(name))
-            
-            # Cache the result
-            self._item_list_cache[cache_key] = formatted_items
-            return formatted_items
-        except Exception:
-            return []
+        return get_formatted_items_by_category("berries")
 
     def _vitamin_items_formatted(self) -> list[str]:
         """Get vitamin items with human-friendly formatting for display."""
-        cache_key = "vitamin_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("vitamins")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("vitamins")
 
     def _type_booster_items_formatted(self) -> list[str]:
         """Get type booster items with human-friendly formatting for display."""
-        cache_key = "type_booster_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("type_boosters")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("type_boosters")
 
     def _mint_items_formatted(self) -> list[str]:
         """Get mint items with human-friendly formatting for display."""
-        cache_key = "mint_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("mints")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("mints")
 
     def _temp_battle_items_formatted(self) -> list[str]:
         """Get temp battle items with human-friendly formatting for display."""
-        cache_key = "temp_battle_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("temp_battle")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("temp_battle")
 
     def _trainer_exp_charm_items_formatted(self) -> list[str]:
         """Get trainer EXP charm items with human-friendly formatting for display."""
@@ -769,17 +693,7 @@ class ItemManagerDialog(tk.Toplevel):
 
     def _trainer_items_formatted(self) -> list[str]:
         """Get trainer items with human-friendly formatting for display."""
-        cache_key = "trainer_items"
-        if cache_key in self._item_list_cache:
-            return self._item_list_cache[cache_key]
-        
-        items = get_items_by_category("trainer")
-        from rogueeditor.catalog import format_item_for_display
-        formatted_items = [format_item_for_display(item) for item in items]
-        
-        # Cache the result
-        self._item_list_cache[cache_key] = formatted_items
-        return formatted_items
+        return get_formatted_items_by_category("trainer")
 
     def _on_cat_change(self):
         # Adjust available categories and hint text when switching contexts
@@ -806,11 +720,9 @@ class ItemManagerDialog(tk.Toplevel):
             prev = 0
         self.party_list.delete(0, tk.END)
         from rogueeditor.utils import invert_dex_map, load_pokemon_index
-        from rogueeditor.catalog import load_pokemon_catalog
+        from rogueeditor.catalog import get_pokemon_catalog_entry
 
         inv = invert_dex_map(load_pokemon_index())
-        cat = load_pokemon_catalog() or {}
-        by_dex = cat.get("by_dex") or {}
         for i, mon in enumerate(self.party, start=1):
             did = str(
                 mon.get("species")
@@ -819,7 +731,7 @@ class ItemManagerDialog(tk.Toplevel):
                 or mon.get("pokemonId")
                 or "?"
             )
-            entry = by_dex.get(did) or {}
+            entry = get_pokemon_catalog_entry(did) or {}
             base_name = entry.get("name") or inv.get(did, did)
 
             # Use form-aware display name from the comprehensive form persistence system
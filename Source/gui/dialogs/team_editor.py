@@ -67,26 +67,30 @@ from rogueeditor.utils import (
 )
 from rogueeditor.catalog import (
     load_move_catalog,
+    load_move_search_aliases,
     build_move_label_catalog,
     get_move_label,
     get_move_type_name,
     get_move_entry,
     get_move_base_pp,
     compute_ppup_bounds,
+    load_move_table,
     load_ability_catalog,
     load_nature_catalog,
     nature_multipliers_by_id,
     load_stat_catalog,
-    load_growth_group_map,
     exp_for_level,
     level_from_exp,
-    load_pokemon_catalog,
+    load_pokemon_catalog_view,
     load_type_matchup_matrix,
+    load_type_matchups,
+    TypeMatchups,
     load_type_colors,
     load_types_catalog,
     load_pokeball_catalog,
 )
 from rogueeditor.base_stats import get_base_stats_by_species_id
+from rogueeditor.species_profiles import get_species_profile
 from gui.common.catalog_select import CatalogSelectDialog
 from .item_manager import ItemManagerDialog
 
@@ -119,17 +123,20 @@ class BackgroundCacheManager:
         # Cache expiration time (15 minutes) - longer to reduce recomputation
         self.cache_ttl = 900
 
+    def _is_fresh(self, cache_key: str) -> bool:
+        # Caller holds _cache_lock (a plain Lock, so it must not be re-acquired)
+        stamp = self._cache_timestamps.get(cache_key)
+        return stamp is not None and (time.time() - stamp) < self.cache_ttl
+
     def is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid."""
         with self._cache_lock:
-            if cache_key not in self._cache_timestamps:
-                return False
-            return (time.time() - self._cache_timestamps[cache_key]) < self.cache_ttl
+            return self._is_fresh(cache_key)
 
     def get_cached_data(self, cache_key: str) -> Optional[Any]:
         """Get cached data if available and valid."""
         with self._cache_lock:
-            if cache_key in self._cached_data and self.is_cache_valid(cache_key):
+            if cache_key in self._cached_data and self._is_fresh(cache_key):
                 return self._cached_data[cache_key]
         return None
 
@@ -202,12 +209,10 @@ class BackgroundCacheManager:
                 return {"error": "No party data"}
 
             # Pre-load all catalogs (with caching)
-            from rogueeditor.catalog import load_pokemon_catalog, load_type_colors, load_type_matchup_matrix
-            pokemon_catalog = load_pokemon_catalog() or {}
+            from rogueeditor.catalog import load_pokemon_catalog_view, load_type_colors, load_type_matchups
+            pokemon_catalog = load_pokemon_catalog_view() or {}
             type_colors = load_type_colors() or {}
-            base_matrix = load_type_matchup_matrix() or {}
-            # Use attack_vs orientation for defensive checks: matrix[attacking][defending]
-            type_matrix = base_matrix.get('attack_vs') if isinstance(base_matrix.get('attack_vs'), dict) else base_matrix
+            type_matchups = load_type_matchups()
 
             # Compute type matchups for each party member (optimized with form-aware data)
             party_matchups = []
@@ -217,7 +222,8 @@ class BackgroundCacheManager:
 
                 try:
                     species_id = str(mon.get("species", 0))
-                    catalog_entry = pokemon_catalog.get("by_dex", {}).get(species_id, {})
+                    profile = get_species_profile(species_id)
+                    species_name = profile.name if profile else f"Species#{species_id}"
 
                     # Get form-aware types and name using form persistence
                     from rogueeditor.form_persistence import (
@@ -231,19 +237,22 @@ class BackgroundCacheManager:
 
                     # Get form-aware types
                     form_types = get_pokemon_effective_types(mon, slot_data, username, slot)
-                    types = form_types if form_types else (catalog_entry.get("types", {}) or {})
+                    if not form_types and profile is not None and profile.types[0] != "unknown":
+                        # Same shape and casing as pokemon_catalog.json "types"
+                        form_types = {f"type{n}": t.title() for n, t in enumerate(profile.types, 1) if t}
+                    types = form_types or {}
 
                     # Get form-aware display name
                     form_name = get_pokemon_display_name(mon, slot_data, username, slot)
-                    pokemon_name = form_name if form_name and form_name != "Unknown" else catalog_entry.get("name", f"Species#{species_id}")
+                    pokemon_name = form_name if form_name and form_name != "Unknown" else species_name
 
                     # Compute defensive matchups (optimized)
-                    matchup_data = self._compute_defensive_matchups_optimized(types, type_matrix)
+                    matchup_data = self._compute_defensive_matchups_optimized(types, type_matchups)
                     party_matchups.append({
                         "index": i,
                         "pokemon_id": mon.get("id"),
                         "species_id": species_id,
-                        "species_name": catalog_entry.get("name", f"Species#{species_id}"),
+                        "species_name": species_name,
                         "pokemon_name": pokemon_name,  # Form-aware name
                         "level": mon.get("level", "?"),
                         "types": types,  # Form-aware types
@@ -267,7 +276,7 @@ class BackgroundCacheManager:
 
             # Compute team-wide analysis (manager-local implementations)
             team_defensive_analysis = self._compute_team_defensive_analysis_from_party_matchups(party_matchups)
-            team_offensive_analysis = self._compute_team_offensive_analysis_from_party(party, pokemon_catalog, type_matrix)
+            team_offensive_analysis = self._compute_team_offensive_analysis_from_party(party, pokemon_catalog, type_matchups.attack_vs)
 
             result = {
                 "party_matchups": party_matchups,
@@ -293,28 +302,23 @@ class BackgroundCacheManager:
     def _compute_defensive_matchups(self, types: Dict[str, Any]) -> Dict[str, List[str]]:
         """Compute defensive type matchups."""
         try:
-            matrix = load_type_matchup_matrix()
-            return self._compute_defensive_matchups_optimized(types, matrix)
+            return self._compute_defensive_matchups_optimized(types, load_type_matchups())
         except Exception as e:
             print(f"Error computing defensive matchups: {e}")
             return {"x4": [], "x2": [], "x1": [], "x0.5": [], "x0.25": [], "x0": []}
 
-    def _compute_defensive_matchups_optimized(self, types: Dict[str, Any], matrix: Dict) -> Dict[str, List[str]]:
-        """Optimized defensive type matchups computation."""
+    def _compute_defensive_matchups_optimized(self, types: Dict[str, Any], matchups_table: TypeMatchups) -> Dict[str, List[str]]:
+        """Optimized defensive type matchups computation (dense table lookups, no disk access)."""
         type1 = (types.get("type1") or "").lower()
         type2 = (types.get("type2") or "").lower()
 
         # Calculate effectiveness for all attacking types
         matchups = {"x4": [], "x2": [], "x1": [], "x0.5": [], "x0.25": [], "x0": []}
 
-        for attacking_type in matrix.keys():
+        for attacking_type, total_eff in matchups_table.defensive_profile(type1, type2).items():
             if attacking_type in ["unknown", ""]:
                 continue
 
-            eff1 = matrix.get(attacking_type, {}).get(type1, 1.0) if type1 else 1.0
-            eff2 = matrix.get(attacking_type, {}).get(type2, 1.0) if type2 else 1.0
-            total_eff = eff1 * eff2
-
             if total_eff == 0:
                 matchups["x0"].append(attacking_type)
             elif total_eff == 0.25:
@@ -450,8 +454,8 @@ class BackgroundCacheManager:
 
                 try:
                     species_id = str(mon.get("species", 0))
-                    catalog_entry = pokemon_catalog.get("by_dex", {}).get(species_id, {})
-                    base_name = catalog_entry.get("name", f"Species#{species_id}")
+                    profile = get_species_profile(species_id)
+                    base_name = profile.name if profile else f"Species#{species_id}"
 
                     # Get form-aware name using form persistence (requires slot data context)
                     try:
@@ -713,7 +717,7 @@ class BackgroundCacheManager:
 
             # Load move catalog for proper move type and category analysis
             from rogueeditor.catalog import load_moves_data
-            moves_catalog = load_moves_data() or {}
+            moves_catalog = (load_moves_data() or {}).get("by_id") or {}
 
             # Process each team member
             for member_data in party:
@@ -722,10 +726,10 @@ class BackgroundCacheManager:
 
                 # Use form-aware Pokemon data and name
                 species_id = str(member_data.get("species", 0))
-                catalog_entry = pokemon_catalog.get("by_dex", {}).get(species_id, {})
+                profile = get_species_profile(species_id)
 
                 # Use base species name here to avoid requiring username/slot context in analysis
-                pokemon_name = catalog_entry.get("name", f"Species#{species_id}")
+                pokemon_name = profile.name if profile else f"Species#{species_id}"
 
                 level = member_data.get("level", "?")
                 moves = member_data.get("moveset", [])
@@ -742,9 +746,9 @@ class BackgroundCacheManager:
 
                     # Look up move in catalog to get type and category
                     move_info = moves_catalog.get(str(move_id), {})
-                    move_name = move_info.get("name", f"Move#{move_id}")
-                    move_type = move_info.get("type", "normal")
-                    move_category = move_info.get("category", "physical")
+                    move_name = move_info.get("ui_label") or f"Move#{move_id}"
+                    move_type = move_info.get("type_name") or "normal"
+                    move_category = move_info.get("move_category") or "physical"
 
                     # Only include damaging moves (physical/special, not status)
                     if move_category.lower() in ["physical", "special"]:
@@ -1097,9 +1101,9 @@ class TeamManagerDialog(tk.Toplevel):
         # Load Pokemon catalog synchronously (needed for _refresh_party)
         try:
             print(f"[TRACE] Importing catalog module...")
-            from rogueeditor.catalog import load_pokemon_catalog
-            print(f"[TRACE] Import successful, calling load_pokemon_catalog()")
-            self._pokemon_catalog_cache = load_pokemon_catalog() or {}
+            from rogueeditor.catalog import load_pokemon_catalog_view
+            print(f"[TRACE] Import successful, calling load_pokemon_catalog_view()")
+            self._pokemon_catalog_cache = load_pokemon_catalog_view() or {}
             print(f"[TRACE] Pokemon catalog loaded successfully")
         except Exception as e:
             print(f"[TRACE] Exception loading pokemon catalog: {e}")
@@ -4459,24 +4463,12 @@ class TeamManagerDialog(tk.Toplevel):
             species_id = _get_species_id(mon)
             base_raw = None
             try:
-                cat = self._get_cached_pokemon_catalog() or {}
-                by_dex = cat.get("by_dex") or {}
-                entry = by_dex.get(str(species_id or -1)) or {}
-                st = entry.get("stats")
-                if isinstance(st, dict):
-                    base_raw = [
-                        int(st.get("hp") or 0),
-                        int(st.get("attack") or 0),
-                        int(st.get("defense") or 0),
-                        int(st.get("sp_atk") or 0),
-                        int(st.get("sp_def") or 0),
-                        int(st.get("speed") or 0),
-                    ]
+                profile = get_species_profile(species_id or -1)
+                base_raw = list(profile.base_stats) if profile and profile.base_stats else None
             except Exception:
                 base_raw = None
             if base_raw is None:
-                from rogueeditor.base_stats import get_base_stats_by_species_id
-                base_raw = get_base_stats_by_species_id(species_id or -1) or [0,0,0,0,0,0]
+                base_raw = [0, 0, 0, 0, 0, 0]
             # IVs
             ivs = mon.get("ivs") if isinstance(mon.get("ivs"), list) and len(mon.get("ivs")) == 6 else [0,0,0,0,0,0]
             # Booster multipliers
@@ -5464,7 +5456,6 @@ class TeamManagerDialog(tk.Toplevel):
                 OffensiveCoverageCalculator, get_coverage_for_team,
                 find_type_combo_walls, load_type_matrix_v2
             )
-            from rogueeditor.catalog import load_pokemon_catalog
 
             calculator = OffensiveCoverageCalculator()
             cat = self._get_cached_pokemon_catalog() or {}
@@ -6430,12 +6421,12 @@ class TeamManagerDialog(tk.Toplevel):
 
                 # Use form-aware Pokemon data and name
                 species_id = str(member_data.get("species", 0))
-                catalog_entry = pokemon_catalog.get("by_dex", {}).get(species_id, {})
+                profile = get_species_profile(species_id)
 
                 # Get form-aware display name
                 from rogueeditor.form_persistence import get_pokemon_display_name
                 form_name = get_pokemon_display_name(member_data, {"party": party}, None, None)
-                pokemon_name = form_name if form_name and form_name != "Unknown" else catalog_entry.get("name", f"Species#{species_id}")
+                pokemon_name = form_name if form_name and form_name != "Unknown" else (profile.name if profile else f"Species#{species_id}")
 
                 level = member_data.get("level", "?")
                 moves = member_data.get("moveset", [])
@@ -7468,23 +7459,13 @@ class TeamManagerDialog(tk.Toplevel):
     def _compute_pokemon_display_data(self, mon: dict, species_id: int) -> dict:
         """Compute Pokemon display data once and cache it."""
         try:
-            # Get Pokemon catalog data
-            cat = self._get_cached_pokemon_catalog() or {}
-            by_dex = cat.get("by_dex") or {}
-            entry = by_dex.get(str(species_id)) or {}
-
-            # Species name with form
-            name = str(entry.get("name") or f"#{species_id}")
+            # Species name with form, and base types, from the shared species profile
+            profile = get_species_profile(species_id)
             fslug = self._detect_form_slug(mon)
-            if fslug and (entry.get("forms") or {}).get(fslug):
-                fdn = (entry.get("forms") or {}).get(fslug, {}).get("display_name")
-                if isinstance(fdn, str) and fdn.strip():
-                    name = f"{name} ({fdn})"
-
-            # Get types safely
-            types = entry.get("types") or {}
-            type1 = str(types.get("type1") or "").lower()
-            type2 = str(types.get("type2") or "").lower() if types.get("type2") else ""
+            name = profile.display_name(fslug) if profile else f"#{species_id}"
+            type1, type2 = profile.types if profile else ("", None)
+            type1 = "" if type1 == "unknown" else type1
+            type2 = type2 or ""
 
             # Get cached type colors (ensure they're loaded)
             if not hasattr(self, '_type_colors_cache'):
@@ -7548,7 +7529,7 @@ class TeamManagerDialog(tk.Toplevel):
                 if hasattr(self, 'var_level'):
                     lvl = None
                     try:
-                        from rogueeditor.growth import level_from_exp
+                        from rogueeditor.catalog import level_from_exp
                         e = int(self.var_exp.get() or '0')
                         lvl = level_from_exp(gidx, e)
                     except Exception:
@@ -7803,7 +7784,8 @@ class TeamManagerDialog(tk.Toplevel):
             self.var_nature.set(f"{self._nature_label_for_id(int(res))} ({res})")
 
     def _pick_move(self, idx: int):
-        res = CatalogSelectDialog.select(self, self.move_n2i, title=f"Select Move {idx+1}")
+        res = CatalogSelectDialog.select(self, self.move_n2i, title=f"Select Move {idx+1}",
+                                         extra_ids=load_move_search_aliases())
         if res is not None:
             try:
                 rid = int(res)
@@ -9341,13 +9323,9 @@ class TeamManagerDialog(tk.Toplevel):
     def _growth_index_for_mon(self, mon: dict) -> int:
         # Resolve growth index using species id and CSV mapping; default to MEDIUM_FAST if unknown
         try:
-            did = _get_species_id(mon) or -1
-            gmap = getattr(self, '_growth_map_cache', None)
-            if not isinstance(gmap, dict):
-                gmap = load_growth_group_map()
-                self._growth_map_cache = gmap
-            if isinstance(did, int) and did in gmap:
-                return int(gmap[did])
+            profile = get_species_profile(_get_species_id(mon) or -1)
+            if profile is not None and profile.growth_index is not None:
+                return profile.growth_index
         except Exception:
             pass
         # default: MEDIUM_FAST
@@ -9478,9 +9456,13 @@ class TeamManagerDialog(tk.Toplevel):
             lst = []
         # Build new list preserving shapes and any extra dict fields
         out: List[Any] = list(lst)  # copy
+        mids = [int(self._parse_id_from_combo(self.move_vars[i].get(), self.move_n2i) or 0) for i in range(4)]
+        # PP columns for the whole moveset in one pass over the move table
+        move_table = load_move_table()
+        base_pps = move_table.base_pps(mids)
+        pp_bounds = move_table.ppup_bounds_for(mids)
         for i in range(4):
-            mid = self._parse_id_from_combo(self.move_vars[i].get(), self.move_n2i)
-            mid_i = int(mid or 0)
+            mid_i = mids[i]
             shape = shapes[i] if i < len(shapes) else "int"
             if i < len(out):
                 cur = out[i]
@@ -9506,8 +9488,8 @@ class TeamManagerDialog(tk.Toplevel):
                     out.append(mid_i)
             # Clamp and apply PP fields if dict shape
             try:
-                base_pp = get_move_base_pp(mid_i)
-                max_extra, max_total = compute_ppup_bounds(base_pp)
+                base_pp = base_pps[i]
+                max_extra, max_total = pp_bounds[i]
                 # Parse user inputs
                 try:
                     pp_up_in = int((self.move_ppup_vars[i].get() or '').strip() or '0')
@@ -9592,19 +9574,9 @@ class TeamManagerDialog(tk.Toplevel):
         # Fallback to pokemon_catalog.json if no alternative form stats
         if base_raw is None:
             try:
-                cat = self._get_cached_pokemon_catalog() or {}
-                by_dex = cat.get("by_dex") or {}
-                entry = by_dex.get(str(species_id or -1)) or {}
-                st = entry.get("stats")
-                if isinstance(st, dict):
-                    base_raw = [
-                        int(st.get("hp") or 0),
-                        int(st.get("attack") or 0),
-                        int(st.get("defense") or 0),
-                        int(st.get("sp_atk") or 0),
-                        int(st.get("sp_def") or 0),
-                        int(st.get("speed") or 0),
-                    ]
+                profile = get_species_profile(species_id or -1)
+                if profile is not None and profile.base_stats_source == "catalog (by dex)":
+                    base_raw = list(profile.base_stats)
                     stats_source = "pokemon_catalog"
             except Exception:
                 base_raw = None
@@ -9821,40 +9793,13 @@ class TeamManagerDialog(tk.Toplevel):
         if species_id in self._base_stats_cache:
             return self._base_stats_cache[species_id]
 
-        # Try catalog first (fastest)
-        try:
-            cat = self._get_cached_pokemon_catalog() or {}
-            by_dex = cat.get("by_dex") or {}
-            entry = by_dex.get(str(species_id)) or {}
-            st = entry.get("stats")
-            if isinstance(st, dict):
-                base_stats = [
-                    int(st.get("hp") or 0),
-                    int(st.get("attack") or 0),
-                    int(st.get("defense") or 0),
-                    int(st.get("sp_atk") or 0),
-                    int(st.get("sp_def") or 0),
-                    int(st.get("speed") or 0),
-                ]
-                self._base_stats_cache[species_id] = base_stats
-                try:
-                    self._base_stats_cache_from[species_id] = "catalog (by dex)"
-                except Exception:
-                    pass
-                return base_stats
-        except Exception:
-            pass
-
-        # Fallback methods (cached)
+        # Species profile: catalog stats, falling back to base_stats.json (shared, built once per species)
         try:
-            from rogueeditor.base_stats import get_base_stats_by_species_id
-            base_stats = get_base_stats_by_species_id(species_id)
-            if base_stats:
+            profile = get_species_profile(species_id)
+            if profile is not None and profile.base_stats:
+                base_stats = list(profile.base_stats)
                 self._base_stats_cache[species_id] = base_stats
-                try:
-                    self._base_stats_cache_from[species_id] = "fallback"
-                except Exception:
-                    pass
+                self._base_stats_cache_from[species_id] = profile.base_stats_source or "fallback"
                 return base_stats
         except Exception:
             pass
@@ -10639,6 +10584,13 @@ class TeamManagerDialog(tk.Toplevel):
                 except Exception:
                     pass
                 payload = self.data
+                diff = self.api.diff_slot(self.slot, payload, refresh=True)
+                if diff is not None and not diff.has_changes:
+                    # Server already holds exactly this data; nothing to send
+                    self._dirty_server = False
+                    self._update_button_states()
+                    messagebox.showinfo("Up to date", f"Slot {self.slot} already matches the server; nothing uploaded.")
+                    return
                 self.api.update_slot(self.slot, payload)
                 # Refresh snapshot and clear server dirty flag; disable upload until next change
                 try:
@@ -11100,8 +11052,8 @@ class TeamManagerDialog(tk.Toplevel):
                 debug_log("Defensive chunk 1: Computing matchups")
                 try:
                     # Compute party matchups first (needed for defensive analysis)
-                    from rogueeditor.catalog import load_pokemon_catalog, load_type_matrix_v2
-                    cat = self._get_cached_pokemon_catalog() or load_pokemon_catalog()
+                    from rogueeditor.catalog import load_pokemon_catalog_view, load_type_matrix_v2
+                    cat = self._get_cached_pokemon_catalog() or load_pokemon_catalog_view()
                     type_matrix = load_type_matrix_v2()
 
                     # Basic matchup calculation
@@ -12276,7 +12228,7 @@ class TeamManagerDialog(tk.Toplevel):
     def _get_cached_pokemon_catalog(self):
         """Get cached Pokemon catalog."""
         if self._pokemon_catalog_cache is None:
-            self._pokemon_catalog_cache = load_pokemon_catalog() or {}
+            self._pokemon_catalog_cache = load_pokemon_catalog_view() or {}
         return self._pokemon_catalog_cache
 
     def _get_cached_species_types(self, species_id: int, form_slug: str = None) -> tuple:
@@ -12299,20 +12251,9 @@ class TeamManagerDialog(tk.Toplevel):
                     except Exception as e:
                         debug_log(f"Error getting alternative form types: {e}")
 
-                # Fallback to existing pokemon_catalog.json logic
-                cat = self._get_cached_pokemon_catalog()
-                by_dex = cat.get("by_dex") or {}
-                entry = by_dex.get(str(species_id)) or {}
-
-                if form_slug and (entry.get("forms") or {}).get(form_slug):
-                    tp = (entry.get("forms") or {}).get(form_slug, {}).get("types") or {}
-                else:
-                    tp = entry.get("types") or {}
-
-                t1 = str(tp.get("type1") or "unknown").strip().lower()
-                t2 = str(tp.get("type2") or "").strip().lower() if tp.get("type2") else None
-
-                self._species_types_cache[cache_key] = (t1, t2)
+                # Fallback to the species profile (pokemon_catalog.json types, form-aware)
+                profile = get_species_profile(species_id)
+                self._species_types_cache[cache_key] = profile.types_for(form_slug) if profile else ("unknown", None)
             except Exception:
                 self._species_types_cache[cache_key] = ("unknown", None)
 
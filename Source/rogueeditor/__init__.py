@@ -6,5 +6,6 @@ This package enables incremental migration away from the monolithic
 """
 
 from .api import PokerogueAPI  # re-export for convenience
+from .async_api import AsyncPokerogueAPI  # asyncio transport (requires optional aiohttp)
 from .session_manager import SessionManager, SessionObserver, SessionState  # session management
 
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import gzip
 import json
+import threading
 import time
-from typing import Any, Dict, Optional
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 import requests
 
 from .config import (
@@ -14,24 +20,533 @@ from .config import (
     SLOT_FETCH_PATHS,
     SLOT_UPDATE_PATHS,
     CLIENT_SESSION_ID,
+    UPLOAD_ENCODING,
 )
+from .api_metrics import ApiMetrics, RequestEvent, endpoint_of, get_api_metrics
+from .http_pool import get_session_registry
+from .rate_limit import RateLimiter, get_rate_limiter
+from .response_cache import ResponseCache, RevalidationMiss
+from .save_diff import SaveDiff, ServerStateTracker
+from .endpoint_cache import EndpointCache, SLOT_FETCH, SLOT_UPDATE, get_endpoint_cache
 from .token import to_urlsafe_b64, to_standard_b64
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:  # optional fast JSON encoder; stdlib json is used when absent
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
-class PokerogueAPI:
+ALL_SLOTS = (1, 2, 3, 4, 5)
+UPLOAD_ENCODINGS = ("gzip", "deflate")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if item != item or item in (float("inf"), float("-inf")):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _encode_json_stdlib(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def encode_json_compact(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (no whitespace), using orjson when installed.
+
+    Both paths accept and reject the same inputs: values orjson cannot encode
+    (e.g. ints wider than 64 bits) go through the stdlib encoder, and NaN or
+    infinity raise ValueError instead of being written as ``null``.
+    """
+    if _orjson is None:
+        return _encode_json_stdlib(obj)
+    try:
+        out = _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    except TypeError:  # orjson.JSONEncodeError
+        return _encode_json_stdlib(obj)
+    # orjson writes non-finite floats as null; only documents containing null need the check
+    if b"null" in out and _has_non_finite(obj):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return out
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single GET issued as part of a batched fetch."""
+    key: str
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkFetchResult:
+    """Trainer/system data plus per-slot results from `PokerogueAPI.fetch_all`."""
+    trainer: Optional[FetchResult] = None
+    slots: Dict[int, FetchResult] = field(default_factory=dict)
+
+
+@dataclass
+class TransferStats:
+    """Byte counts for one HTTP call, as seen by the client."""
+    method: str
+    url: str
+    status: int = 0
+    bytes_out: int = 0
+    bytes_out_wire: int = 0
+    bytes_in: int = 0
+    bytes_in_wire: int = 0
+    request_encoding: Optional[str] = None
+    response_encoding: Optional[str] = None
+
+    @property
+    def upload_savings(self) -> int:
+        """Bytes saved on the request body by compression."""
+        return self.bytes_out - self.bytes_out_wire
+
+
+class _PokerogueClientBase:
+    """Transport-independent pieces shared by the sync and async Pokerogue clients.
+
+    Holds header construction, retry/backoff rules, status/JSON handling and the
+    slot endpoint candidate lists so both transports behave identically.
+    """
+
+    token: Optional[str] = None
+    client_session_id: Optional[str] = None
+    backoff_factor: float = 0.5
+    # Seconds after a successful savedata call during which the server-side
+    # session is assumed active, so uploads skip the pre-write "touch" GET
+    session_active_window: float = 60.0
+    _session_confirmed_at: float = 0.0
+    # Learned working/dead slot endpoints; None uses the shared on-disk cache
+    endpoint_cache: Optional[EndpointCache] = None
+    # Optional SessionManager consulted before uploads (see set_session_manager)
+    _session_manager: Any = None
+    _validate_session_before_upload: bool = True
+    # Per-client GET cache for slot/system payloads (created in __init__)
+    response_cache: ResponseCache
+    # Section digests of the last slot/system state seen on the server (created in __init__)
+    server_state: ServerStateTracker
+    # Request instrumentation; None uses the process-wide collector
+    metrics: Optional[ApiMetrics] = None
+    # Per-host adaptive limiter; None uses the process-wide one shared across threads
+    rate_limiter: Optional[RateLimiter] = None
+    # Opt-in request body compression ("gzip"/"deflate") and the size below which it is skipped
+    upload_encoding: Optional[str] = None
+    compress_min_bytes: int = 1024
+
+    # Substrings in server rejections that mean "session not active", as opposed
+    # to auth failures; such writes are retried once after a touch GET
+    _INACTIVE_SESSION_MARKERS = ("session out of date", "session not active", "inactive session", "not active")
+
+    def _handle_auth_error(self, error: Exception, operation: str) -> None:
+        """
+        Handle authentication errors with enhanced messaging.
+
+        Args:
+            error: The original exception
+            operation: Description of the operation that failed
+        """
+        error_msg = str(error).lower()
+
+        if "401" in error_msg or "unauthorized" in error_msg:
+            if "illegal base64" in error_msg:
+                raise RuntimeError(
+                    f"{operation} failed: Session token is corrupted or malformed. "
+                    f"This often indicates session expiration. Please try refreshing your session."
+                ) from error
+            else:
+                raise RuntimeError(
+                    f"{operation} failed: Authentication expired or invalid. "
+                    f"Please refresh your session and try again."
+                ) from error
+        elif "403" in error_msg or "forbidden" in error_msg:
+            raise RuntimeError(
+                f"{operation} failed: Access denied. Please check your permissions."
+            ) from error
+        else:
+            # Re-raise with enhanced context
+            raise RuntimeError(f"{operation} failed: {error}") from error
+
+    # --- Session activity tracking ---
+    def _mark_session_active(self) -> None:
+        self._session_confirmed_at = time.monotonic()
+
+    def _reset_session_activity(self) -> None:
+        self._session_confirmed_at = 0.0
+
+    def _session_recently_active(self) -> bool:
+        if not self._session_confirmed_at or self.session_active_window <= 0:
+            return False
+        return (time.monotonic() - self._session_confirmed_at) < self.session_active_window
+
+    @classmethod
+    def _is_inactive_session_error(cls, error: Exception) -> bool:
+        msg = str(error).lower()
+        return any(marker in msg for marker in cls._INACTIVE_SESSION_MARKERS)
+
+    # --- Session validation ---
+    def set_session_manager(self, session_manager) -> None:
+        """Set the session manager for automatic session validation."""
+        self._session_manager = session_manager
+
+    def _ensure_valid_session(self) -> bool:
+        """
+        Ensure session is valid before critical operations.
+
+        Returns:
+            True if session is valid, False otherwise
+        """
+        if not self._validate_session_before_upload:
+            return True
+
+        if not self.token:
+            logger.warning("No authentication token available")
+            return False
+
+        # Use session manager if available
+        if self._session_manager:
+            try:
+                return self._session_manager.ensure_valid_session()
+            except Exception as e:
+                logger.error(f"Session manager validation failed: {e}")
+                return False
+
+        # Fallback: basic token presence check
+        return bool(self.token)
+
+    # --- Slot endpoint candidates ---
+    def _endpoints(self) -> EndpointCache:
+        return self.endpoint_cache or get_endpoint_cache()
+
+    def _expand_candidates(self, zero: int, templates: list[str]) -> list[tuple[str, str]]:
+        csid = self.client_session_id
+        candidates: list[tuple[str, str]] = []
+        seen: set[str] = set()
+        for tmpl in templates:
+            if "{csid}" in tmpl and not csid:
+                continue
+            path = tmpl.format(i=zero, csid=csid)
+            url = path if path.startswith("http") else f"{BASE_URL}{path}"
+            if url not in seen:
+                seen.add(url)
+                candidates.append((tmpl, url))
+        return candidates
+
+    def _slot_fetch_candidates(self, zero: int) -> list[tuple[str, str]]:
+        """(template, url) pairs for slot GET, ordered by the endpoint cache (canonical first by default)."""
+        # Canonical (browser) endpoint, then configured candidates as a defensive fallback
+        templates = ["/savedata/session/get?slot={i}&clientSessionId={csid}", *SLOT_FETCH_PATHS]
+        return self._endpoints().order(BASE_URL, SLOT_FETCH, self._expand_candidates(zero, templates))
+
+    def _slot_update_candidates(self, zero: int) -> list[tuple[str, str]]:
+        """(template, url) pairs for slot POST, ordered by the endpoint cache (canonical first by default)."""
+        templates = [
+            # Primary canonical endpoint
+            "/savedata/session/update?slot={i}&clientSessionId={csid}",
+            # Alternative 'set' endpoint sometimes used in deployments
+            "/savedata/session/set?slot={i}&clientSessionId={csid}",
+            # Config-driven fallbacks
+            *SLOT_UPDATE_PATHS,
+        ]
+        return self._endpoints().order(BASE_URL, SLOT_UPDATE, self._expand_candidates(zero, templates))
+
+    def _record_endpoint_success(self, kind: str, template: str, failed: list[tuple[str, Exception]],
+                                 persist: bool = True) -> None:
+        """Remember the working template and mark earlier 404/405 candidates dead.
+
+        Failures are only recorded once another candidate succeeded in the same call,
+        so a 404 caused by the slot itself (not the endpoint) never poisons the cache.
+        With `persist=False` the change is only kept in memory until `EndpointCache.flush()`.
+        """
+        cache = self._endpoints()
+        for dead_tmpl, err in failed:
+            if cache.is_missing_endpoint_error(err):
+                cache.record_dead(BASE_URL, kind, dead_tmpl, persist=persist)
+        cache.record_success(BASE_URL, kind, template, persist=persist)
+
+    def _is_slot_non_empty(self, slot_data: Dict[str, Any]) -> bool:
+        """
+        Check if slot data indicates a non-empty/active slot.
+
+        A slot is considered non-empty if it has:
+        - A party with Pokemon, or
+        - Playtime > 0, or
+        - Other indicators of an active save
+        """
+        if not slot_data:
+            return False
+
+        # Check for party with Pokemon
+        party = slot_data.get('party', [])
+        if party and len(party) > 0:
+            return True
+
+        # Check for playtime
+        play_time = slot_data.get('playTime', 0)
+        if play_time and play_time > 0:
+            return True
+
+        # Check for other indicators of active save
+        # These are common fields that indicate progress
+        indicators = ['arena', 'gameMode', 'modifiers', 'enemyModifiers', 'challenges']
+        for key in indicators:
+            value = slot_data.get(key)
+            if value:  # Non-empty, non-zero, non-None
+                return True
+
+        return False
+
+    # --- Request bodies and transfer accounting ---
+    def _init_transfer_stats(self, history: int = 200) -> None:
+        self.transfers: deque[TransferStats] = deque(maxlen=history)
+        self._transfer_lock = threading.Lock()
+        self._transfer_totals: Dict[str, int] = {"requests": 0, "bytes_out": 0, "bytes_out_wire": 0, "bytes_in": 0, "bytes_in_wire": 0}
+
+    def _encode_json_body(self, obj: Any, compress: bool = True) -> tuple[bytes, Dict[str, str], int]:
+        """Serialize a JSON body compactly and optionally compress it.
+
+        Returns (wire_bytes, extra_headers, uncompressed_size).
+        """
+        raw = encode_json_compact(obj)
+        headers = {"content-type": "application/json"}
+        encoding = self.upload_encoding if compress else None
+        if encoding in UPLOAD_ENCODINGS and len(raw) >= self.compress_min_bytes:
+            body = gzip.compress(raw, compresslevel=6) if encoding == "gzip" else zlib.compress(raw, 6)
+            headers["content-encoding"] = encoding
+            return body, headers, len(raw)
+        return raw, headers, len(raw)
+
+    def _record_transfer(self, stats: TransferStats) -> None:
+        with self._transfer_lock:
+            self.transfers.append(stats)
+            totals = self._transfer_totals
+            totals["requests"] += 1
+            totals["bytes_out"] += stats.bytes_out
+            totals["bytes_out_wire"] += stats.bytes_out_wire
+            totals["bytes_in"] += stats.bytes_in
+            totals["bytes_in_wire"] += stats.bytes_in_wire
+
+    @property
+    def last_transfer(self) -> Optional[TransferStats]:
+        with self._transfer_lock:
+            return self.transfers[-1] if self.transfers else None
+
+    def transfer_totals(self) -> Dict[str, int]:
+        """Cumulative request count and bytes in/out (logical and on the wire) for this client."""
+        with self._transfer_lock:
+            return dict(self._transfer_totals)
+
+    @staticmethod
+    def _body_size(body: Any) -> int:
+        if body is None:
+            return 0
+        if isinstance(body, (bytes, bytearray)):
+            return len(body)
+        if isinstance(body, str):
+            return len(body.encode("utf-8"))
+        if isinstance(body, dict):
+            from urllib.parse import urlencode
+            return len(urlencode(body))
+        return 0
+
+    # --- Response cache ---
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        return {**self._auth_headers(), **self.response_cache.validators(url)}
+
+    def _decode_cacheable(self, url: str, tag: str, resp: Any, generation: Tuple[int, int]) -> Dict[str, Any]:
+        cached = self.response_cache.resolve(url, tag, resp, generation)
+        return cached if cached is not None else self._json(resp)
+
+    def _get_cacheable(self, url: str, tag: str) -> Dict[str, Any]:
+        """Conditional GET through the response cache, retried once unconditionally on a stray 304.
+
+        The cache generation is captured before each request, so a body that was
+        in flight while an upload invalidated `tag` is returned but not cached.
+        """
+        generation = self.response_cache.generation(tag)
+        resp = self._request("get", url, headers=self._conditional_headers(url))
+        try:
+            return self._decode_cacheable(url, tag, resp, generation)
+        except RevalidationMiss:
+            generation = self.response_cache.generation(tag)
+            resp = self._request("get", url, headers=self._auth_headers())
+            return self._decode_cacheable(url, tag, resp, generation)
+
+    def invalidate_cache(self, slot: Optional[int] = None, system: bool = False) -> None:
+        """Drop cached payloads: one slot, the system data, or everything when called without arguments."""
+        if slot is None and not system:
+            self.response_cache.invalidate()
+            return
+        if slot is not None:
+            self.response_cache.invalidate(f"slot:{max(0, int(slot) - 1)}")
+        if system:
+            self.response_cache.invalidate("system")
+
+    # --- Change tracking ---
+    def diff_slot(self, slot: int, save_data: Dict[str, Any], refresh: bool = False) -> Optional[SaveDiff]:
+        """Sections of `save_data` that differ from the slot as last fetched/uploaded (None if never seen).
+
+        The baseline may predate changes made on the server since (another client, the
+        game itself). Pass `refresh=True` to revalidate it with the server first; a
+        failed refresh returns None so callers upload rather than skip.
+        """
+        key = f"slot:{int(slot)}"
+        if refresh:
+            try:
+                self.get_slot(slot, use_cache=False)
+            except Exception as e:
+                logger.debug(f"Could not refresh slot {slot} before diffing: {e}")
+                self.server_state.forget(key)
+                return None
+        return self.server_state.diff(key, save_data)
+
+    def diff_system(self, system_data: Dict[str, Any], refresh: bool = False) -> Optional[SaveDiff]:
+        """Sections of `system_data` that differ from the system data as last fetched/uploaded (None if never seen).
+
+        See `diff_slot` for `refresh`.
+        """
+        if refresh:
+            try:
+                self.get_system(use_cache=False)
+            except Exception as e:
+                logger.debug(f"Could not refresh system data before diffing: {e}")
+                self.server_state.forget("system")
+                return None
+        return self.server_state.diff("system", system_data)
+
+    # --- Instrumentation ---
+    def _metrics(self) -> ApiMetrics:
+        return self.metrics or get_api_metrics()
+
+    def _new_event(self, method: str, url: str) -> RequestEvent:
+        return RequestEvent(method.upper(), url, endpoint_of(method, url))
+
+    def _finish_event(self, event: RequestEvent, started: float, error: Optional[Exception] = None) -> None:
+        event.elapsed = time.monotonic() - started
+        event.finished_at = time.time()
+        if error is not None:
+            event.error = str(error)[:300]
+        self._metrics().record(event)
+
+    def _record_fallback_path(self, kind: str, failed: list[tuple[str, Exception]], winner: Optional[str]) -> None:
+        attempted = [tmpl for tmpl, _ in failed] + ([winner] if winner else [])
+        self._metrics().record_fallback(kind, attempted, winner)
+
+    # --- Rate limiting ---
+    def _limiter(self) -> RateLimiter:
+        return self.rate_limiter or get_rate_limiter()
+
+    def _throttle_delay(self, url: str, resp: Any, delay: float) -> float:
+        """Feed a retryable response to the limiter and return how long the caller should still sleep.
+
+        For 429s the limiter pauses the host's bucket for `delay`, so the next
+        reservation does the waiting (and paces other threads too).
+        """
+        limiter = self._limiter()
+        if resp.status_code == 429 and limiter.enabled:
+            limiter.observe(url, 429, delay)
+            return 0.0
+        return delay
+
+    # --- Retry/backoff rules ---
+    @staticmethod
+    def _is_retryable_status(status_code: int) -> bool:
+        # Retry on 429 or 5xx
+        return status_code == 429 or 500 <= status_code < 600
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_factor * (2 ** attempt)
+
+    @staticmethod
+    def _retry_after_delay(resp: requests.Response) -> Optional[float]:
+        ra = resp.headers.get("Retry-After")
+        if not ra:
+            return None
+        try:
+            return float(ra)
+        except Exception:
+            return None
+
+    # --- Helpers ---
+    def _auth_headers(self, json_content: bool = False) -> Dict[str, str]:
+        if not self.token:
+            raise RuntimeError("Not authenticated. Call login() first.")
+        # Prefer standard Base64; some servers reject URL-safe in Authorization
+        token = to_standard_b64(self.token)
+        headers = {
+            **DEFAULT_HEADERS,
+            # Server expects raw token without 'Bearer ' prefix
+            "authorization": token,
+        }
+        if json_content:
+            headers["content-type"] = "application/json"
+        return headers
+
+    def _auth_headers_raw(self, json_content: bool = False) -> Dict[str, str]:
+        if not self.token:
+            raise RuntimeError("Not authenticated. Call login() first.")
+        headers = {
+            **DEFAULT_HEADERS,
+            "authorization": self.token,
+        }
+        if json_content:
+            headers["content-type"] = "application/json"
+        return headers
+
+    @staticmethod
+    def _raise_for_status(resp: requests.Response) -> None:
+        if resp.status_code == 404:
+            raise RuntimeError("Endpoint not found (404)")
+        if resp.status_code == 401:
+            body = (resp.text or "").strip()
+            snippet = body[:200] + ("..." if len(body) > 200 else "")
+            raise RuntimeError(f"Unauthorized (401): {snippet}")
+        if resp.status_code == 403:
+            raise RuntimeError("Forbidden (403)")
+        if 400 <= resp.status_code < 600:
+            raise RuntimeError(f"HTTP {resp.status_code}: {resp.text}")
+
+    @staticmethod
+    def _json(resp: requests.Response) -> Dict[str, Any]:
+        try:
+            return resp.json()
+        except json.JSONDecodeError:
+            raise RuntimeError(
+                f"Invalid JSON response. Content-Type: {resp.headers.get('content-type')}"
+            )
+
+
+class PokerogueAPI(_PokerogueClientBase):
     """Thin HTTP client for Pokerogue endpoints.
 
     Handles authentication and authenticated GET/POST calls for trainer and slot data.
     """
 
-    def __init__(self, username: str, password: str, timeout: int = 15, max_retries: int = 3, backoff_factor: float = 0.5):
+    def __init__(self, username: str, password: str, timeout: int = 15, max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_parallel: int = 6, session_active_window: float = 60.0, upload_encoding: Optional[str] = UPLOAD_ENCODING):
         self.username = username
         self.password = password
         self.timeout = timeout
-        self.session = requests.Session()
+        # Upper bound on concurrent GETs issued by get_slots/fetch_all
+        self.max_parallel = max(1, int(max_parallel))
+        # Pooled keep-alive session shared by every client for this account
+        self.session = get_session_registry().acquire(username, min_pool_size=self.max_parallel)
+        self._session_released = False
         self.session.headers.update(DEFAULT_HEADERS)
         self.token: Optional[str] = None
         self.max_retries = max_retries
@@ -41,6 +556,22 @@ class PokerogueAPI:
         # Session validation tracking
         self._session_manager = None
         self._validate_session_before_upload = True
+        # Skip the pre-upload touch GET when the session was confirmed this recently (0 disables)
+        self.session_active_window = session_active_window
+        self._session_confirmed_at = 0.0
+        # Opt-in gzip/deflate upload bodies; per-call byte counts in self.transfers
+        self.upload_encoding = upload_encoding
+        self._init_transfer_stats()
+        # Short-lived slot/system GET cache, invalidated on update_*
+        self.response_cache = ResponseCache()
+        self.server_state = ServerStateTracker()
+
+    def close(self) -> None:
+        """Release this client's hold on the account's pooled session (closed once no client uses it)."""
+        if self._session_released:
+            return
+        self._session_released = True
+        get_session_registry().release(self.username)
 
     # --- Auth ---
     def login(self) -> str:
@@ -67,71 +598,41 @@ class PokerogueAPI:
         self.token = token
         # Capture clientSessionId if present; reset prior value on each fresh login
         self.client_session_id = data.get("clientSessionId")
+        self._reset_session_activity()
+        self.response_cache.invalidate()
+        self.server_state.forget()
         return token
 
-    def set_session_manager(self, session_manager) -> None:
-        """Set the session manager for automatic session validation."""
-        self._session_manager = session_manager
-
-    def _ensure_valid_session(self) -> bool:
-        """
-        Ensure session is valid before critical operations.
+    def _write_with_session_touch(self, write: Callable[[], Dict[str, Any]], touch: Callable[[], Any]) -> Dict[str, Any]:
+        """Run an upload, touching the session first only when it is not known to be active.
 
-        Returns:
-            True if session is valid, False otherwise
+        If the touch was skipped and the server rejects the write as inactive, the
+        session is touched and the write retried once.
         """
-        if not self._validate_session_before_upload:
-            return True
-
-        if not self.token:
-            logger.warning("No authentication token available")
-            return False
-
-        # Use session manager if available
-        if self._session_manager:
+        if not self._session_recently_active():
             try:
-                return self._session_manager.ensure_valid_session()
-            except Exception as e:
-                logger.error(f"Session manager validation failed: {e}")
-                return False
-
-        # Fallback: basic token presence check
-        return bool(self.token)
-
-    def _handle_auth_error(self, error: Exception, operation: str) -> None:
-        """
-        Handle authentication errors with enhanced messaging.
-
-        Args:
-            error: The original exception
-            operation: Description of the operation that failed
-        """
-        error_msg = str(error).lower()
-
-        if "401" in error_msg or "unauthorized" in error_msg:
-            if "illegal base64" in error_msg:
-                raise RuntimeError(
-                    f"{operation} failed: Session token is corrupted or malformed. "
-                    f"This often indicates session expiration. Please try refreshing your session."
-                ) from error
-            else:
-                raise RuntimeError(
-                    f"{operation} failed: Authentication expired or invalid. "
-                    f"Please refresh your session and try again."
-                ) from error
-        elif "403" in error_msg or "forbidden" in error_msg:
-            raise RuntimeError(
-                f"{operation} failed: Access denied. Please check your permissions."
-            ) from error
-        else:
-            # Re-raise with enhanced context
-            raise RuntimeError(f"{operation} failed: {error}") from error
+                touch()
+            except Exception:
+                pass
+            return write()
+        try:
+            return write()
+        except RuntimeError as e:
+            if not self._is_inactive_session_error(e):
+                raise
+            logger.info(f"Server reported inactive session; touching and retrying upload: {e}")
+            self._reset_session_activity()
+            try:
+                touch()
+            except Exception:
+                pass
+            return write()
 
     # --- Trainer ---
-    def get_trainer(self) -> Dict[str, Any]:
+    def get_trainer(self, use_cache: bool = True) -> Dict[str, Any]:
         # Prefer system save when clientSessionId is available; otherwise fall back to account info
         if self.client_session_id:
-            return self.get_system()
+            return self.get_system(use_cache=use_cache)
         resp = self._request("get", TRAINER_DATA_URL, headers=self._auth_headers())
         return self._json(resp)
 
@@ -160,12 +661,19 @@ class PokerogueAPI:
             self._handle_auth_error(e, "Trainer data upload")
 
     # --- System (trainer-like persistent data) ---
-    def get_system(self) -> Dict[str, Any]:
+    def get_system(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Fetch system data. With `use_cache=False` the server is always contacted (conditionally when possible)."""
         if not self.client_session_id:
             raise RuntimeError("clientSessionId is required for system get. Set via env/--csid or .env")
         url = f"{BASE_URL}/savedata/system/get?clientSessionId={self.client_session_id}"
-        resp = self._request("get", url, headers=self._auth_headers())
-        return self._json(resp)
+        if use_cache:
+            cached = self.response_cache.fresh([url])
+            if cached is not None:
+                return cached
+        data = self._get_cacheable(url, "system")
+        self._mark_session_active()
+        self.server_state.remember("system", data)
+        return data
 
     def update_system(self, system_data: Dict[str, Any]) -> Dict[str, Any]:
         if not self.client_session_id:
@@ -176,23 +684,28 @@ class PokerogueAPI:
             raise RuntimeError("Cannot update system: Session validation failed")
 
         try:
-            # Ensure session active by touching GET (server marks active if not)
-            try:
-                _ = self.get_system()
-            except Exception:
-                pass
             url = f"{BASE_URL}/savedata/system/update?clientSessionId={self.client_session_id}"
-            resp = self._request(
-                "post",
-                url,
-                headers=self._auth_headers(json_content=True),
-                json=system_data,
-            )
-            # Server returns 204 No Content; coerce to empty dict for consistency
+
+            def write() -> Dict[str, Any]:
+                resp = self._request(
+                    "post",
+                    url,
+                    headers=self._auth_headers(json_content=True),
+                    json=system_data,
+                )
+                self._mark_session_active()
+                self.server_state.remember("system", system_data)
+                # Server returns 204 No Content; coerce to empty dict for consistency
+                try:
+                    return self._json(resp)
+                except RuntimeError:
+                    return {}
+
             try:
-                return self._json(resp)
-            except RuntimeError:
-                return {}
+                # Ensure session active by touching GET (server marks active if not)
+                return self._write_with_session_touch(write, lambda: self.get_system(use_cache=False))
+            finally:
+                self.invalidate_cache(system=True)
         except Exception as e:
             self._handle_auth_error(e, "System data upload")
 
@@ -201,10 +714,14 @@ class PokerogueAPI:
             raise RuntimeError("clientSessionId is required for system verify. Set via env/--csid or .env")
         url = f"{BASE_URL}/savedata/system/verify?clientSessionId={self.client_session_id}"
         resp = self._request("get", url, headers=self._auth_headers())
-        return self._json(resp)
+        data = self._json(resp)
+        # Verify marks the session active server-side even when it reports invalid
+        self._mark_session_active()
+        return data
 
     # --- Save Slots ---
-    def get_slot(self, slot: int) -> Dict[str, Any]:
+    def get_slot(self, slot: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Fetch a slot (1-5). With `use_cache=False` the server is always contacted (conditionally when possible)."""
         # Canonical (browser) endpoint requires clientSessionId
         if not self.client_session_id:
             raise RuntimeError(
@@ -213,28 +730,26 @@ class PokerogueAPI:
             )
         # Prefer zero-based indexing server-side; UI uses 1-5
         zero = max(0, int(slot) - 1)
-        primary = f"{BASE_URL}/savedata/session/get?slot={zero}&clientSessionId={self.client_session_id}"
-        try:
-            resp = self._request("get", primary, headers=self._auth_headers())
-            return self._json(resp)
-        except RuntimeError as primary_err:
-            errors: list[str] = [f"GET {primary} -> {primary_err}"]
-            # As a final fallback, iterate configured candidates (defensive)
-            csid = self.client_session_id
-            for idx in (zero,):
-                for tmpl in SLOT_FETCH_PATHS:
-                    if "{csid}" in tmpl and not csid:
-                        continue
-                    path = tmpl.format(i=idx, csid=csid)
-                    url = path if path.startswith("http") else f"{BASE_URL}{path}"
-                    if url in (primary,):
-                        continue
-                    try:
-                        resp = self._request("get", url, headers=self._auth_headers())
-                        return self._json(resp)
-                    except RuntimeError as e3:
-                        errors.append(f"GET {url} -> {e3}")
-            raise RuntimeError("All slot fetch endpoints failed: " + "; ".join(errors[-3:]))
+        candidates = self._slot_fetch_candidates(zero)
+        if use_cache:
+            cached = self.response_cache.fresh(url for _, url in candidates)
+            if cached is not None:
+                return cached
+        errors: list[str] = []
+        failed: list[tuple[str, Exception]] = []
+        for tmpl, url in candidates:
+            try:
+                data = self._get_cacheable(url, f"slot:{zero}")
+                self._mark_session_active()
+                self.server_state.remember(f"slot:{zero + 1}", data)
+                self._record_endpoint_success(SLOT_FETCH, tmpl, failed)
+                self._record_fallback_path(SLOT_FETCH, failed, tmpl)
+                return data
+            except RuntimeError as e:
+                failed.append((tmpl, e))
+                errors.append(f"GET {url} -> {e}")
+        self._record_fallback_path(SLOT_FETCH, failed, None)
+        raise RuntimeError("All slot fetch endpoints failed: " + "; ".join(errors[-3:]))
 
     def update_slot(self, slot: int, save_data: Dict[str, Any]) -> Dict[str, Any]:
         if not self.client_session_id:
@@ -245,116 +760,157 @@ class PokerogueAPI:
             raise RuntimeError("Cannot update slot: Session validation failed")
 
         try:
-            # Ensure session is marked active and not stale
-            try:
-                _ = self.get_slot(slot)
-            except Exception:
-                pass
             zero = max(0, int(slot) - 1)
             headers = self._auth_headers(json_content=True)
-            tried: set[str] = set()
-            errors: list[str] = []
-            candidates: list[str] = []
-            # Primary canonical endpoints
-            candidates.append(f"{BASE_URL}/savedata/session/update?slot={zero}&clientSessionId={self.client_session_id}")
-            # Alternative 'set' endpoints sometimes used in deployments
-            candidates.append(f"{BASE_URL}/savedata/session/set?slot={zero}&clientSessionId={self.client_session_id}")
-            # Config-driven fallbacks
-            csid = self.client_session_id
-            for idx in (zero,):
-                for tmpl in SLOT_UPDATE_PATHS:
-                    if "{csid}" in tmpl and not csid:
-                        continue
-                    path = tmpl.format(i=idx, csid=csid)
-                    url = path if path.startswith("http") else f"{BASE_URL}{path}"
-                    candidates.append(url)
-            # Attempt in order, skipping duplicates
-            for url in candidates:
-                if url in tried:
-                    continue
-                tried.add(url)
-                try:
-                    resp = self._request("post", url, headers=headers, json=save_data)
+
+            def write() -> Dict[str, Any]:
+                errors: list[str] = []
+                failed: list[tuple[str, Exception]] = []
+                # Attempt in order: canonical update, 'set' alternative, config fallbacks
+                for tmpl, url in self._slot_update_candidates(zero):
                     try:
-                        return self._json(resp)
-                    except RuntimeError:
-                        return {}
-                except RuntimeError as e:
-                    errors.append(f"POST {url} -> {e}")
-                    continue
-            raise RuntimeError("All slot update endpoints failed: " + "; ".join(errors[-3:]))
+                        resp = self._request("post", url, headers=headers, json=save_data)
+                        self._mark_session_active()
+                        self.server_state.remember(f"slot:{zero + 1}", save_data)
+                        self._record_endpoint_success(SLOT_UPDATE, tmpl, failed)
+                        self._record_fallback_path(SLOT_UPDATE, failed, tmpl)
+                        try:
+                            return self._json(resp)
+                        except RuntimeError:
+                            return {}
+                    except RuntimeError as e:
+                        # Inactive session is not an endpoint problem; let the caller touch and retry
+                        if self._is_inactive_session_error(e):
+                            raise
+                        failed.append((tmpl, e))
+                        errors.append(f"POST {url} -> {e}")
+                        continue
+                self._record_fallback_path(SLOT_UPDATE, failed, None)
+                raise RuntimeError("All slot update endpoints failed: " + "; ".join(errors[-3:]))
+
+            try:
+                # Ensure session is marked active and not stale
+                return self._write_with_session_touch(write, lambda: self.get_slot(slot, use_cache=False))
+            finally:
+                self.invalidate_cache(slot=slot)
         except Exception as e:
             self._handle_auth_error(e, f"Slot {slot} data upload")
 
-    def get_available_slots(self) -> list[int]:
-        """
-        Detect which slots (1-5) are available/exist on the server.
+    def get_slots(self, slots: Iterable[int] = ALL_SLOTS, use_cache: bool = True) -> Dict[int, FetchResult]:
+        """Fetch several slots concurrently.
 
-        Returns a list of slot numbers that exist (have non-empty data).
+        Requests share this client's session and run on a worker pool bounded by
+        `max_parallel`. Failures are captured per slot instead of aborting the batch.
         """
-        available_slots = []
-
-        for slot_num in range(1, 6):  # Slots 1-5
-            try:
-                data = self.get_slot(slot_num)
-
-                # Check if slot has meaningful data
-                if data and self._is_slot_non_empty(data):
-                    available_slots.append(slot_num)
+        jobs = {f"slot {int(s)}": (lambda s=int(s): self.get_slot(s, use_cache=use_cache)) for s in slots}
+        results = self._run_parallel(jobs)
+        return {int(key.split()[1]): res for key, res in results.items()}
 
-            except Exception:
-                # If we can't fetch the slot or it errors, assume it doesn't exist
-                continue
+    def fetch_all(self, slots: Iterable[int] = ALL_SLOTS, include_trainer: bool = True, use_cache: bool = True) -> BulkFetchResult:
+        """Fetch trainer/system data and the given slots in one concurrent batch.
 
-        return available_slots
-
-    def _is_slot_non_empty(self, slot_data: Dict[str, Any]) -> bool:
+        Total latency is bounded by the slowest single request rather than the sum.
         """
-        Check if slot data indicates a non-empty/active slot.
+        jobs: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        if include_trainer:
+            jobs["trainer"] = lambda: self.get_trainer(use_cache=use_cache)
+        for s in slots:
+            jobs[f"slot {int(s)}"] = (lambda s=int(s): self.get_slot(s, use_cache=use_cache))
+        results = self._run_parallel(jobs)
+        bulk = BulkFetchResult(trainer=results.pop("trainer", None))
+        bulk.slots = {int(key.split()[1]): res for key, res in results.items()}
+        return bulk
+
+    def _run_parallel(self, jobs: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, FetchResult]:
+        def run(key: str, fn: Callable[[], Dict[str, Any]]) -> FetchResult:
+            start = time.monotonic()
+            try:
+                return FetchResult(key, data=fn(), elapsed=time.monotonic() - start)
+            except Exception as e:
+                logger.debug(f"Batched fetch {key} failed: {e}")
+                return FetchResult(key, error=e, elapsed=time.monotonic() - start)
+
+        if not jobs:
+            return {}
+        workers = min(self.max_parallel, len(jobs))
+        if workers <= 1:
+            return {key: run(key, fn) for key, fn in jobs.items()}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pokerogue_fetch") as pool:
+            futures = {key: pool.submit(run, key, fn) for key, fn in jobs.items()}
+            return {key: fut.result() for key, fut in futures.items()}
 
-        A slot is considered non-empty if it has:
-        - A party with Pokemon, or
-        - Playtime > 0, or
-        - Other indicators of an active save
+    def get_available_slots(self) -> list[int]:
         """
-        if not slot_data:
-            return False
-
-        # Check for party with Pokemon
-        party = slot_data.get('party', [])
-        if party and len(party) > 0:
-            return True
-
-        # Check for playtime
-        play_time = slot_data.get('playTime', 0)
-        if play_time and play_time > 0:
-            return True
-
-        # Check for other indicators of active save
-        # These are common fields that indicate progress
-        indicators = ['arena', 'gameMode', 'modifiers', 'enemyModifiers', 'challenges']
-        for field in indicators:
-            value = slot_data.get(field)
-            if value:  # Non-empty, non-zero, non-None
-                return True
+        Detect which slots (1-5) are available/exist on the server.
 
-        return False
+        Returns a list of slot numbers that exist (have non-empty data).
+        Slots are fetched concurrently; slots that fail to load are treated as absent.
+        """
+        results = self.get_slots(ALL_SLOTS)
+        return sorted(
+            slot for slot, res in results.items()
+            if res.ok and res.data and self._is_slot_non_empty(res.data)
+        )
 
     # --- Core request with retry/backoff ---
     def _request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, data: Any = None, json: Any = None) -> requests.Response:
+        event = self._new_event(method, url)
+        started = time.monotonic()
+        try:
+            resp = self._request_with_retries(event, method, url, headers, data, json)
+        except Exception as e:
+            self._finish_event(event, started, e)
+            raise
+        self._finish_event(event, started)
+        return resp
+
+    def _request_with_retries(self, event: RequestEvent, method: str, url: str, headers: Optional[Dict[str, str]],
+                              data: Any, json: Any) -> requests.Response:
+        stats = TransferStats(method.upper(), url)
+        payload = json
+        if payload is not None:
+            # Serialize ourselves: compact separators, optional compression
+            data, body_headers, stats.bytes_out = self._encode_json_body(payload)
+            headers = {**(headers or {}), **body_headers}
+            stats.request_encoding = body_headers.get("content-encoding")
+        else:
+            stats.bytes_out = self._body_size(data)
+        stats.bytes_out_wire = self._body_size(data)
         attempt = 0
         last_exc: Optional[Exception] = None
         while attempt < self.max_retries:
             try:
-                resp = self.session.request(method, url, headers=headers, data=data, json=json, timeout=self.timeout)
+                event.throttle_wait += self._limiter().acquire(url)
+                event.attempts += 1
+                event.bytes_out += stats.bytes_out_wire
+                resp = self.session.request(method, url, headers=headers, data=data, timeout=self.timeout)
+                get_session_registry().touch(self.username)
+                if resp.status_code == 415 and stats.request_encoding:
+                    # Server refuses compressed bodies: stop compressing and resend as plain JSON
+                    logger.warning(f"Server rejected {stats.request_encoding} request body; disabling upload compression")
+                    self.upload_encoding = None
+                    data, body_headers, _ = self._encode_json_body(payload, compress=False)
+                    headers = {k: v for k, v in headers.items() if k.lower() != "content-encoding"}
+                    stats.request_encoding = None
+                    stats.bytes_out_wire = len(data)
+                    continue
+                stats.status = resp.status_code
+                stats.bytes_in = len(resp.content)
+                stats.bytes_in_wire = int(resp.headers.get("content-length") or stats.bytes_in)
+                stats.response_encoding = resp.headers.get("content-encoding")
+                self._record_transfer(replace(stats))
+                event.status = resp.status_code
+                event.bytes_in += stats.bytes_in_wire
                 # Retry on 429 or 5xx
-                if resp.status_code == 429 or 500 <= resp.status_code < 600:
-                    delay = self._retry_after_delay(resp) or self._backoff(attempt)
+                if self._is_retryable_status(resp.status_code):
+                    delay = self._throttle_delay(url, resp, self._retry_after_delay(resp) or self._backoff(attempt))
                     attempt += 1
                     if attempt >= self.max_retries:
                         self._raise_for_status(resp)
-                    time.sleep(delay)
+                    if delay > 0:
+                        time.sleep(delay)
                     continue
+                self._limiter().observe(url, resp.status_code)
                 # Non-retriable -> raise if error
                 if 400 <= resp.status_code < 600:
                     self._raise_for_status(resp)
@@ -370,64 +926,3 @@ class PokerogueAPI:
         if last_exc:
             raise last_exc
         raise RuntimeError("Request failed without exception")
-
-    def _backoff(self, attempt: int) -> float:
-        return self.backoff_factor * (2 ** attempt)
-
-    @staticmethod
-    def _retry_after_delay(resp: requests.Response) -> Optional[float]:
-        ra = resp.headers.get("Retry-After")
-        if not ra:
-            return None
-        try:
-            return float(ra)
-        except Exception:
-            return None
-
-    # --- Helpers ---
-    def _auth_headers(self, json_content: bool = False) -> Dict[str, str]:
-        if not self.token:
-            raise RuntimeError("Not authenticated. Call login() first.")
-        # Prefer standard Base64; some servers reject URL-safe in Authorization
-        token = to_standard_b64(self.token)
-        headers = {
-            **DEFAULT_HEADERS,
-            # Server expects raw token without 'Bearer ' prefix
-            "authorization": token,
-        }
-        if json_content:
-            headers["content-type"] = "application/json"
-        return headers
-
-    def _auth_headers_raw(self, json_content: bool = False) -> Dict[str, str]:
-        if not self.token:
-            raise RuntimeError("Not authenticated. Call login() first.")
-        headers = {
-            **DEFAULT_HEADERS,
-            "authorization": self.token,
-        }
-        if json_content:
-            headers["content-type"] = "application/json"
-        return headers
-
-    @staticmethod
-    def _raise_for_status(resp: requests.Response) -> None:
-        if resp.status_code == 404:
-            raise RuntimeError("Endpoint not found (404)")
-        if resp.status_code == 401:
-            body = (resp.text or "").strip()
-            snippet = body[:200] + ("..." if len(body) > 200 else "")
-            raise RuntimeError(f"Unauthorized (401): {snippet}")
-        if resp.status_code == 403:
-            raise RuntimeError("Forbidden (403)")
-        if 400 <= resp.status_code < 600:
-            raise RuntimeError(f"HTTP {resp.status_code}: {resp.text}")
-
-    @staticmethod
-    def _json(resp: requests.Response) -> Dict[str, Any]:
-        try:
-            return resp.json()
-        except json.JSONDecodeError:
-            raise RuntimeError(
-                f"Invalid JSON response. Content-Type: {resp.headers.get('content-type')}"
-            )
@@ -0,0 +1,235 @@
+"""Request instrumentation for the Pokerogue API clients.
+
+`PokerogueAPI._request` (and its async counterpart) emits one `RequestEvent`
+per logical call, covering every retry. `ApiMetrics` aggregates them per
+endpoint (latency histogram and percentiles, retries, errors, bytes in/out,
+time spent waiting on the rate limiter) and records which slot endpoint
+fallbacks were walked before one succeeded. Extra consumers can subscribe with
+`add_hook`. The aggregate is readable via `snapshot()` / `format_report()` and
+is shown in the GUI's network diagnostics window.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+
+def endpoint_of(method: str, url: str) -> str:
+    """Stable endpoint label such as ``GET /savedata/session/get`` (query dropped, numeric path segments as ``{n}``)."""
+    path = re.sub(r"/\d+(?=/|$)", "/{n}", urlparse(url).path or "/")
+    return f"{method.upper()} {path}"
+
+
+@dataclass
+class RequestEvent:
+    """One logical request, including all of its retries."""
+    method: str
+    url: str
+    endpoint: str
+    status: int = 0
+    elapsed: float = 0.0
+    attempts: int = 0
+    throttle_wait: float = 0.0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    error: Optional[str] = None
+    # Wall-clock completion time, set when the request finishes (creation time until then)
+    finished_at: float = field(default_factory=time.time)
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 0 < self.status < 400
+
+
+class EndpointStats:
+    """Running aggregate for one endpoint."""
+
+    def __init__(self, sample_size: int = 256):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.throttle_wait = 0.0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.status_counts: Dict[int, int] = {}
+        self._samples: Deque[float] = deque(maxlen=sample_size)
+
+    def add(self, event: RequestEvent) -> None:
+        self.count += 1
+        self.errors += 0 if event.ok else 1
+        self.retries += event.retries
+        self.bytes_out += event.bytes_out
+        self.bytes_in += event.bytes_in
+        self.throttle_wait += event.throttle_wait
+        self.total_time += event.elapsed
+        self.max_time = max(self.max_time, event.elapsed)
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, event.elapsed)] += 1
+        if event.status:
+            self.status_counts[event.status] = self.status_counts.get(event.status, 0) + 1
+        self._samples.append(event.elapsed)
+
+    def percentile(self, pct: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+        return ordered[idx]
+
+    def to_dict(self) -> Dict[str, object]:
+        labels = [f"<={b:g}s" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "throttle_wait": round(self.throttle_wait, 3),
+            "avg": round(self.total_time / self.count, 4) if self.count else 0.0,
+            "p50": round(self.percentile(50), 4),
+            "p95": round(self.percentile(95), 4),
+            "max": round(self.max_time, 4),
+            "histogram": dict(zip(labels, self.histogram)),
+            "status": dict(self.status_counts),
+        }
+
+
+class ApiMetrics:
+    """Thread-safe collector of request events and fallback paths."""
+
+    def __init__(self, recent: int = 100):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._fallbacks: Dict[str, Dict[str, int]] = {}
+        self._recent: Deque[RequestEvent] = deque(maxlen=recent)
+        self._recent_fallbacks: Deque[Dict[str, object]] = deque(maxlen=recent)
+        self._hooks: List[Callable[[RequestEvent], None]] = []
+
+    # --- Hooks ---
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """Call `hook(event)` after every request. Hooks run on the requesting thread and must be quick."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    # --- Recording ---
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self._endpoints[event.endpoint] = EndpointStats()
+            stats.add(event)
+            self._recent.append(event)
+            hooks = list(self._hooks)
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.debug(f"API metrics hook failed: {e}")
+
+    def record_fallback(self, operation: str, attempted: List[str], winner: Optional[str]) -> None:
+        """Record the endpoint templates tried for one slot operation and which (if any) succeeded."""
+        path = " -> ".join(attempted) if attempted else "(none)"
+        outcome = winner or "FAILED"
+        with self._lock:
+            per_op = self._fallbacks.setdefault(operation, {})
+            key = f"{path} => {outcome}"
+            per_op[key] = per_op.get(key, 0) + 1
+            self._recent_fallbacks.append({
+                "operation": operation,
+                "attempted": list(attempted),
+                "winner": winner,
+                "at": time.time(),
+            })
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._fallbacks.clear()
+            self._recent.clear()
+            self._recent_fallbacks.clear()
+
+    # --- Reading ---
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "endpoints": {name: stats.to_dict() for name, stats in sorted(self._endpoints.items())},
+                "fallbacks": {op: dict(paths) for op, paths in self._fallbacks.items()},
+                "recent": [
+                    {
+                        "endpoint": e.endpoint,
+                        "status": e.status,
+                        "elapsed": round(e.elapsed, 4),
+                        "retries": e.retries,
+                        "throttle_wait": round(e.throttle_wait, 3),
+                        "bytes_out": e.bytes_out,
+                        "bytes_in": e.bytes_in,
+                        "error": e.error,
+                    }
+                    for e in self._recent
+                ],
+                "recent_fallbacks": list(self._recent_fallbacks),
+            }
+
+    def format_report(self) -> str:
+        """Human-readable summary for logs and the diagnostics window."""
+        snap = self.snapshot()
+        lines: List[str] = []
+        endpoints = snap["endpoints"]
+        if not endpoints:
+            return "No API requests recorded yet."
+        lines.append(f"{'Endpoint':42} {'n':>5} {'err':>4} {'retry':>5} {'p50':>7} {'p95':>7} {'max':>7} {'wait':>6} {'out':>9} {'in':>9}")
+        for name, st in endpoints.items():
+            lines.append(
+                f"{name[:42]:42} {st['count']:>5} {st['errors']:>4} {st['retries']:>5} "
+                f"{st['p50']:>7.3f} {st['p95']:>7.3f} {st['max']:>7.3f} {st['throttle_wait']:>6.2f} "
+                f"{st['bytes_out']:>9} {st['bytes_in']:>9}"
+            )
+        lines.append("")
+        lines.append("Latency histogram:")
+        for name, st in endpoints.items():
+            buckets = ", ".join(f"{label}:{n}" for label, n in st["histogram"].items() if n)
+            lines.append(f"  {name}: {buckets}")
+        if snap["fallbacks"]:
+            lines.append("")
+            lines.append("Slot endpoint fallback paths:")
+            for op, paths in snap["fallbacks"].items():
+                for path, n in paths.items():
+                    lines.append(f"  [{op}] x{n}: {path}")
+        return "\n".join(lines)
+
+
+_METRICS: Optional[ApiMetrics] = None
+_METRICS_LOCK = threading.Lock()
+
+
+def get_api_metrics() -> ApiMetrics:
+    """Process-wide metrics collector shared by all API clients."""
+    global _METRICS
+    with _METRICS_LOCK:
+        if _METRICS is None:
+            _METRICS = ApiMetrics()
+        return _METRICS
@@ -0,0 +1,401 @@
+"""Asyncio transport for Pokerogue endpoints.
+
+`AsyncPokerogueAPI` mirrors the core surface of `PokerogueAPI` (login, system and
+slot get/update, system verify) as coroutines so bulk tools can run many
+account/slot operations on one event loop. Retry/backoff rules, auth headers,
+status handling and slot endpoint fallbacks are shared with the sync client.
+
+Requires the optional `aiohttp` package (``pip install aiohttp``); it is only
+imported when the first request is made.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from dataclasses import replace
+
+from .api import ALL_SLOTS, FetchResult, TransferStats, _PokerogueClientBase
+from .api_metrics import RequestEvent
+from .endpoint_cache import SLOT_FETCH, SLOT_UPDATE
+from .response_cache import ResponseCache, RevalidationMiss
+from .save_diff import ServerStateTracker
+from .config import BASE_URL, LOGIN_URL, DEFAULT_HEADERS, CLIENT_SESSION_ID, UPLOAD_ENCODING
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncResponse:
+    """Fully-read response exposing the subset of `requests.Response` used by the shared helpers."""
+
+    def __init__(self, status_code: int, headers: Any, content: bytes, encoding: Optional[str] = None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncPokerogueAPI(_PokerogueClientBase):
+    """Asyncio HTTP client for Pokerogue endpoints.
+
+    Use as an async context manager (or call `close()`) so the underlying
+    connection pool is released:
+
+        async with AsyncPokerogueAPI(user, pw) as api:
+            await api.login()
+            slots = await api.get_slots()
+    """
+
+    def __init__(self, username: str, password: str, timeout: int = 15, max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_parallel: int = 6, session_active_window: float = 60.0, upload_encoding: Optional[str] = UPLOAD_ENCODING):
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.token: Optional[str] = None
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # Upper bound on in-flight requests issued by get_slots
+        self.max_parallel = max(1, int(max_parallel))
+        self.client_session_id: Optional[str] = CLIENT_SESSION_ID
+        # Skip the pre-upload touch GET when the session was confirmed this recently (0 disables)
+        self.session_active_window = session_active_window
+        self._session_confirmed_at = 0.0
+        # Opt-in gzip/deflate upload bodies; per-call byte counts in self.transfers
+        self.upload_encoding = upload_encoding
+        self._init_transfer_stats()
+        # Short-lived slot/system GET cache, invalidated on update_*
+        self.response_cache = ResponseCache()
+        self.server_state = ServerStateTracker()
+        # Session validation tracking (see set_session_manager)
+        self._session_manager = None
+        self._validate_session_before_upload = True
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncPokerogueAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise RuntimeError("AsyncPokerogueAPI requires the 'aiohttp' package (pip install aiohttp)") from e
+            self._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    # --- Auth ---
+    async def login(self) -> str:
+        payload = {"username": self.username, "password": self.password}
+        # First try form-encoded (observed in production)
+        try:
+            resp = await self._request("post", LOGIN_URL, data=payload)
+        except RuntimeError as e:
+            msg = str(e)
+            # Fallback: some deployments accept JSON body only
+            if "Unauthorized" in msg or "HTTP 401" in msg:
+                resp = await self._request(
+                    "post",
+                    LOGIN_URL,
+                    headers={**DEFAULT_HEADERS, "content-type": "application/json"},
+                    json=payload,
+                )
+            else:
+                raise
+        data = self._json(resp)
+        token = data.get("token")
+        if not token:
+            raise RuntimeError("Authentication succeeded but no token returned.")
+        self.token = token
+        # Capture clientSessionId if present; reset prior value on each fresh login
+        self.client_session_id = data.get("clientSessionId")
+        self._reset_session_activity()
+        self.response_cache.invalidate()
+        self.server_state.forget()
+        return token
+
+    async def _write_with_session_touch(self, write: Callable[[], Awaitable[Dict[str, Any]]],
+                                        touch: Callable[[], Awaitable[Any]]) -> Dict[str, Any]:
+        """Async counterpart of `PokerogueAPI._write_with_session_touch`."""
+        if not self._session_recently_active():
+            try:
+                await touch()
+            except Exception:
+                pass
+            return await write()
+        try:
+            return await write()
+        except RuntimeError as e:
+            if not self._is_inactive_session_error(e):
+                raise
+            logger.info(f"Server reported inactive session; touching and retrying upload: {e}")
+            self._reset_session_activity()
+            try:
+                await touch()
+            except Exception:
+                pass
+            return await write()
+
+    async def _get_cacheable(self, url: str, tag: str) -> Dict[str, Any]:
+        """Conditional GET through the response cache, retried once unconditionally on a stray 304.
+
+        As in `PokerogueAPI._get_cacheable`, a body in flight across an upload's invalidation is not cached.
+        """
+        generation = self.response_cache.generation(tag)
+        resp = await self._request("get", url, headers=self._conditional_headers(url))
+        try:
+            return self._decode_cacheable(url, tag, resp, generation)
+        except RevalidationMiss:
+            generation = self.response_cache.generation(tag)
+            resp = await self._request("get", url, headers=self._auth_headers())
+            return self._decode_cacheable(url, tag, resp, generation)
+
+    async def _ensure_valid_session_async(self) -> bool:
+        """`_ensure_valid_session`, run off the event loop when a session manager may block on the network."""
+        if self._session_manager is None:
+            return self._ensure_valid_session()
+        return await asyncio.get_running_loop().run_in_executor(None, self._ensure_valid_session)
+
+    def _record_endpoint_success(self, kind: str, template: str, failed: list[tuple[str, Exception]],
+                                 persist: bool = True) -> None:
+        # Update the shared cache in memory here and write the file from an executor thread
+        super()._record_endpoint_success(kind, template, failed, persist=False)
+        if persist:
+            asyncio.get_running_loop().run_in_executor(None, self._endpoints().flush)
+
+    def _require_csid(self, operation: str) -> None:
+        if not self.client_session_id:
+            raise RuntimeError(f"clientSessionId is required for {operation}. Set via env/--csid or .env")
+
+    # --- System (trainer-like persistent data) ---
+    async def get_system(self, use_cache: bool = True) -> Dict[str, Any]:
+        self._require_csid("system get")
+        url = f"{BASE_URL}/savedata/system/get?clientSessionId={self.client_session_id}"
+        if use_cache:
+            cached = self.response_cache.fresh([url])
+            if cached is not None:
+                return cached
+        data = await self._get_cacheable(url, "system")
+        self._mark_session_active()
+        self.server_state.remember("system", data)
+        return data
+
+    async def update_system(self, system_data: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_csid("system update")
+
+        # Validate session before upload
+        if not await self._ensure_valid_session_async():
+            raise RuntimeError("Cannot update system: Session validation failed")
+
+        try:
+            url = f"{BASE_URL}/savedata/system/update?clientSessionId={self.client_session_id}"
+
+            async def write() -> Dict[str, Any]:
+                resp = await self._request("post", url, headers=self._auth_headers(json_content=True), json=system_data)
+                self._mark_session_active()
+                self.server_state.remember("system", system_data)
+                # Server returns 204 No Content; coerce to empty dict for consistency
+                try:
+                    return self._json(resp)
+                except RuntimeError:
+                    return {}
+
+            try:
+                # Ensure session active by touching GET (server marks active if not)
+                return await self._write_with_session_touch(write, lambda: self.get_system(use_cache=False))
+            finally:
+                self.invalidate_cache(system=True)
+        except Exception as e:
+            self._handle_auth_error(e, "System data upload")
+
+    async def system_verify(self) -> Dict[str, Any]:
+        self._require_csid("system verify")
+        url = f"{BASE_URL}/savedata/system/verify?clientSessionId={self.client_session_id}"
+        resp = await self._request("get", url, headers=self._auth_headers())
+        data = self._json(resp)
+        # Verify marks the session active server-side even when it reports invalid
+        self._mark_session_active()
+        return data
+
+    # --- Save Slots ---
+    async def get_slot(self, slot: int, use_cache: bool = True) -> Dict[str, Any]:
+        self._require_csid("slot fetch")
+        # Prefer zero-based indexing server-side; UI uses 1-5
+        zero = max(0, int(slot) - 1)
+        candidates = self._slot_fetch_candidates(zero)
+        if use_cache:
+            cached = self.response_cache.fresh(url for _, url in candidates)
+            if cached is not None:
+                return cached
+        errors: list[str] = []
+        failed: list[tuple[str, Exception]] = []
+        for tmpl, url in candidates:
+            try:
+                data = await self._get_cacheable(url, f"slot:{zero}")
+                self._mark_session_active()
+                self.server_state.remember(f"slot:{zero + 1}", data)
+                self._record_endpoint_success(SLOT_FETCH, tmpl, failed)
+                self._record_fallback_path(SLOT_FETCH, failed, tmpl)
+                return data
+            except RuntimeError as e:
+                failed.append((tmpl, e))
+                errors.append(f"GET {url} -> {e}")
+        self._record_fallback_path(SLOT_FETCH, failed, None)
+        raise RuntimeError("All slot fetch endpoints failed: " + "; ".join(errors[-3:]))
+
+    async def update_slot(self, slot: int, save_data: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_csid("slot update")
+
+        # Validate session before upload
+        if not await self._ensure_valid_session_async():
+            raise RuntimeError("Cannot update slot: Session validation failed")
+
+        try:
+            zero = max(0, int(slot) - 1)
+            headers = self._auth_headers(json_content=True)
+
+            async def write() -> Dict[str, Any]:
+                errors: list[str] = []
+                failed: list[tuple[str, Exception]] = []
+                for tmpl, url in self._slot_update_candidates(zero):
+                    try:
+                        resp = await self._request("post", url, headers=headers, json=save_data)
+                        self._mark_session_active()
+                        self.server_state.remember(f"slot:{zero + 1}", save_data)
+                        self._record_endpoint_success(SLOT_UPDATE, tmpl, failed)
+                        self._record_fallback_path(SLOT_UPDATE, failed, tmpl)
+                        try:
+                            return self._json(resp)
+                        except RuntimeError:
+                            return {}
+                    except RuntimeError as e:
+                        # Inactive session is not an endpoint problem; let the caller touch and retry
+                        if self._is_inactive_session_error(e):
+                            raise
+                        failed.append((tmpl, e))
+                        errors.append(f"POST {url} -> {e}")
+                self._record_fallback_path(SLOT_UPDATE, failed, None)
+                raise RuntimeError("All slot update endpoints failed: " + "; ".join(errors[-3:]))
+
+            try:
+                # Ensure session is marked active and not stale
+                return await self._write_with_session_touch(write, lambda: self.get_slot(slot, use_cache=False))
+            finally:
+                self.invalidate_cache(slot=slot)
+        except Exception as e:
+            self._handle_auth_error(e, f"Slot {slot} data upload")
+
+    async def get_slots(self, slots: Iterable[int] = ALL_SLOTS, use_cache: bool = True) -> Dict[int, FetchResult]:
+        """Fetch several slots concurrently on the running loop, reporting errors per slot."""
+        gate = asyncio.Semaphore(self.max_parallel)
+        loop = asyncio.get_running_loop()
+
+        async def run(slot: int) -> FetchResult:
+            async with gate:
+                start = loop.time()
+                try:
+                    data = await self.get_slot(slot, use_cache=use_cache)
+                    return FetchResult(f"slot {slot}", data=data, elapsed=loop.time() - start)
+                except Exception as e:
+                    logger.debug(f"Async fetch slot {slot} failed: {e}")
+                    return FetchResult(f"slot {slot}", error=e, elapsed=loop.time() - start)
+
+        wanted = [int(s) for s in slots]
+        results = await asyncio.gather(*(run(s) for s in wanted))
+        return dict(zip(wanted, results))
+
+    # --- Core request with retry/backoff ---
+    async def _request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, data: Any = None, json: Any = None) -> _AsyncResponse:
+        event = self._new_event(method, url)
+        started = time.monotonic()
+        try:
+            resp = await self._request_with_retries(event, method, url, headers, data, json)
+        except Exception as e:
+            self._finish_event(event, started, e)
+            raise
+        self._finish_event(event, started)
+        return resp
+
+    async def _request_with_retries(self, event: RequestEvent, method: str, url: str, headers: Optional[Dict[str, str]],
+                                    data: Any, json: Any) -> _AsyncResponse:
+        session = self._get_session()
+        import aiohttp
+
+        stats = TransferStats(method.upper(), url)
+        payload = json
+        if payload is not None:
+            # Serialize ourselves: compact separators, optional compression
+            data, body_headers, stats.bytes_out = self._encode_json_body(payload)
+            headers = {**(headers or {}), **body_headers}
+            stats.request_encoding = body_headers.get("content-encoding")
+        else:
+            stats.bytes_out = self._body_size(data)
+        stats.bytes_out_wire = self._body_size(data)
+        attempt = 0
+        while attempt < self.max_retries:
+            try:
+                wait = self._limiter().reserve(url)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                event.throttle_wait += wait
+                event.attempts += 1
+                event.bytes_out += stats.bytes_out_wire
+                async with session.request(method.upper(), url, headers=headers, data=data) as raw:
+                    resp = _AsyncResponse(raw.status, raw.headers.copy(), await raw.read(), raw.charset)
+                if resp.status_code == 415 and stats.request_encoding:
+                    # Server refuses compressed bodies: stop compressing and resend as plain JSON
+                    logger.warning(f"Server rejected {stats.request_encoding} request body; disabling upload compression")
+                    self.upload_encoding = None
+                    data, body_headers, _ = self._encode_json_body(payload, compress=False)
+                    headers = {k: v for k, v in headers.items() if k.lower() != "content-encoding"}
+                    stats.request_encoding = None
+                    stats.bytes_out_wire = len(data)
+                    continue
+                stats.status = resp.status_code
+                stats.bytes_in = len(resp.content)
+                stats.bytes_in_wire = int(resp.headers.get("content-length") or stats.bytes_in)
+                stats.response_encoding = resp.headers.get("content-encoding")
+                self._record_transfer(replace(stats))
+                event.status = resp.status_code
+                event.bytes_in += stats.bytes_in_wire
+                if self._is_retryable_status(resp.status_code):
+                    delay = self._throttle_delay(url, resp, self._retry_after_delay(resp) or self._backoff(attempt))
+                    attempt += 1
+                    if attempt >= self.max_retries:
+                        self._raise_for_status(resp)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    continue
+                self._limiter().observe(url, resp.status_code)
+                # Non-retriable -> raise if error
+                if 400 <= resp.status_code < 600:
+                    self._raise_for_status(resp)
+                return resp
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                delay = self._backoff(attempt)
+                attempt += 1
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(delay)
+        raise RuntimeError("Request failed without exception")
@@ -6,6 +6,7 @@ This module provides atomic file operations that prevent save corruption through
 2. Automatic backup before modifications
 3. Transaction-like behavior for multi-file operations
 4. Rollback capabilities on failure
+5. Streaming checksums (``<file>.sha256``) instead of re-parsing written files
 
 CRITICAL SAFETY: Never overwrite original files without verified backup.
 """
@@ -23,19 +24,30 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Generator
 
+from .backup_store import BlobStore, discard_checksum, get_blob_store, hash_file, write_checksum, write_hashed
 from .save_validation import SaveValidator, ValidationResult, ValidationSeverity
 
 logger = logging.getLogger(__name__)
 
 
+def serialize_json(data: Any) -> str:
+    """Serialize save data exactly as the atomic writer stores it on disk."""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
 @dataclass
 class BackupInfo:
-    """Information about a created backup."""
+    """Information about a created backup.
+
+    `blob_hash` names the content in the blob store next to the file
+    (``<dir>/backups/objects``); `backup_path` is the blob's location.
+    """
     backup_path: str
     original_path: str
     operation: str
     timestamp: str
     size_bytes: int
+    blob_hash: Optional[str] = None
 
 
 @dataclass
@@ -74,17 +86,9 @@ class AtomicSaveManager:
         timestamp = int(time.time() * 1000)
         return f"op_{timestamp}_{self._operation_counter}"
 
-    def _create_backup_path(self, original_path: str, operation: str) -> str:
-        """Create backup path with operation context."""
-        original = Path(original_path)
-        parent_dir = original.parent
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-
-        # Create operation-specific backup directory
-        backup_dir = parent_dir / "backups" / "operations" / f"{timestamp}_{operation}"
-        backup_dir.mkdir(parents=True, exist_ok=True)
-
-        return str(backup_dir / original.name)
+    def _blob_store_for(self, original_path: str) -> BlobStore:
+        """Blob store of the backups directory next to `original_path`."""
+        return get_blob_store(str(Path(original_path).parent / "backups"))
 
     def _create_temp_path(self, target_path: str) -> str:
         """Create temporary file path for atomic writes."""
@@ -118,24 +122,18 @@ class AtomicSaveManager:
         if not os.path.exists(file_path):
             raise RuntimeError(f"Cannot backup non-existent file: {file_path}")
 
-        backup_path = self._create_backup_path(file_path, operation)
+        store = self._blob_store_for(file_path)
 
         try:
-            # Ensure backup directory exists
-            os.makedirs(os.path.dirname(backup_path), exist_ok=True)
-
-            # Copy with metadata preservation
-            shutil.copy2(file_path, backup_path)
+            # Store content by hash; an unchanged file is already present and costs no write
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            digest = store.put_bytes(content)
+            backup_path = store.path_for(digest)
 
             # Verify backup integrity
             if not os.path.exists(backup_path):
-                raise RuntimeError(f"Backup file was not created: {backup_path}")
-
-            original_size = os.path.getsize(file_path)
-            backup_size = os.path.getsize(backup_path)
-
-            if original_size != backup_size:
-                raise RuntimeError(f"Backup size mismatch: {original_size} != {backup_size}")
+                raise RuntimeError(f"Backup blob was not created: {backup_path}")
 
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -144,19 +142,14 @@ class AtomicSaveManager:
                 original_path=file_path,
                 operation=operation,
                 timestamp=timestamp,
-                size_bytes=original_size
+                size_bytes=len(content),
+                blob_hash=digest
             )
 
-            logger.info(f"Created backup: {file_path} -> {backup_path}")
+            logger.info(f"Created backup: {file_path} -> {digest[:12]}")
             return backup_info
 
         except Exception as e:
-            # Clean up partial backup
-            if os.path.exists(backup_path):
-                try:
-                    os.remove(backup_path)
-                except Exception:
-                    pass
             raise RuntimeError(f"Backup creation failed: {e}") from e
 
     def safe_write_json(self, file_path: str, data: Any, operation: str,
@@ -196,6 +189,33 @@ class AtomicSaveManager:
                 warning_msgs = [issue.message for issue in result.get_warnings()]
                 logger.warning(f"Validation warnings: {'; '.join(warning_msgs)}")
 
+        return self.safe_write_serialized(
+            file_path, serialize_json(data), operation, create_backup=create_backup
+        )
+
+    def safe_write_serialized(self, file_path: str, text: str, operation: str,
+                              create_backup: bool = True) -> BackupInfo:
+        """
+        Atomically write already-serialized JSON (see `serialize_json`) with backup.
+
+        Serializing up front lets callers snapshot their data on their own thread
+        and hand the write to a background writer. The bytes are hashed while they
+        are streamed to the temp file; the temp file is then re-hashed in chunks
+        (instead of parsed again) before the rename, and the checksum is stored
+        next to the file as ``<file>.sha256``.
+
+        Args:
+            file_path: Target file path
+            text: JSON document text
+            operation: Operation description for backup context
+            create_backup: Whether to backup existing file
+
+        Returns:
+            BackupInfo if backup was created, None otherwise
+
+        Raises:
+            RuntimeError: If the write operation fails
+        """
         backup_info = None
 
         # Create backup if file exists and requested
@@ -206,23 +226,20 @@ class AtomicSaveManager:
         temp_path = self._create_temp_path(file_path)
 
         try:
-            # Write to temporary file
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Write to temporary file, hashing the bytes as they stream out
+            payload = text.encode('utf-8')
+            with open(temp_path, 'wb') as f:
+                digest = write_hashed(f, payload)
+                f.flush()
+                os.fsync(f.fileno())
 
             # Verify temp file was written correctly
             if not os.path.exists(temp_path):
                 raise RuntimeError("Temporary file was not created")
 
-            # Verify JSON integrity by loading it back
-            try:
-                with open(temp_path, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                # Basic structure check
-                if type(loaded_data) != type(data):
-                    raise RuntimeError("Data type mismatch after write")
-            except Exception as e:
-                raise RuntimeError(f"JSON integrity check failed: {e}")
+            # Verify integrity by re-hashing what landed on disk
+            if os.path.getsize(temp_path) != len(payload) or hash_file(temp_path) != digest:
+                raise RuntimeError("Checksum mismatch after write")
 
             # Atomic rename (this is the critical atomic operation)
             if os.name == 'nt':  # Windows
@@ -246,6 +263,13 @@ class AtomicSaveManager:
             else:  # Unix-like systems
                 os.rename(temp_path, file_path)
 
+            # Record the checksum for later integrity sweeps; the save itself already succeeded
+            try:
+                write_checksum(file_path, digest, len(payload))
+            except OSError as e:
+                logger.warning(f"Could not write checksum for {file_path}: {e}")
+                discard_checksum(file_path)
+
             logger.info(f"Atomic write completed: {file_path}")
             return backup_info
 
@@ -370,7 +394,12 @@ class AtomicSaveManager:
                 temp_path = self._create_temp_path(backup_info.original_path)
 
                 try:
-                    shutil.copy2(backup_info.backup_path, temp_path)
+                    if backup_info.blob_hash:
+                        content = self._blob_store_for(backup_info.original_path).get_bytes(backup_info.blob_hash)
+                        with open(temp_path, 'wb') as f:
+                            f.write(content)
+                    else:
+                        shutil.copy2(backup_info.backup_path, temp_path)
 
                     # Atomic rename
                     if os.name == 'nt':  # Windows
@@ -390,6 +419,14 @@ class AtomicSaveManager:
                     else:  # Unix-like
                         os.rename(temp_path, backup_info.original_path)
 
+                    # Keep the checksum sidecar in step with the restored content
+                    try:
+                        write_checksum(backup_info.original_path,
+                                       backup_info.blob_hash or hash_file(backup_info.original_path),
+                                       os.path.getsize(backup_info.original_path))
+                    except OSError:
+                        discard_checksum(backup_info.original_path)
+
                     logger.info(f"Restored: {backup_info.original_path}")
 
                 except Exception as e:
@@ -455,12 +492,16 @@ class AtomicSaveManager:
             if not os.path.exists(backup_info.backup_path):
                 return False
 
+            if backup_info.blob_hash:
+                # Streams the blob and re-hashes it against its content address
+                return self._blob_store_for(backup_info.original_path).verify(backup_info.blob_hash)
+
             # Check file size
             actual_size = os.path.getsize(backup_info.backup_path)
             if actual_size != backup_info.size_bytes:
                 return False
 
-            # Verify JSON structure
+            # Legacy copy (no content hash): verify the JSON structure
             with open(backup_info.backup_path, 'r', encoding='utf-8') as f:
                 json.load(f)
 
@@ -0,0 +1,269 @@
+"""SQLite catalog of operation backup metadata.
+
+`EnhancedBackupManager.list_backups` used to `os.listdir` the ``metadata``
+directory and `json.load` every file on each call, and the latest-backup
+lookup, recovery listings and reports all went through it. `BackupIndex`
+keeps one row per backup in ``backups/backup_index.sqlite3``, indexed on
+timestamp and operation type, plus one row per backed-up file. Listing,
+``since_days`` filters, "latest backup" and per-operation statistics become
+index queries.
+
+Each file row also carries the delta-chain version the backup points at (from
+the backup's ``backup_entries.json``), so chain retention can find the oldest
+version still in use without opening every backup.
+
+The metadata JSON files stay the source of truth. Each row records the size
+and mtime of the metadata file it was read from; on open the index is rebuilt
+from them when it is missing, or when any metadata file was added, removed or
+rewritten behind its back (e.g. backups made by an older build). `reindex()`
+rebuilds it on demand.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "backup_index.sqlite3"
+_SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    backup_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    epoch REAL NOT NULL,
+    operation_type TEXT NOT NULL,
+    total_size_bytes INTEGER NOT NULL DEFAULT 0,
+    file_count INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT NOT NULL,
+    source_size INTEGER,
+    source_mtime_ns INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_backups_timestamp ON backups (timestamp);
+CREATE INDEX IF NOT EXISTS idx_backups_epoch ON backups (epoch);
+CREATE INDEX IF NOT EXISTS idx_backups_operation ON backups (operation_type, timestamp);
+CREATE TABLE IF NOT EXISTS backup_files (
+    backup_id TEXT NOT NULL REFERENCES backups (backup_id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    history_version INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_backup_files_path ON backup_files (path);
+CREATE INDEX IF NOT EXISTS idx_backup_files_backup ON backup_files (backup_id);
+"""
+
+
+def timestamp_epoch(timestamp: str) -> float:
+    """Seconds since the epoch for a ``YYYYmmdd_HHMMSS[...]`` backup timestamp (0 when unparseable)."""
+    try:
+        return time.mktime(time.strptime(timestamp[:15], "%Y%m%d_%H%M%S"))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class BackupIndex:
+    """Thread-safe SQLite index of backup metadata dicts (as written to ``metadata/<id>.json``)."""
+
+    def __init__(self, backup_root: str, metadata_dir: str, entries_dir: Optional[str] = None):
+        self.path = os.path.join(backup_root, INDEX_FILE)
+        self.metadata_dir = metadata_dir
+        self.entries_dir = entries_dir
+        os.makedirs(backup_root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            # Older layout: drop it, the rebuild below repopulates from metadata/
+            self._conn.executescript("DROP TABLE IF EXISTS backup_files; DROP TABLE IF EXISTS backups;")
+        self._conn.executescript(_SCHEMA)
+        if self._needs_rebuild():
+            self.reindex()
+
+    def _source_stats(self) -> Dict[str, Tuple[int, int]]:
+        """backup_id -> (size, mtime_ns) of every metadata file on disk."""
+        stats: Dict[str, Tuple[int, int]] = {}
+        try:
+            with os.scandir(self.metadata_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        stats[entry.name[:-5]] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+        return stats
+
+    def _source_stat(self, backup_id: str) -> Tuple[Optional[int], Optional[int]]:
+        try:
+            st = os.stat(os.path.join(self.metadata_dir, f"{backup_id}.json"))
+            return st.st_size, st.st_mtime_ns
+        except OSError:
+            return None, None
+
+    def _needs_rebuild(self) -> bool:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            return True
+        with self._lock:
+            rows = self._conn.execute("SELECT backup_id, source_size, source_mtime_ns FROM backups").fetchall()
+        return {bid: (size, mtime) for bid, size, mtime in rows} != self._source_stats()
+
+    def _read_entries(self, backup_id: str) -> Optional[List[Dict[str, Any]]]:
+        if not self.entries_dir:
+            return None
+        try:
+            with open(os.path.join(self.entries_dir, backup_id, "backup_entries.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _insert(self, backup_id: str, metadata: Dict[str, Any],
+                entries: Optional[List[Dict[str, Any]]] = None) -> None:
+        files = list(metadata.get("files_backed_up") or [])
+        versions = {e.get("original_path"): e.get("history_version") for e in entries or () if isinstance(e, dict)}
+        timestamp = str(metadata.get("timestamp") or "")
+        source_size, source_mtime_ns = self._source_stat(backup_id)
+        self._conn.execute("DELETE FROM backups WHERE backup_id = ?", (backup_id,))
+        self._conn.execute(
+            "INSERT INTO backups (backup_id, timestamp, epoch, operation_type, total_size_bytes, file_count, metadata,"
+            " source_size, source_mtime_ns) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (backup_id, timestamp, timestamp_epoch(timestamp), str(metadata.get("operation_type") or ""),
+             int(metadata.get("total_size_bytes") or 0), len(files),
+             json.dumps(metadata, ensure_ascii=False, separators=(",", ":")), source_size, source_mtime_ns),
+        )
+        self._conn.executemany("INSERT INTO backup_files (backup_id, path, history_version) VALUES (?, ?, ?)",
+                               [(backup_id, p, versions.get(p)) for p in files])
+
+    def add(self, backup_id: str, metadata: Dict[str, Any],
+            entries: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Index a backup; `entries` are its ``backup_entries.json`` dicts (read from disk when omitted)."""
+        if entries is None:
+            entries = self._read_entries(backup_id)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._insert(backup_id, metadata, entries)
+
+    def remove(self, backup_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM backups WHERE backup_id = ?", (backup_id,))
+
+    def reindex(self) -> int:
+        """Rebuild the index from the metadata directory. Returns the number of backups indexed."""
+        rows = []
+        if os.path.isdir(self.metadata_dir):
+            for name in os.listdir(self.metadata_dir):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.metadata_dir, name), "r", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                    rows.append((name[:-5], metadata, self._read_entries(name[:-5])))
+                except Exception as e:
+                    logger.warning(f"Could not index backup metadata {name}: {e}")
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM backups")
+            for backup_id, metadata, entries in rows:
+                self._insert(backup_id, metadata, entries)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        logger.info(f"Indexed {len(rows)} backups in {self.path}")
+        return len(rows)
+
+    @staticmethod
+    def _where(operation_type: Optional[str], since_epoch: Optional[float],
+               file_path: Optional[str]) -> tuple:
+        clauses, params = [], []
+        if operation_type:
+            clauses.append("operation_type = ?")
+            params.append(operation_type)
+        if since_epoch is not None:
+            clauses.append("epoch >= ?")
+            params.append(since_epoch)
+        if file_path:
+            clauses.append("backup_id IN (SELECT backup_id FROM backup_files WHERE path = ?)")
+            params.append(file_path)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, operation_type: Optional[str] = None, since_epoch: Optional[float] = None,
+              file_path: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Metadata dicts matching the filters, newest first."""
+        where, params = self._where(operation_type, since_epoch, file_path)
+        sql = f"SELECT metadata FROM backups{where} ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count(self, operation_type: Optional[str] = None, since_epoch: Optional[float] = None) -> int:
+        where, params = self._where(operation_type, since_epoch, None)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM backups{where}", params).fetchone()[0]
+
+    def oldest_ids(self, before_epoch: float, keep_newest: int) -> List[str]:
+        """Ids older than `before_epoch`, oldest first, never touching the `keep_newest` most recent."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT backup_id FROM backups WHERE epoch > 0 AND epoch < ? AND backup_id NOT IN"
+                " (SELECT backup_id FROM backups ORDER BY timestamp DESC LIMIT ?) ORDER BY timestamp",
+                (before_epoch, max(0, int(keep_newest))),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def history_floors(self) -> Dict[str, int]:
+        """Oldest delta-chain version still referenced by a backup, per backed-up file path."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, MIN(history_version) FROM backup_files"
+                " WHERE history_version IS NOT NULL GROUP BY path"
+            ).fetchall()
+        return {path: int(v) for path, v in rows}
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals and per-operation statistics computed in SQL."""
+        with self._lock:
+            total, size, files, latest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(total_size_bytes), 0), COALESCE(SUM(file_count), 0), MAX(timestamp)"
+                " FROM backups"
+            ).fetchone()
+            per_op = self._conn.execute(
+                "SELECT operation_type, COUNT(*), COALESCE(SUM(total_size_bytes), 0), MAX(timestamp)"
+                " FROM backups GROUP BY operation_type"
+            ).fetchall()
+        return {
+            "total_backups": total,
+            "total_size_bytes": size,
+            "total_files_backed_up": files,
+            "latest_timestamp": latest,
+            "operation_statistics": {
+                op: {"count": n, "total_size_bytes": s, "latest_timestamp": ts} for op, n, s, ts in per_op
+            },
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_INDEXES: Dict[str, BackupIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_backup_index(backup_root: str, metadata_dir: str, entries_dir: Optional[str] = None) -> BackupIndex:
+    """Shared index for a ``backups`` directory (one connection per path per process)."""
+    key = os.path.abspath(backup_root)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = BackupIndex(key, metadata_dir, entries_dir)
+        return index
@@ -0,0 +1,419 @@
+"""Content-addressed, deduplicating blob store for save backups.
+
+Operation backups, atomic-save backups and `Editor.backup_all` snapshots used
+to copy the whole `trainer.json` / `slot N.json` every time, so an editing
+session left hundreds of near-identical files behind. Backups now store file
+contents once under ``saves/<user>/backups/objects/<aa>/<sha256>``, keyed by the
+SHA-256 of the uncompressed bytes, and backup records keep only the hash.
+Backing up content that is already stored costs one hash and no write; the
+blob's mtime is refreshed so age-based pruning treats it as recent.
+
+Each blob starts with a one-byte codec tag (raw, zlib, zstd), so blobs written
+under any `BACKUP_COMPRESSION` setting stay readable. zstd needs the optional
+``zstandard`` package and falls back to zlib when it is missing.
+
+`Editor.backup_all` snapshot folders hold a ``manifest.json`` (file name ->
+hash) instead of the files themselves; `read_backup_file()` and
+`load_backup_json()` read both that layout and legacy folders of plain files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from .config import BACKUP_COMPRESSION
+
+try:  # optional zstd codec; zlib is used when absent
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_DIR = "objects"
+SNAPSHOT_MANIFEST = "manifest.json"
+# `Editor.backup_all` folder names; everything else under ``backups/`` (objects,
+# history, operations, ...) is internal storage and must never be offered as a backup
+SNAPSHOT_DIR_RE = re.compile(r"^\d{8}_\d{6}$")
+
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+_CODEC_NAMES = {"none": _CODEC_RAW, "raw": _CODEC_RAW, "zlib": _CODEC_ZLIB, "zstd": _CODEC_ZSTD}
+
+_CHUNK = 1 << 16
+
+CHECKSUM_SUFFIX = ".sha256"
+
+# Unreferenced blobs younger than this are never pruned (their backup record may still be in flight)
+_PRUNE_GRACE_SECONDS = 3600
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_hashed(f: BinaryIO, data: bytes) -> str:
+    """Write `data` to `f` in chunks, hashing each chunk as it goes out. Returns the SHA-256."""
+    h = hashlib.sha256()
+    view = memoryview(data)
+    for start in range(0, len(view), _CHUNK):
+        chunk = view[start:start + _CHUNK]
+        h.update(chunk)
+        f.write(chunk)
+    return h.hexdigest()
+
+
+# --- Checksum sidecars (``<file>.sha256``: "<hex digest> <size>") ---
+#
+# Every writer of a save file either records the checksum once the file is in
+# place (`atomic_write_bytes(..., checksum=True)`, `write_checksum`) or drops it
+# (`discard_checksum`), so a mismatch means the file changed outside those paths.
+
+def checksum_path(file_path: str) -> str:
+    return file_path + CHECKSUM_SUFFIX
+
+
+def write_checksum(file_path: str, digest: str, size: int) -> None:
+    atomic_write_bytes(checksum_path(file_path), f"{digest} {size}\n".encode("ascii"))
+
+
+def discard_checksum(file_path: str) -> None:
+    """Remove the sidecar of a file rewritten without one."""
+    try:
+        os.remove(checksum_path(file_path))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove checksum for {file_path}: {e}")
+
+
+def read_checksum(file_path: str) -> Optional[Tuple[str, int]]:
+    """(digest, size) recorded next to `file_path`, or None when there is no readable sidecar."""
+    try:
+        with open(checksum_path(file_path), "r", encoding="ascii") as f:
+            digest, size = f.read().split()
+        return digest, int(size)
+    except (OSError, ValueError):
+        return None
+
+
+def verify_checksum(file_path: str) -> Optional[bool]:
+    """Re-hash `file_path` in chunks against its sidecar; None when no checksum was recorded."""
+    recorded = read_checksum(file_path)
+    if recorded is None:
+        return None
+    digest, size = recorded
+    try:
+        return os.path.getsize(file_path) == size and hash_file(file_path) == digest
+    except OSError:
+        return False
+
+
+def _encode(data: bytes, codec: int) -> bytes:
+    if codec == _CODEC_ZSTD and _zstd is not None:
+        return bytes((_CODEC_ZSTD,)) + _zstd.ZstdCompressor(level=10).compress(data)
+    if codec in (_CODEC_ZLIB, _CODEC_ZSTD):
+        return bytes((_CODEC_ZLIB,)) + zlib.compress(data, 6)
+    return bytes((_CODEC_RAW,)) + data
+
+
+def _decode(blob: bytes) -> bytes:
+    if not blob:
+        raise ValueError("empty blob")
+    codec, body = blob[0], blob[1:]
+    if codec == _CODEC_RAW:
+        return body
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(body)
+    if codec == _CODEC_ZSTD:
+        if _zstd is None:
+            raise RuntimeError("Blob is zstd-compressed but the zstandard package is not installed")
+        return _zstd.ZstdDecompressor().decompress(body)
+    raise ValueError(f"unknown blob codec {codec}")
+
+
+def _decoded_chunks(path: str) -> Iterator[bytes]:
+    """Stream a blob's uncompressed content without holding it all in memory."""
+    with open(path, "rb") as f:
+        head = f.read(1)
+        if not head:
+            raise ValueError("empty blob")
+        codec = head[0]
+        if codec == _CODEC_RAW:
+            decoder = None
+        elif codec == _CODEC_ZLIB:
+            decoder = zlib.decompressobj()
+        elif codec == _CODEC_ZSTD:
+            if _zstd is None:
+                raise RuntimeError("Blob is zstd-compressed but the zstandard package is not installed")
+            decoder = _zstd.ZstdDecompressor().decompressobj()
+        else:
+            raise ValueError(f"unknown blob codec {codec}")
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            yield decoder.decompress(chunk) if decoder is not None else chunk
+        if codec == _CODEC_ZLIB:
+            tail = decoder.flush()
+            if not decoder.eof:
+                raise ValueError("truncated zlib blob")
+            yield tail
+
+
+def atomic_write_bytes(path: str, data: bytes, checksum: bool = False) -> None:
+    """Write `data` to `path` via a temp file in the same directory and os.replace.
+
+    With `checksum`, the ``<path>.sha256`` sidecar is rewritten to match (for save files).
+    """
+    parent = os.path.dirname(path) or "."
+    os.makedirs(parent, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".blob_", suffix=".tmp", dir=parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if checksum:
+        try:
+            write_checksum(path, hash_bytes(data), len(data))
+        except OSError as e:
+            logger.warning(f"Could not write checksum for {path}: {e}")
+            discard_checksum(path)
+
+
+class BlobStore:
+    """Hash-addressed blob directory (``<backup_root>/objects``). Thread-safe for concurrent puts."""
+
+    def __init__(self, backup_root: str, compression: Optional[str] = None):
+        self.backup_root = backup_root
+        self.root = os.path.join(backup_root, OBJECTS_DIR)
+        self.codec = _CODEC_NAMES.get((compression or BACKUP_COMPRESSION).lower(), _CODEC_ZLIB)
+        self._lock = threading.Lock()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def has(self, digest: Optional[str]) -> bool:
+        return bool(digest) and os.path.exists(self.path_for(digest))
+
+    def put_bytes(self, data: bytes) -> str:
+        """Store `data` and return its hash. No write happens if the blob already exists."""
+        digest = hash_bytes(data)
+        path = self.path_for(digest)
+        with self._lock:
+            if os.path.exists(path):
+                try:
+                    os.utime(path, None)
+                    return digest
+                except FileNotFoundError:
+                    pass  # Removed by another process in between; write it again
+                except OSError:
+                    return digest
+            atomic_write_bytes(path, _encode(data, self.codec))
+        return digest
+
+    def put_file(self, file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return self.put_bytes(f.read())
+
+    def get_bytes(self, digest: str, verify: bool = True) -> bytes:
+        """Uncompressed content of a blob. Raises FileNotFoundError / RuntimeError on missing or bad blobs."""
+        with open(self.path_for(digest), "rb") as f:
+            data = _decode(f.read())
+        if verify and hash_bytes(data) != digest:
+            raise RuntimeError(f"Blob {digest[:12]} failed hash verification")
+        return data
+
+    def restore_to(self, digest: str, dest_path: str) -> int:
+        """Atomically write a blob's content to `dest_path`. Returns the number of bytes written."""
+        data = self.get_bytes(digest)
+        atomic_write_bytes(dest_path, data, checksum=True)
+        return len(data)
+
+    def verify(self, digest: Optional[str]) -> bool:
+        """Re-hash a blob's decoded content chunk by chunk against its name."""
+        if not self.has(digest):
+            return False
+        try:
+            h = hashlib.sha256()
+            for chunk in _decoded_chunks(self.path_for(digest)):
+                h.update(chunk)
+            return h.hexdigest() == digest
+        except Exception:
+            return False
+
+    def iter_digests(self) -> Iterator[str]:
+        if not os.path.isdir(self.root):
+            return
+        for bucket in os.listdir(self.root):
+            bucket_dir = os.path.join(self.root, bucket)
+            if len(bucket) != 2 or not os.path.isdir(bucket_dir):
+                continue
+            for name in os.listdir(bucket_dir):
+                if name.startswith(bucket) and not name.endswith(".tmp"):
+                    yield name
+
+    def prune(self, live: Set[str], older_than_days: Optional[float] = None) -> int:
+        """Delete blobs not in `live` (and, if given, untouched for `older_than_days`). Returns the count.
+
+        Each blob is re-checked and removed under the store lock, so a concurrent
+        `put_bytes` that finds the blob (and refreshes its mtime) either sees it
+        deleted and rewrites it, or keeps it alive. Blobs touched within the last
+        `_PRUNE_GRACE_SECONDS` are always kept, since a backup may have stored its
+        content but not yet written the record that references it.
+        """
+        age = older_than_days * 86400 if older_than_days is not None else 0
+        cutoff = time.time() - max(age, _PRUNE_GRACE_SECONDS)
+        removed = 0
+        for digest in list(self.iter_digests()):
+            if digest in live:
+                continue
+            path = self.path_for(digest)
+            with self._lock:
+                try:
+                    if not os.path.exists(path) or os.path.getmtime(path) >= cutoff:
+                        continue
+                    os.remove(path)
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove backup blob {digest[:12]}: {e}")
+        if removed:
+            logger.info(f"Pruned {removed} unreferenced backup blobs")
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        count = stored = 0
+        for digest in self.iter_digests():
+            try:
+                stored += os.path.getsize(self.path_for(digest))
+                count += 1
+            except OSError:
+                continue
+        return {"objects": count, "stored_bytes": stored}
+
+
+_STORES: Dict[str, BlobStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_blob_store(backup_root: str) -> BlobStore:
+    """Shared store for a ``backups`` directory (one instance per path per process)."""
+    key = os.path.abspath(backup_root)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = BlobStore(key)
+        return store
+
+
+def get_user_blob_store(username: str) -> BlobStore:
+    from .utils import user_save_dir
+    return get_blob_store(os.path.join(user_save_dir(username), "backups"))
+
+
+# --- Snapshot folders (Editor.backup_all) ---
+
+def list_snapshot_dirs(backup_root: str) -> List[str]:
+    """Names of the timestamped snapshot folders under `backup_root`, oldest first."""
+    if not os.path.isdir(backup_root):
+        return []
+    return sorted(d for d in os.listdir(backup_root)
+                  if SNAPSHOT_DIR_RE.match(d) and os.path.isdir(os.path.join(backup_root, d)))
+
+
+def write_snapshot(backup_dir: str, files: Dict[str, bytes]) -> Dict[str, str]:
+    """Store `files` (name -> content) as blobs and write the folder's manifest. Returns name -> hash."""
+    store = get_blob_store(os.path.dirname(os.path.abspath(backup_dir)))
+    entries = {name: {"hash": store.put_bytes(data), "size": len(data)} for name, data in files.items()}
+    manifest = {"version": 1, "files": entries}
+    atomic_write_bytes(os.path.join(backup_dir, SNAPSHOT_MANIFEST),
+                       json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    return {name: e["hash"] for name, e in entries.items()}
+
+
+def read_snapshot_manifest(backup_dir: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    path = os.path.join(backup_dir, SNAPSHOT_MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return (json.load(f) or {}).get("files") or {}
+
+
+def read_backup_file(backup_dir: str, name: str) -> Optional[bytes]:
+    """Content of `name` in a snapshot folder (manifest or legacy plain file); None when absent."""
+    manifest = read_snapshot_manifest(backup_dir)
+    if manifest is not None and name in manifest:
+        store = get_blob_store(os.path.dirname(os.path.abspath(backup_dir)))
+        return store.get_bytes(manifest[name]["hash"])
+    path = os.path.join(backup_dir, name)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    return None
+
+
+def load_backup_json(backup_dir: str, name: str) -> Optional[Any]:
+    data = read_backup_file(backup_dir, name)
+    return json.loads(data.decode("utf-8")) if data is not None else None
+
+
+def backup_file_exists(backup_dir: str, name: str) -> bool:
+    try:
+        manifest = read_snapshot_manifest(backup_dir)
+    except Exception:
+        manifest = None
+    if manifest is not None and name in manifest:
+        return True
+    return os.path.exists(os.path.join(backup_dir, name))
+
+
+def referenced_digests(backup_root: str) -> Set[str]:
+    """Hashes referenced by operation backups and snapshot folders under `backup_root`."""
+    live: Set[str] = set()
+    ops_dir = os.path.join(backup_root, "operations")
+    if os.path.isdir(ops_dir):
+        for backup_id in os.listdir(ops_dir):
+            entries_path = os.path.join(ops_dir, backup_id, "backup_entries.json")
+            try:
+                with open(entries_path, "r", encoding="utf-8") as f:
+                    live.update(e.get("blob_hash") for e in json.load(f) if e.get("blob_hash"))
+            except (OSError, ValueError, AttributeError):
+                continue
+    for name in list_snapshot_dirs(backup_root):
+        try:
+            manifest = read_snapshot_manifest(os.path.join(backup_root, name))
+        except (OSError, ValueError):
+            continue
+        if manifest:
+            live.update(e.get("hash") for e in manifest.values() if e.get("hash"))
+    return live
+
+
+def encode_snapshot_json(data: Any) -> bytes:
+    """Serialize a save payload the same way `utils.dump_json` writes it to disk."""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
@@ -1,34 +1,29 @@
 from __future__ import annotations
 
-import json
 import os
 from typing import Optional, Dict, Any
 
-_BASE_CACHE: Optional[Dict[str, Any]] = None
-_NAME_INDEX: Optional[Dict[str, list[int]]] = None
-
+from .catalog_bundle import load_json_data
+from .catalog_registry import get_catalog_registry
 from .utils import repo_path
 
 
 DATA_BASE_STATS_JSON = repo_path("data", "base_stats.json")
 
+_CATALOGS = get_catalog_registry()
+
 
+@_CATALOGS.catalog("base_stats")
 def load_base_stats_catalog() -> Dict[str, Any]:
-    """Load base stats catalog built from the spreadsheet.
+    """Load base stats catalog built from the spreadsheet (cached in the catalog registry).
 
     Returns the JSON dict with keys:
       - by_dex: { dex_str: { name, stats [HP,Atk,Def,SpA,SpD,Spe], total, source } }
       - source: metadata
     """
-    global _BASE_CACHE
-    if _BASE_CACHE is not None:
-        return _BASE_CACHE
     if not os.path.exists(DATA_BASE_STATS_JSON):
-        _BASE_CACHE = {"by_dex": {}, "source": {}}
-        return _BASE_CACHE
-    with open(DATA_BASE_STATS_JSON, "r", encoding="utf-8") as f:
-        _BASE_CACHE = json.load(f)
-    return _BASE_CACHE
+        return {"by_dex": {}, "source": {}}
+    return load_json_data(DATA_BASE_STATS_JSON)
 
 
 def get_base_stats_by_species_id(dex_id: int) -> Optional[list[int]]:
@@ -58,21 +53,24 @@ def get_base_stats_by_name(name: str) -> Optional[list[int]]:
     This provides a secondary path if dex id matching fails. It builds an
     index of normalized species names -> stats on first use.
     """
-    global _NAME_INDEX
-    data = load_base_stats_catalog()
-    by_dex = data.get("by_dex") or {}
-    if _NAME_INDEX is None:
-        idx: Dict[str, list[int]] = {}
-        for _dex, entry in by_dex.items():
-            try:
-                nm = str(entry.get("name") or "")
-                stats = entry.get("stats")
-                if isinstance(stats, list) and len(stats) == 6 and nm:
-                    idx[_norm_name(nm)] = [int(x) for x in stats]
-            except Exception:
-                continue
-        _NAME_INDEX = idx
+    index = _base_stats_name_index()
     key = _norm_name(str(name or ""))
-    if key and _NAME_INDEX and key in _NAME_INDEX:
-        return list(_NAME_INDEX[key])
+    if key and key in index:
+        return list(index[key])
     return None
+
+
+@_CATALOGS.catalog("base_stats_name_index")
+def _base_stats_name_index() -> Dict[str, list[int]]:
+    """Normalized species name -> base stats, derived from `load_base_stats_catalog`."""
+    by_dex = load_base_stats_catalog().get("by_dex") or {}
+    idx: Dict[str, list[int]] = {}
+    for _dex, entry in by_dex.items():
+        try:
+            nm = str(entry.get("name") or "")
+            stats = entry.get("stats")
+            if isinstance(stats, list) and len(stats) == 6 and nm:
+                idx[_norm_name(nm)] = [int(x) for x in stats]
+        except Exception:
+            continue
+    return idx
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import io
 import json
 import os
 import re
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import glob
 import csv
 
+from .catalog_bundle import load_json_data, refresh_catalog_bundle_if_stale
+from .catalog_registry import ReadOnlyDict as _ReadOnlyDict, get_catalog_registry
+from .move_table import MoveTable, ppup_bounds
+from .pokemon_index import get_pokemon_catalog_index, reset_pokemon_catalog_index
 from .utils import repo_path
 
+# Every load_* below is registered here; see catalog_registry for the single-flight semantics.
+# Catalogs that used to be rebuilt on every call are registered read_only, since callers now share them.
+_CATALOGS = get_catalog_registry()
+
 
 DATA_MOVES_JSON = repo_path("data", "moves.json")
 DATA_MOVES_DATA_JSON = repo_path("data", "moves_data.json")
@@ -100,57 +111,45 @@ def _parse_ts_enum(path: str) -> Dict[str, int]:
     return enum
 
 
+@_CATALOGS.catalog("move_catalog")
 def load_move_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
-    """Load move catalog with caching to prevent repeated file I/O operations."""
-    global _MOVE_CATALOG_CACHE
-    if isinstance(_MOVE_CATALOG_CACHE, tuple):
-        return _MOVE_CATALOG_CACHE
-
+    """Load move catalog (cached in the catalog registry)."""
     # Prefer clean JSON in data dir
     if os.path.exists(DATA_MOVES_JSON):
-        with open(DATA_MOVES_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(DATA_MOVES_JSON)
         nti = {k.lower(): int(v) for k, v in data.get("name_to_id", {}).items()}
         itn = {int(k): v for k, v in data.get("id_to_name", {}).items()}
-        _MOVE_CATALOG_CACHE = (nti, itn)
-        return _MOVE_CATALOG_CACHE
+        return nti, itn
 
     # Fallback to tmpServerFiles parse (for local development)
     ts_path = repo_path("..", "tmpServerFiles", "GameData", "move-id.ts")
     enum = _parse_ts_enum(ts_path)
     name_to_id = {k.lower(): v for k, v in enum.items()}
     id_to_name = {v: k for k, v in enum.items()}
-    _MOVE_CATALOG_CACHE = (name_to_id, id_to_name)
-    return _MOVE_CATALOG_CACHE
+    return name_to_id, id_to_name
 
 
+@_CATALOGS.catalog("ability_catalog")
 def load_ability_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
-    """Load ability catalog with caching to prevent repeated file I/O operations."""
-    global _ABILITY_CATALOG_CACHE
-    if isinstance(_ABILITY_CATALOG_CACHE, tuple):
-        return _ABILITY_CATALOG_CACHE
-
+    """Load ability catalog (cached in the catalog registry)."""
     if os.path.exists(DATA_ABILITIES_JSON):
-        with open(DATA_ABILITIES_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(DATA_ABILITIES_JSON)
         nti = {k.lower(): int(v) for k, v in data.get("name_to_id", {}).items()}
         itn = {int(k): v for k, v in data.get("id_to_name", {}).items()}
-        _ABILITY_CATALOG_CACHE = (nti, itn)
-        return _ABILITY_CATALOG_CACHE
+        return nti, itn
 
     ts_path = repo_path("..", "tmpServerFiles", "GameData", "ability-id.ts")
     enum = _parse_ts_enum(ts_path)
     name_to_id = {k.lower(): v for k, v in enum.items()}
     id_to_name = {v: k for k, v in enum.items()}
-    _ABILITY_CATALOG_CACHE = (name_to_id, id_to_name)
-    return _ABILITY_CATALOG_CACHE
+    return name_to_id, id_to_name
 
 
+@_CATALOGS.catalog("ability_attr_mask", read_only=True)
 def load_ability_attr_mask() -> Dict[str, int]:
     # ABILITY_1, ABILITY_2, ABILITY_HIDDEN
     if os.path.exists(DATA_ABILITY_ATTR_JSON):
-        with open(DATA_ABILITY_ATTR_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(DATA_ABILITY_ATTR_JSON)
         return {k.lower(): int(v) for k, v in data.items()}
     ts_path = repo_path("..", "tmpServerFiles", "GameData", "ability-attr.ts")
     mask: Dict[str, int] = {}
@@ -260,11 +259,13 @@ def build_clean_catalogs_from_tmp() -> None:
             with open(DATA_ITEMS_JSON, "w", encoding="utf-8") as f:
                 json.dump({"name_to_id": nti, "id_to_name": {str(k): v for k, v in itn.items()}}, f, ensure_ascii=False, indent=2)
 
+    # Freshly written JSON must win over anything parsed before
+    _CATALOGS.invalidate()
+
 
 def load_generic_catalog(json_path: str, tmp_rel: str) -> Tuple[Dict[str, int], Dict[int, str]]:
     if os.path.exists(json_path):
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(json_path)
         nti = {k.lower(): int(v) for k, v in data.get("name_to_id", {}).items()}
         itn = {int(k): v for k, v in data.get("id_to_name", {}).items()}
         return nti, itn
@@ -274,41 +275,42 @@ def load_generic_catalog(json_path: str, tmp_rel: str) -> Tuple[Dict[str, int],
     return nti, itn
 
 
+@_CATALOGS.catalog("nature_catalog")
 def load_nature_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
-    """Load nature catalog with caching to prevent repeated file I/O operations."""
-    global _NATURE_CATALOG_CACHE
-    if isinstance(_NATURE_CATALOG_CACHE, tuple):
-        return _NATURE_CATALOG_CACHE
-
-    _NATURE_CATALOG_CACHE = load_generic_catalog(DATA_NATURES_JSON, "nature.ts")
-    return _NATURE_CATALOG_CACHE
+    """Load nature catalog (cached in the catalog registry)."""
+    return load_generic_catalog(DATA_NATURES_JSON, "nature.ts")
 
 
+@_CATALOGS.catalog("weather_catalog", read_only=True)
 def load_weather_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return load_generic_catalog(DATA_WEATHER_JSON, "weather-type.ts")
 
 
+@_CATALOGS.catalog("stat_catalog", read_only=True)
 def load_stat_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return load_generic_catalog(DATA_STATS_JSON, "stat.ts")
 
 
+@_CATALOGS.catalog("modifier_catalog", read_only=True)
 def load_modifier_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return load_generic_catalog(DATA_MODIFIERS_JSON, "modifier-type.ts")
 
 
+@_CATALOGS.catalog("berry_catalog", read_only=True)
 def load_berry_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return load_generic_catalog(DATA_BERRIES_JSON, "berry-type.ts")
 
 
+@_CATALOGS.catalog("item_catalog", read_only=True)
 def load_item_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return load_generic_catalog(DATA_ITEMS_JSON, "item-id.ts")
 
 
+@_CATALOGS.catalog("type_matrix_v2", read_only=True)
 def load_type_matrix_v2() -> Dict:
     """Load the type effectiveness matrix from type_matrix_v2.json."""
     try:
-        with open(DATA_TYPE_MATRIX_V2_JSON, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json_data(DATA_TYPE_MATRIX_V2_JSON)
     except Exception as e:
         print(f"Error loading type matrix v2: {e}")
         return {}
@@ -320,11 +322,11 @@ def _ts_path2(*parts: str) -> str:
     return repo_path("..", "TmpServerFiles", "GameData", "2", *parts)
 
 
+@_CATALOGS.catalog("pokeball_catalog", read_only=True)
 def load_pokeball_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     # PokeballType enum (0-based)
     if os.path.exists(DATA_POKEBALLS_JSON):
-        with open(DATA_POKEBALLS_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(DATA_POKEBALLS_JSON)
         nti = {k.lower(): int(v) for k, v in data.get("name_to_id", {}).items()}
         itn = {int(k): v for k, v in data.get("id_to_name", {}).items()}
         return nti, itn
@@ -338,11 +340,11 @@ def load_pokeball_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return nti, itn
 
 
+@_CATALOGS.catalog("types_catalog", read_only=True)
 def load_types_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     # PokemonType enum
     if os.path.exists(DATA_TYPES_JSON):
-        with open(DATA_TYPES_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(DATA_TYPES_JSON)
         nti = {k.lower(): int(v) for k, v in data.get("name_to_id", {}).items()}
         itn = {int(k): v for k, v in data.get("id_to_name", {}).items()}
         return nti, itn
@@ -495,7 +497,106 @@ def _parse_type_matrix_from_csv(csv_path: str) -> Dict[str, Dict[str, float]]:
     return matrix
 
 
+class TypeMatchups:
+    """Immutable type chart in both orientations plus a dense integer-indexed table.
+
+    ``table[a][d]`` is the multiplier of attacking type index ``a`` against defending
+    type index ``d``; ``types``/``index`` map between indices and lowercase type names.
+    ``attack_vs[att][def]`` and ``defense_from[def][att]`` are read-only dicts.
+    """
+
+    __slots__ = ("types", "index", "table", "attack_vs", "defense_from")
+
+    def __init__(self, types: Tuple[str, ...], table: Tuple[Tuple[float, ...], ...]):
+        self.types = types
+        self.index = _ReadOnlyDict((t, i) for i, t in enumerate(types))
+        self.table = table
+        self.attack_vs = _ReadOnlyDict(
+            (att, _ReadOnlyDict(zip(types, row))) for att, row in zip(types, table)
+        )
+        self.defense_from = _ReadOnlyDict(
+            (de, _ReadOnlyDict((att, table[a][d]) for a, att in enumerate(types)))
+            for d, de in enumerate(types)
+        )
+
+    @classmethod
+    def from_defense_matrix(cls, matrix: Dict[str, Dict[str, float]]) -> "TypeMatchups":
+        """Build from ``matrix[def_type][att_type]``; missing pairs default to 1.0."""
+        names: list[str] = []
+        for de, row in (matrix or {}).items():
+            for t in [de, *(row or {}).keys()]:
+                t = str(t).strip().lower()
+                if t and t not in names:
+                    names.append(t)
+        pos = {t: i for i, t in enumerate(names)}
+        grid = [[1.0] * len(names) for _ in names]
+        for de, row in (matrix or {}).items():
+            d = pos[str(de).strip().lower()]
+            for att, val in (row or {}).items():
+                try:
+                    grid[pos[str(att).strip().lower()]][d] = float(val)
+                except (TypeError, ValueError):
+                    pass
+        return cls(tuple(names), tuple(tuple(r) for r in grid))
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def index_of(self, type_name: Optional[str]) -> Optional[int]:
+        if not type_name:
+            return None
+        return self.index.get(str(type_name).strip().lower())
+
+    def multiplier(self, attack_type: str, defend_type: str) -> float:
+        """Effectiveness of one attacking type against one defending type (1.0 if unknown)."""
+        a = self.index_of(attack_type)
+        d = self.index_of(defend_type)
+        if a is None or d is None:
+            return 1.0
+        return self.table[a][d]
+
+    def against(self, attack_type: str, *defend_types: Optional[str]) -> float:
+        """Combined effectiveness of an attacking type against a (dual-)typed defender."""
+        a = self.index_of(attack_type)
+        if a is None:
+            return 1.0
+        row = self.table[a]
+        total = 1.0
+        for t in defend_types:
+            d = self.index_of(t)
+            if d is not None:
+                total *= row[d]
+        return total
+
+    def defensive_profile(self, *defend_types: Optional[str]) -> Dict[str, float]:
+        """attacking type -> combined multiplier against the given defender types."""
+        cols = [d for d in (self.index_of(t) for t in defend_types) if d is not None]
+        out: Dict[str, float] = {}
+        for a, att in enumerate(self.types):
+            row = self.table[a]
+            total = 1.0
+            for d in cols:
+                total *= row[d]
+            out[att] = total
+        return out
+
+
+@_CATALOGS.catalog("type_matchups")
+def load_type_matchups() -> TypeMatchups:
+    """Type chart parsed once per process (see `load_type_matchup_matrix` for the sources)."""
+    return TypeMatchups.from_defense_matrix(_build_type_matchup_matrix())
+
+
 def load_type_matchup_matrix() -> Dict[str, Dict[str, float]]:
+    """Defensive type matrix ``matrix[def_type][att_type] = multiplier``.
+
+    Backed by `load_type_matchups()`, so it is parsed once and shared; the returned
+    dict is read-only.
+    """
+    return load_type_matchups().defense_from
+
+
+def _build_type_matchup_matrix() -> Dict[str, Dict[str, float]]:
     """Load normalized type matchup matrix.
 
     Preference order:
@@ -507,8 +608,7 @@ def load_type_matchup_matrix() -> Dict[str, Dict[str, float]]:
     # 1) v2 JSON
     if os.path.exists(DATA_TYPE_MATRIX_V2_JSON):
         try:
-            with open(DATA_TYPE_MATRIX_V2_JSON, "r", encoding="utf-8") as f:
-                v2 = json.load(f)
+            v2 = load_type_matrix_v2()
             # Prefer defense_from if available; else invert attack_vs
             if isinstance(v2, dict):
                 if isinstance(v2.get("defense_from"), dict):
@@ -526,8 +626,7 @@ def load_type_matchup_matrix() -> Dict[str, Dict[str, float]]:
     # 2) legacy cached JSON
     if os.path.exists(DATA_TYPE_MATRIX_JSON):
         try:
-            with open(DATA_TYPE_MATRIX_JSON, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json_data(DATA_TYPE_MATRIX_JSON)
         except Exception:
             pass
     # 3) Legacy generation from CSV/TS
@@ -551,11 +650,11 @@ def load_type_matchup_matrix() -> Dict[str, Dict[str, float]]:
     return mat
 
 
+@_CATALOGS.catalog("exp_tables", read_only=True)
 def load_exp_tables() -> Dict[str, object]:
     # Returns { growth_names: [...], tables: [[...]*levels] }
     if os.path.exists(DATA_EXP_TABLES_JSON):
-        with open(DATA_EXP_TABLES_JSON, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_data(DATA_EXP_TABLES_JSON)
     path = _ts_path2("exp.ts")
     if not os.path.exists(path):
         return {"growth_names": [], "tables": []}
@@ -733,33 +832,22 @@ def _load_runtime_save_anchors() -> Dict[str, Dict[str, int]]:
     return anchors
 
 
-def _calibrated_extrapolation(tbl: list[int], growth_index: int, target_level: int) -> int:
-    """Extrapolate using quadratic, then scale to hit the nearest known anchor level for this growth group.
-
-    - Preserve table values (<= len(tbl)).
-    - Use `_extrapolate_exp_quadratic` as base.
-    - If validation anchors exist (e.g., level_188/190) beyond table, compute scale factor so that
-      exp at anchor matches the anchor when measured relative to the last known table breakpoint.
-    """
-    n = len(tbl)
-    if target_level <= n:
-        return int(tbl[target_level - 1])
-    base = int(tbl[-1]) if n else 0
-    base_pred = _extrapolate_exp_quadratic(tbl, target_level)
-    # Load anchors
+def _exp_anchors() -> Dict[str, Dict[str, int]]:
+    """Validation anchors merged with anchors observed in local saves (saves win for matching levels)."""
     anchors = _load_high_level_validation()
-    # Merge runtime anchors from saves (these win for matching levels)
     runtime = _load_runtime_save_anchors()
     for k, v in runtime.items():
         anchors.setdefault(k, {}).update({kk: int(vv) for kk, vv in v.items()})
+    return anchors
+
+
+def _anchor_points(anchors: Dict[str, Dict[str, int]], growth_index: int, n: int) -> list[Tuple[int, int]]:
+    """(level, exp) anchors above the table for a growth group, in file order."""
     gkey = _growth_name_key_for_index(growth_index)
     if not gkey or gkey not in anchors:
-        return base_pred
-    # Find the closest anchor level above n (prefer 188/190 if present)
-    gmap = anchors[gkey]
-    best_level = None
-    best_exp = None
-    for lk, lv in gmap.items():
+        return []
+    points: list[Tuple[int, int]] = []
+    for lk, lv in anchors[gkey].items():
         if not lk.startswith("level_"):
             continue
         try:
@@ -767,14 +855,23 @@ def _calibrated_extrapolation(tbl: list[int], growth_index: int, target_level: i
         except Exception:
             continue
         if L > n:
-            # choose the smallest anchor >= target if possible; else nearest above n
-            if best_level is None or abs(L - target_level) < abs(best_level - target_level):
-                best_level = L
-                best_exp = int(lv)
+            points.append((L, int(lv)))
+    return points
+
+
+def _calibrate(base: int, base_pred: int, target_level: int, points: list[Tuple[int, int]], quad) -> int:
+    """Scale a quadratic prediction so the curve passes through the anchor nearest `target_level`."""
+    best_level = None
+    best_exp = None
+    for L, lv in points:
+        # choose the smallest anchor >= target if possible; else nearest above n
+        if best_level is None or abs(L - target_level) < abs(best_level - target_level):
+            best_level = L
+            best_exp = lv
     if best_level is None or best_exp is None:
         return base_pred
     # Compute predicted at anchor using quadratic
-    pred_at_anchor = _extrapolate_exp_quadratic(tbl, best_level)
+    pred_at_anchor = quad(best_level)
     denom = max(1, pred_at_anchor - base)
     scale = (best_exp - base) / denom
     if scale <= 0:
@@ -783,88 +880,186 @@ def _calibrated_extrapolation(tbl: list[int], growth_index: int, target_level: i
     return int(base + scale * (base_pred - base))
 
 
+def _calibrated_extrapolation(tbl: list[int], growth_index: int, target_level: int,
+                              anchors: Optional[Dict[str, Dict[str, int]]] = None) -> int:
+    """Extrapolate using quadratic, then scale to hit the nearest known anchor level for this growth group.
+
+    - Preserve table values (<= len(tbl)).
+    - Use `_extrapolate_exp_quadratic` as base.
+    - If validation anchors exist (e.g., level_188/190) beyond table, compute scale factor so that
+      exp at anchor matches the anchor when measured relative to the last known table breakpoint.
+    """
+    n = len(tbl)
+    if target_level <= n:
+        return int(tbl[target_level - 1])
+    base = int(tbl[-1]) if n else 0
+    base_pred = _extrapolate_exp_quadratic(tbl, target_level)
+    points = _anchor_points(_exp_anchors() if anchors is None else anchors, growth_index, n)
+    return _calibrate(base, base_pred, target_level, points, lambda L: _extrapolate_exp_quadratic(tbl, L))
+
+
+# Levels above the last table breakpoint covered by the EXP engine (the old stepping cap)
+EXP_EXTRA_LEVELS = 10000
+
+
+class ExpEngine:
+    """Precomputed cumulative EXP curves with O(log n) level/EXP conversion.
+
+    Each growth group's curve holds the table breakpoints followed by
+    `EXP_EXTRA_LEVELS` levels of calibrated extrapolation, computed once in
+    O(levels) instead of re-deriving the quadratic (and re-reading anchors) for
+    every level. Lookups then bisect the curve; results match the previous
+    level-by-level stepping exactly.
+    """
+
+    def __init__(self, tables: list, anchors: Dict[str, Dict[str, int]], extra_levels: int = EXP_EXTRA_LEVELS):
+        self.extra_levels = extra_levels
+        self._tables: list[list[int]] = [[int(v) for v in (t or [])] for t in tables]
+        self._anchors = anchors
+        self._curves: list[list[int]] = []
+        self._monotone: list[bool] = []
+        for gi, tbl in enumerate(self._tables):
+            curve = self._build_curve(tbl, gi)
+            self._curves.append(curve)
+            self._monotone.append(all(a <= b for a, b in zip(curve, curve[1:])))
+
+    def _build_curve(self, tbl: list[int], growth_index: int) -> list[int]:
+        n = len(tbl)
+        if n == 0:
+            return []
+        points = _anchor_points(self._anchors, growth_index, n)
+        top = n + self.extra_levels
+        horizon = max([top] + [L for L, _ in points])
+        # Quadratic extension for levels n+1..horizon (quad[L - n - 1]), stepped like _extrapolate_exp_quadratic
+        quad: list[int] = []
+        if n < 3:
+            delta = tbl[-1] - tbl[-2] if n >= 2 else tbl[-1]
+            quad = [tbl[-1] + k * max(0, delta) for k in range(1, horizon - n + 1)]
+        else:
+            d2_const = (tbl[-1] - tbl[-2]) - (tbl[-2] - tbl[-3])
+            cur, d1 = tbl[-1], tbl[-1] - tbl[-2]
+            for _ in range(horizon - n):
+                d1 = max(0, d1 + d2_const)
+                cur += d1
+                quad.append(cur)
+
+        def quad_at(L: int) -> int:
+            return tbl[L - 1] if L <= n else quad[L - n - 1]
+
+        base = tbl[-1]
+        curve = list(tbl)
+        for L in range(n + 1, top + 1):
+            curve.append(_calibrate(base, quad_at(L), L, points, quad_at))
+        return curve
+
+    def table_length(self, growth_index: int) -> int:
+        if 0 <= growth_index < len(self._tables):
+            return len(self._tables[growth_index])
+        return 0
+
+    def exp_for_level(self, growth_index: int, level: int) -> int:
+        if level < 1:
+            level = 1
+        if not 0 <= growth_index < len(self._curves):
+            return 0
+        curve = self._curves[growth_index]
+        if not curve:
+            return 0
+        if level <= len(curve):
+            return curve[level - 1]
+        # Beyond the precomputed horizon: fall back to the direct model
+        return _calibrated_extrapolation(self._tables[growth_index], growth_index, level, self._anchors)
+
+    def level_from_exp(self, growth_index: int, exp: int) -> int:
+        if exp < 0:
+            exp = 0
+        if not 0 <= growth_index < len(self._curves):
+            return 1
+        tbl = self._tables[growth_index]
+        n = len(tbl)
+        if n == 0:
+            return 1
+        if exp <= tbl[-1]:
+            return max(1, bisect.bisect_right(tbl, exp))
+        if n < 3:
+            # linear fallback, uncapped as before
+            delta = tbl[-1] - tbl[-2] if n >= 2 else tbl[-1]
+            if delta <= 0:
+                return n
+            return n + max(0, (exp - tbl[-1]) // delta)
+        curve = self._curves[growth_index]
+        if self._monotone[growth_index]:
+            # number of extrapolated levels still <= exp
+            above = bisect.bisect_right(curve, exp, lo=n) - n
+        else:
+            above = 0
+            while above < self.extra_levels and curve[n + above] <= exp:
+                above += 1
+        return n + min(above, self.extra_levels - 1)
+
+    # --- Batch helpers ---
+    def exp_for_levels(self, pairs) -> list[int]:
+        """EXP for each (growth_index, level) pair."""
+        return [self.exp_for_level(int(g), int(lv)) for g, lv in pairs]
+
+    def levels_from_exp(self, pairs) -> list[int]:
+        """Level for each (growth_index, exp) pair."""
+        return [self.level_from_exp(int(g), int(e)) for g, e in pairs]
+
+    def party_levels(self, party: list, growth_map: Optional[Dict[int, int]] = None,
+                     default_growth: int = 0) -> list[Optional[int]]:
+        """Levels implied by each mon's ``exp`` (None for entries without species/exp)."""
+        gmap = load_growth_group_map() if growth_map is None else growth_map
+        out: list[Optional[int]] = []
+        for mon in party or []:
+            try:
+                species = int(mon.get("species"))
+                exp = int(mon.get("exp"))
+            except Exception:
+                out.append(None)
+                continue
+            out.append(self.level_from_exp(int(gmap.get(species, default_growth)), exp))
+        return out
+
+
+@_CATALOGS.catalog("exp_engine")
+def load_exp_engine() -> ExpEngine:
+    """EXP engine built from the exp tables and current anchors (cached in the catalog registry).
+
+    Anchors taken from local saves are read once per build; `invalidate_catalogs("exp_engine")`
+    picks up new ones.
+    """
+    return ExpEngine(load_exp_tables().get("tables") or [], _exp_anchors())
+
+
 def exp_for_level(growth_index: int, level: int) -> int:
     """Return cumulative EXP required for a given level.
 
     Behavior:
     - For levels within the parsed table, return the exact breakpoint.
-    - For levels above the table (e.g., >100), assume each subsequent level requires
-      the same EXP delta as the last known step (L_max - (L_max-1)).
-      This is an explicit assumption until official curves beyond 100 are provided.
+    - For levels above the table (e.g., >100), use the calibrated quadratic extrapolation
+      (see `_calibrated_extrapolation`), precomputed by the EXP engine.
     """
-    data = load_exp_tables()
-    tables = data.get("tables") or []
     try:
-        if level < 1:
-            level = 1
-        if 0 <= growth_index < len(tables):
-            tbl = tables[growth_index]
-            n = len(tbl)
-            if n == 0:
-                return 0
-            if level <= n:
-                return int(tbl[level - 1])
-            # beyond table: use quadratic (finite second-difference) extrapolation with calibration
-            return _calibrated_extrapolation(tbl, growth_index, level)
+        return load_exp_engine().exp_for_level(growth_index, level)
     except Exception:
-        pass
-    return 0
+        return 0
 
 
 def level_from_exp(growth_index: int, exp: int) -> int:
     """Return the floored level for a given cumulative EXP.
 
     - For EXP within the table, find last breakpoint <= EXP.
-    - For EXP beyond the last table entry, extend using the last delta per level.
+    - For EXP beyond the last table entry, invert the calibrated extrapolation.
+    Both are binary searches over the EXP engine's precomputed curve.
     """
-    data = load_exp_tables()
-    tables = data.get("tables") or []
     try:
-        if exp < 0:
-            exp = 0
-        if 0 <= growth_index < len(tables):
-            tbl = tables[growth_index]
-            n = len(tbl)
-            if n == 0:
-                return 1
-            # within table
-            lvl = 1
-            for i, bp in enumerate(tbl, start=1):
-                if exp >= bp:
-                    lvl = i
-                else:
-                    break
-            if exp <= tbl[-1]:
-                return int(lvl)
-            # beyond table: invert calibrated extrapolation by stepping forward
-            # starting from last known level using the same finite-difference model
-            try:
-                if n < 3:
-                    # linear fallback
-                    delta = int(tbl[-1]) - int(tbl[-2]) if n >= 2 else int(tbl[-1])
-                    if delta <= 0:
-                        return int(n)
-                    extra = exp - int(tbl[-1])
-                    add_levels = max(0, extra // delta)
-                    return int(n + add_levels)
-                # Use calibrated extrapolation step-by-step until exceeding exp
-                level = n
-                cur = int(tbl[-1])
-                cap_levels = 10000
-                steps = 0
-                while cur <= exp and steps < cap_levels:
-                    level += 1
-                    cur = _calibrated_extrapolation(tbl, growth_index, level)
-                    steps += 1
-                # If we stepped past, the level before crossing is the floored level
-                return max(n, level - 1)
-            except Exception:
-                return int(n)
+        return load_exp_engine().level_from_exp(growth_index, exp)
     except Exception:
-        pass
-    return 1
+        return 1
 
 
+@_CATALOGS.catalog("growth_group_map", read_only=True)
 def load_growth_group_map() -> Dict[int, int]:
     """Map dex id (int) -> growth index (int) using the CSV provided.
 
@@ -878,8 +1073,7 @@ def load_growth_group_map() -> Dict[int, int]:
     """
     if os.path.exists(DATA_GROWTH_MAP_JSON):
         try:
-            with open(DATA_GROWTH_MAP_JSON, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_data(DATA_GROWTH_MAP_JSON)
             # keys stored as str; convert to int
             return {int(k): int(v) for k, v in data.items()}
         except Exception:
@@ -981,11 +1175,11 @@ def _default_nature_effects() -> Dict[str, Dict[str, str]]:
     }
 
 
+@_CATALOGS.catalog("nature_effects", read_only=True)
 def load_nature_effects() -> Dict[str, Dict[str, str]]:
     # Returns mapping of nature name (lowercase, underscores) -> {up, down}
     if os.path.exists(DATA_NATURE_EFFECTS_JSON):
-        with open(DATA_NATURE_EFFECTS_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_data(DATA_NATURE_EFFECTS_JSON)
         # normalize keys
         out: Dict[str, Dict[str, str]] = {}
         for name, eff in data.items():
@@ -1021,32 +1215,57 @@ def nature_multipliers_by_id() -> Dict[int, list[float]]:
 
 
 # --- Pokemon catalog + type colors ---
+@_CATALOGS.catalog("pokemon_catalog")
 def load_pokemon_catalog() -> Dict[str, object]:
-    """Load Pokemon catalog with caching to prevent repeated file I/O operations."""
-    global _POKEMON_CATALOG_CACHE
-    if isinstance(_POKEMON_CATALOG_CACHE, dict):
-        return _POKEMON_CATALOG_CACHE
-
+    """Load Pokemon catalog (cached in the catalog registry)."""
     if not os.path.exists(DATA_POKEMON_CATALOG_JSON):
-        _POKEMON_CATALOG_CACHE = {}
-        return _POKEMON_CATALOG_CACHE
+        return {}
 
-    with open(DATA_POKEMON_CATALOG_JSON, "r", encoding="utf-8") as f:
-        _POKEMON_CATALOG_CACHE = json.load(f)
-    return _POKEMON_CATALOG_CACHE
+    return load_json_data(DATA_POKEMON_CATALOG_JSON)
 
 
-def load_type_colors() -> Dict[str, str]:
-    """Load type colors with caching to prevent repeated file I/O operations."""
-    global _TYPE_COLORS_CACHE
-    if isinstance(_TYPE_COLORS_CACHE, dict):
-        return _TYPE_COLORS_CACHE
+def load_pokemon_catalog_view() -> Dict[str, object]:
+    """Pokemon catalog shaped like `load_pokemon_catalog()` whose ``by_dex`` decodes on demand.
+
+    ``by_dex`` is a read-only Mapping backed by the memory-mapped index, so opening
+    a dialog no longer decodes the whole Pokedex. Falls back to the full catalog
+    when it is already loaded or the index is unavailable.
+    """
+    if _CATALOGS.peek("pokemon_catalog") is None:
+        idx = get_pokemon_catalog_index()
+        if idx is not None:
+            view: Dict[str, object] = idx.meta()
+            view["by_dex"] = idx.by_dex
+            return view
+    return load_pokemon_catalog()
+
 
+def get_pokemon_catalog_entry(dex_id) -> Optional[Dict[str, object]]:
+    """One ``by_dex`` entry of the Pokemon catalog, without decoding the whole Pokedex.
+
+    Served from the full catalog if something already loaded it, otherwise from the
+    memory-mapped index (see pokemon_index). The entry is shared; do not modify it.
+    """
+    try:
+        key = int(dex_id)
+    except (TypeError, ValueError):
+        return None
+    full = _CATALOGS.peek("pokemon_catalog")
+    if full is None:
+        idx = get_pokemon_catalog_index()
+        if idx is not None:
+            return idx.entry(key)
+        full = load_pokemon_catalog()
+    entry = (full.get("by_dex") or {}).get(str(key)) if isinstance(full, dict) else None
+    return entry if isinstance(entry, dict) else None
+
+
+@_CATALOGS.catalog("type_colors")
+def load_type_colors() -> Dict[str, str]:
+    """Load type colors (cached in the catalog registry)."""
     if os.path.exists(DATA_TYPE_COLORS_JSON):
         try:
-            with open(DATA_TYPE_COLORS_JSON, "r", encoding="utf-8") as f:
-                _TYPE_COLORS_CACHE = json.load(f)
-                return _TYPE_COLORS_CACHE
+            return load_json_data(DATA_TYPE_COLORS_JSON)
         except Exception:
             pass
 
@@ -1074,9 +1293,6 @@ def load_type_colors() -> Dict[str, str]:
         "unknown": "#AAAAAA",
     }
 
-    # Cache the default colors
-    _TYPE_COLORS_CACHE = default
-
     # Try to save defaults for next time
     try:
         os.makedirs(os.path.dirname(DATA_TYPE_COLORS_JSON), exist_ok=True)
@@ -1085,7 +1301,7 @@ def load_type_colors() -> Dict[str, str]:
     except Exception:
         pass
 
-    return _TYPE_COLORS_CACHE
+    return default
 
 
 def preload_all_catalogs(progress_callback=None):
@@ -1096,7 +1312,7 @@ def preload_all_catalogs(progress_callback=None):
                          to report loading progress
     """
     catalogs = [
-        ("Pokemon catalog", load_pokemon_catalog),
+        ("Pokemon index", get_pokemon_catalog_index),
         ("Type colors", load_type_colors),
         ("Move catalog", load_move_catalog),
         ("Ability catalog", load_ability_catalog),
@@ -1115,20 +1331,52 @@ def preload_all_catalogs(progress_callback=None):
             # Log error but continue loading other catalogs
             print(f"Warning: Failed to load {name}: {e}")
 
+    # Keep the compiled bundle in step with the JSON so the next launch skips parsing
+    try:
+        refresh_catalog_bundle_if_stale()
+    except Exception as e:
+        print(f"Warning: Failed to refresh catalog bundle: {e}")
+
     if progress_callback:
         progress_callback(total, total, "Cache loading complete!")
 
 
-# --- Unified moves data (moves_data.json) ---
+# Catalogs derived from others; dropped together with their source. Some are registered by
+# other modules (e.g. species_profiles) and are skipped until that module is imported.
+_DERIVED_CATALOGS: Dict[str, Tuple[str, ...]] = {
+    "pokemon_catalog": ("species_profiles",),
+    "alternative_forms": ("species_profiles", "form_change_index"),
+    "growth_group_map": ("species_profiles",),
+    "ability_catalog": ("species_profiles",),
+    "moves_data": ("move_table", "move_search_aliases"),
+    "move_catalog": ("move_search_aliases",),
+    "item_data": ("form_change_item_names", "item_category_index"),
+    "berry_catalog": ("item_category_index",),
+    "types_catalog": ("item_category_index",),
+    "nature_catalog": ("item_category_index",),
+    "base_stats": ("base_stats_name_index", "species_profiles"),
+}
+
 
-_MOVES_DATA_CACHE: Optional[Dict[str, object]] = None
-_TYPE_COLORS_CACHE: Optional[Dict[str, str]] = None
-_POKEMON_CATALOG_CACHE: Optional[Dict[str, object]] = None
-_MOVE_CATALOG_CACHE: Optional[Tuple[Dict[str, int], Dict[int, str]]] = None
-_ABILITY_CATALOG_CACHE: Optional[Tuple[Dict[str, int], Dict[int, str]]] = None
-_NATURE_CATALOG_CACHE: Optional[Tuple[Dict[str, int], Dict[int, str]]] = None
+def invalidate_catalogs(name: Optional[str] = None) -> None:
+    """Drop a cached catalog by registry name (e.g. "item_data"), or all of them."""
+    _CATALOGS.invalidate(name)
+    if name in (None, "pokemon_catalog"):
+        reset_pokemon_catalog_index()
+    registered = set(_CATALOGS.names())
+    for derived in _DERIVED_CATALOGS.get(name, ()):
+        if derived in registered:
+            _CATALOGS.invalidate(derived)
 
 
+def catalog_cache_stats() -> Dict[str, Dict[str, object]]:
+    """Per-catalog load/hit counts, load time and approximate memory held."""
+    return _CATALOGS.stats()
+
+
+# --- Unified moves data (moves_data.json) ---
+
+@_CATALOGS.catalog("moves_data")
 def load_moves_data() -> Dict[str, object]:
     """Load consolidated moves database from moves_data.json.
 
@@ -1149,17 +1397,12 @@ def load_moves_data() -> Dict[str, object]:
         }
       }
     """
-    global _MOVES_DATA_CACHE
-    if isinstance(_MOVES_DATA_CACHE, dict):
-        return _MOVES_DATA_CACHE
     if not os.path.exists(DATA_MOVES_DATA_JSON):
         return {}
     try:
-        with open(DATA_MOVES_DATA_JSON, "r", encoding="utf-8") as f:
-            _MOVES_DATA_CACHE = json.load(f) or {}
+        return load_json_data(DATA_MOVES_DATA_JSON) or {}
     except Exception:
-        _MOVES_DATA_CACHE = {}
-    return _MOVES_DATA_CACHE
+        return {}
 
 
 def get_move_entry(move_id: int) -> Optional[Dict[str, object]]:
@@ -1180,42 +1423,26 @@ def get_move_label(move_id: int) -> Optional[str]:
     return str(label) if label is not None else None
 
 
+@_CATALOGS.catalog("move_table")
+def load_move_table() -> MoveTable:
+    """Array-backed per-move columns (type, power, accuracy, category, PP, offensive) from moves_data.json."""
+    return MoveTable.from_moves_data(load_moves_data() or {})
+
+
 def get_move_type_name(move_id: int) -> Optional[str]:
-    e = get_move_entry(move_id)
-    if not isinstance(e, dict):
-        return None
-    t = e.get("type_name")
-    return str(t) if t else None
+    return load_move_table().get_type_name(move_id)
 
 
 def get_move_type_id(move_id: int) -> Optional[int]:
-    e = get_move_entry(move_id)
-    if not isinstance(e, dict):
-        return None
-    tid = e.get("type_id")
-    try:
-        return int(tid) if tid is not None else None
-    except Exception:
-        return None
+    return load_move_table().get_type_id(move_id)
 
 
 def get_move_base_pp(move_id: int) -> Optional[int]:
-    e = get_move_entry(move_id)
-    if not isinstance(e, dict):
-        return None
-    pp = e.get("pp")
-    try:
-        return int(pp) if pp is not None else None
-    except Exception:
-        return None
+    return load_move_table().get_base_pp(move_id)
 
 
 def is_move_offensive(move_id: int) -> Optional[bool]:
-    e = get_move_entry(move_id)
-    if not isinstance(e, dict):
-        return None
-    v = e.get("is_offensive")
-    return bool(v) if v is not None else None
+    return load_move_table().is_offensive(move_id)
 
 
 def build_move_label_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
@@ -1241,6 +1468,24 @@ def build_move_label_catalog() -> Tuple[Dict[str, int], Dict[int, str]]:
     return n2i, i2n
 
 
+@_CATALOGS.catalog("move_search_aliases")
+def load_move_search_aliases() -> Dict[str, int]:
+    """Every searchable name of every move (enum keys and display labels) -> move id.
+
+    Passed as `extra_ids` to move pickers so "Acid Armor" finds `acid_armor` and vice versa.
+    """
+    aliases: Dict[str, int] = {}
+    try:
+        aliases.update(load_move_catalog()[0])
+    except Exception:
+        pass
+    try:
+        aliases.update(build_move_label_catalog()[0])
+    except Exception:
+        pass
+    return aliases
+
+
 def compute_ppup_bounds(base_pp: Optional[int]) -> Tuple[int, int]:
     """Compute (max_extra_pp, max_total_pp) according to rule: up to 3 per 5 base PP.
 
@@ -1248,163 +1493,175 @@ def compute_ppup_bounds(base_pp: Optional[int]) -> Tuple[int, int]:
     - Else: max_extra = floor(base_pp * 3 / 5)
     - Max total = base_pp + max_extra
     Returns (0, 0) if base_pp is None or invalid.
+    For known move ids, `load_move_table().ppup_bounds_for(move_ids)` returns these precomputed.
     """
     try:
-        if base_pp is None:
-            return 0, 0
-        b = int(base_pp)
-        if b < 5:
-            return 0, b
-        from math import floor
-        max_extra = int(floor(b * 3 / 5))
-        return max_extra, b + max_extra
+        return ppup_bounds(base_pp)
     except Exception:
         return 0, 0
 
 
 # --- Alternative Forms Catalog ---
 
-_ALTERNATIVE_FORMS_CACHE: Optional[Dict[str, object]] = None
-
-
+@_CATALOGS.catalog("alternative_forms")
 def load_alternative_forms_catalog() -> Dict[str, object]:
-    """Load alternative forms catalog with caching."""
-    global _ALTERNATIVE_FORMS_CACHE
-    if isinstance(_ALTERNATIVE_FORMS_CACHE, dict):
-        return _ALTERNATIVE_FORMS_CACHE
-
+    """Load alternative forms catalog (cached in the catalog registry)."""
     if not os.path.exists(DATA_ALTERNATIVE_FORMS_JSON):
-        _ALTERNATIVE_FORMS_CACHE = {}
-        return _ALTERNATIVE_FORMS_CACHE
+        return {}
 
     try:
-        with open(DATA_ALTERNATIVE_FORMS_JSON, "r", encoding="utf-8") as f:
-            _ALTERNATIVE_FORMS_CACHE = json.load(f)
+        return load_json_data(DATA_ALTERNATIVE_FORMS_JSON)
     except Exception:
-        _ALTERNATIVE_FORMS_CACHE = {}
+        return {}
 
-    return _ALTERNATIVE_FORMS_CACHE
 
+# Bump when the per-row processing below (or _determine_form_triggers) changes, forcing a full rebuild
+ALT_FORMS_BUILD_VERSION = 2
+ALT_FORMS_CSV = repo_path("..", "TmpServerFiles", "GameData", "2", "alternate_forms_master_minimal_filled.csv")
 
-def build_alternative_forms_catalog() -> None:
-    """Build alternative forms catalog from TmpServerFiles CSV."""
-    csv_path = repo_path("..", "TmpServerFiles", "GameData", "2", "alternate_forms_master_minimal_filled.csv")
-    if not os.path.exists(csv_path):
-        print(f"Alternative forms CSV not found: {csv_path}")
-        return
 
-    forms_data = {
-        "by_dex": {},          # dex_id -> {base_species, forms: [form_data]}
-        "by_form_id": {},      # form_id -> form_data
-        "form_change_items": {}  # item_type_id -> [possible_forms]
+def _alt_form_from_row(row: Dict[str, str]) -> Optional[Dict[str, object]]:
+    """Form entry for one CSV row, or None for rows without an alternative form."""
+    alt_form_name = row.get("Alternative Form", "").strip()
+    if not alt_form_name:
+        return None
+    alt_form_type = row.get("Alternative Form Type", "").strip()
+    type2 = row.get("Type 2", "").strip()
+    return {
+        "dex_number": int(row.get("Dex #", 0)),
+        "base_species": row.get("Base Pokémon", "").strip(),
+        "form_name": alt_form_name,
+        "form_id": row.get("Form ID", "").strip(),
+        "form_type": alt_form_type,
+        "ability": row.get("Ability", "").strip(),
+        "types": {
+            "type1": row.get("Type 1", "").strip(),
+            "type2": type2 if type2 else None
+        },
+        "stats": {
+            "hp": int(row.get("HP", 0) or 0),
+            "attack": int(row.get("Atk", 0) or 0),
+            "defense": int(row.get("Def", 0) or 0),
+            "sp_atk": int(row.get("Sp. Atk", 0) or 0),
+            "sp_def": int(row.get("Sp. Def", 0) or 0),
+            "speed": int(row.get("Spd", 0) or 0),
+        },
+        "total": int(row.get("Total", 0) or 0),
+        "form_key": _normalize_form_key(alt_form_name),
+        "triggers": _determine_form_triggers(alt_form_type, alt_form_name)
     }
 
-    # Form change item mappings (based on common Pokérogue items)
-    form_item_mappings = {
-        # Mega Evolution items
-        22: "mega",              # Gyaradosite
-        48: "mega",              # Venusaurite
-        56: "mega",              # Blastoisinite
-        # Gigantamax
-        "gigantamax": "gigantamax",
-        # Primal Reversion
-        "primal": "primal",
-        # Regional forms are usually permanent, not item-based
-    }
 
-    try:
-        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    dex_num = int(row.get("Dex #", 0))
-                    if dex_num == 0:
-                        continue
-
-                    base_species = row.get("Base Pokémon", "").strip()
-                    alt_form_name = row.get("Alternative Form", "").strip()
-                    form_id = row.get("Form ID", "").strip()
-                    alt_form_type = row.get("Alternative Form Type", "").strip()
-                    ability = row.get("Ability", "").strip()
-                    type1 = row.get("Type 1", "").strip()
-                    type2 = row.get("Type 2", "").strip()
-
-                    # Parse stats
-                    stats = {
-                        "hp": int(row.get("HP", 0) or 0),
-                        "attack": int(row.get("Atk", 0) or 0),
-                        "defense": int(row.get("Def", 0) or 0),
-                        "sp_atk": int(row.get("Sp. Atk", 0) or 0),
-                        "sp_def": int(row.get("Sp. Def", 0) or 0),
-                        "speed": int(row.get("Spd", 0) or 0),
-                    }
-                    total_stats = int(row.get("Total", 0) or 0)
-
-                    if not alt_form_name:
-                        continue
-
-                    # Create form entry
-                    form_data = {
-                        "dex_number": dex_num,
-                        "base_species": base_species,
-                        "form_name": alt_form_name,
-                        "form_id": form_id,
-                        "form_type": alt_form_type,
-                        "ability": ability,
-                        "types": {
-                            "type1": type1,
-                            "type2": type2 if type2 else None
-                        },
-                        "stats": stats,
-                        "total": total_stats,
-                        "form_key": _normalize_form_key(alt_form_name),
-                        "triggers": _determine_form_triggers(alt_form_type, alt_form_name)
-                    }
-
-                    # Add to by_dex structure
-                    if dex_num not in forms_data["by_dex"]:
-                        forms_data["by_dex"][dex_num] = {
-                            "base_species": base_species,
-                            "forms": []
-                        }
-
-                    forms_data["by_dex"][dex_num]["forms"].append(form_data)
-
-                    # Add to by_form_id if we have an ID
-                    if form_id:
-                        forms_data["by_form_id"][form_id] = form_data
-
-                except Exception as e:
-                    print(f"Error processing form row: {e}")
-                    continue
+def build_alternative_forms_catalog(force: bool = False) -> Optional[Dict[str, int]]:
+    """Build alternative forms catalog from TmpServerFiles CSV.
+
+    The catalog records the CSV digest and a digest of each species' rows. A rebuild with an
+    unchanged CSV is a no-op; otherwise only species whose rows changed are reprocessed and the
+    rest are carried over. `force` reprocesses everything.
+
+    Returns counts of reused / rebuilt / removed species, or None when the CSV is missing or unreadable.
+    """
+    csv_path = ALT_FORMS_CSV
+    if not os.path.exists(csv_path):
+        print(f"Alternative forms CSV not found: {csv_path}")
+        return None
 
+    try:
+        with open(csv_path, "rb") as f:
+            raw = f.read()
     except Exception as e:
         print(f"Error reading alternative forms CSV: {e}")
-        return
+        return None
+    source_digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    previous = {} if force else (load_alternative_forms_catalog() or {})
+    prev_meta = previous.get("meta") or {}
+    reusable = prev_meta.get("version") == ALT_FORMS_BUILD_VERSION
+    prev_by_dex = previous.get("by_dex") or {}
+    if reusable and prev_meta.get("source_digest") == source_digest:
+        print("Alternative forms catalog is up to date")
+        return {"reused": len(prev_by_dex), "rebuilt": 0, "removed": 0}
+    prev_digests = (prev_meta.get("species_digests") or {}) if reusable else {}
+
+    # Single pass over the CSV: group rows per species
+    rows_by_dex: Dict[str, list] = {}
+    try:
+        for row in csv.DictReader(io.StringIO(raw.decode("utf-8-sig"), newline="")):
+            try:
+                dex_num = int(row.get("Dex #", 0))
+            except Exception as e:
+                print(f"Error processing form row: {e}")
+                continue
+            if dex_num != 0:
+                rows_by_dex.setdefault(str(dex_num), []).append(row)
+    except Exception as e:
+        print(f"Error reading alternative forms CSV: {e}")
+        return None
 
-    # Build form change item mappings
-    for dex_num, entry in forms_data["by_dex"].items():
+    by_dex: Dict[str, Dict[str, object]] = {}
+    species_digests: Dict[str, str] = {}
+    counts = {"reused": 0, "rebuilt": 0, "removed": 0}
+    for dex_key, rows in rows_by_dex.items():
+        digest = hashlib.blake2b(json.dumps(rows, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+                                 digest_size=16).hexdigest()
+        species_digests[dex_key] = digest
+        if prev_digests.get(dex_key) == digest and dex_key in prev_by_dex:
+            by_dex[dex_key] = prev_by_dex[dex_key]
+            counts["reused"] += 1
+            continue
+        forms = []
+        for row in rows:
+            try:
+                form = _alt_form_from_row(row)
+            except Exception as e:
+                print(f"Error processing form row: {e}")
+                continue
+            if form is not None:
+                forms.append(form)
+        if forms:
+            by_dex[dex_key] = {"base_species": forms[0]["base_species"], "forms": forms}
+            counts["rebuilt"] += 1
+    counts["removed"] = len(set(prev_by_dex) - set(by_dex)) if reusable else 0
+
+    forms_data = {
+        "meta": {
+            "version": ALT_FORMS_BUILD_VERSION,
+            "source": os.path.basename(csv_path),
+            "source_digest": source_digest,
+            "species_digests": species_digests,
+        },
+        "by_dex": by_dex,          # dex_id -> {base_species, forms: [form_data]}
+        "by_form_id": {},          # form_id -> form_data
+        "form_change_items": {},   # item_type_id -> [possible_forms]
+        "species_by_item": {},     # item_type_id -> [dex_id]
+    }
+    for dex_key, entry in by_dex.items():
         for form in entry["forms"]:
+            if form.get("form_id"):
+                forms_data["by_form_id"][form["form_id"]] = form
             for trigger in form.get("triggers", []):
-                if trigger.get("type") == "item":
-                    item_id = trigger.get("item_id")
-                    if item_id:
-                        if item_id not in forms_data["form_change_items"]:
-                            forms_data["form_change_items"][item_id] = []
-                        forms_data["form_change_items"][item_id].append({
-                            "dex_number": dex_num,
-                            "form_key": form["form_key"],
-                            "form_name": form["form_name"]
-                        })
+                if trigger.get("type") == "item" and trigger.get("item_id"):
+                    item_key = str(trigger["item_id"])
+                    forms_data["form_change_items"].setdefault(item_key, []).append({
+                        "dex_number": int(dex_key),
+                        "form_key": form["form_key"],
+                        "form_name": form["form_name"]
+                    })
+                    species = forms_data["species_by_item"].setdefault(item_key, [])
+                    if int(dex_key) not in species:
+                        species.append(int(dex_key))
 
     # Save the catalog
     try:
         os.makedirs(os.path.dirname(DATA_ALTERNATIVE_FORMS_JSON), exist_ok=True)
         with open(DATA_ALTERNATIVE_FORMS_JSON, "w", encoding="utf-8") as f:
             json.dump(forms_data, f, ensure_ascii=False, indent=2)
-        print(f"Alternative forms catalog saved to {DATA_ALTERNATIVE_FORMS_JSON}")
+        print(f"Alternative forms catalog saved to {DATA_ALTERNATIVE_FORMS_JSON} "
+              f"({counts['rebuilt']} rebuilt, {counts['reused']} reused, {counts['removed']} removed)")
+        invalidate_alternative_forms_cache()
     except Exception as e:
         print(f"Error saving alternative forms catalog: {e}")
+    return counts
 
 
 def _normalize_form_key(form_name: str) -> str:
@@ -1461,49 +1718,77 @@ def get_pokemon_alternative_forms(dex_number: int) -> Optional[Dict]:
     return by_dex.get(str(dex_number))
 
 
+@_CATALOGS.catalog("form_change_index")
+def load_form_change_index() -> Dict[str, Dict]:
+    """Lookup tables derived from the alternative forms catalog.
+
+      - forms:       dex (int) -> {form_key: form} in catalog order
+      - by_item:     (item id str, dex int) -> [form_key] triggered by that item
+      - mega:        dex (int) -> [form_key] of mega forms
+      - gigantamax:  dex (int) -> [form_key] of gigantamax forms
+    """
+    catalog = load_alternative_forms_catalog() or {}
+    index: Dict[str, Dict] = {"forms": {}, "by_item": {}, "mega": {}, "gigantamax": {}}
+    for dex_key, entry in (catalog.get("by_dex") or {}).items():
+        try:
+            dex = int(dex_key)
+        except Exception:
+            continue
+        forms: Dict[str, Dict] = {}
+        for form in (entry or {}).get("forms") or []:
+            key = form.get("form_key")
+            if not key:
+                continue
+            forms.setdefault(key, form)
+            form_type = str(form.get("form_type", "")).lower()
+            if "mega" in form_type:
+                index["mega"].setdefault(dex, []).append(key)
+            if "gigantamax" in form_type:
+                index["gigantamax"].setdefault(dex, []).append(key)
+        index["forms"][dex] = forms
+    for item_key, possible in (catalog.get("form_change_items") or {}).items():
+        for pf in possible or []:
+            try:
+                index["by_item"].setdefault((str(item_key), int(pf["dex_number"])), []).append(pf["form_key"])
+            except Exception:
+                continue
+    return index
+
+
 def get_form_for_pokemon_with_items(dex_number: int, modifiers: list, form_index: int = 0) -> Optional[Dict]:
     """Determine the active form for a Pokemon based on items and form index."""
-    alt_forms = get_pokemon_alternative_forms(dex_number)
-    if not alt_forms:
+    index = load_form_change_index()
+    try:
+        dex = int(dex_number)
+    except Exception:
         return None
-
-    forms = alt_forms.get("forms", [])
+    forms = index["forms"].get(dex)
     if not forms:
         return None
 
-    # Check for form change items in modifiers
-    catalog = load_alternative_forms_catalog()
-    form_items = catalog.get("form_change_items", {})
-
-    detected_forms = []
-
+    detected_forms = set()
     for modifier in modifiers:
         if not isinstance(modifier, dict):
             continue
 
-        if modifier.get("typeId") == "RARE_FORM_CHANGE_ITEM":
+        type_id = modifier.get("typeId")
+        if type_id == "RARE_FORM_CHANGE_ITEM":
             type_pregen_args = modifier.get("typePregenArgs", [])
             if type_pregen_args:
-                item_id = type_pregen_args[0]
-                possible_forms = form_items.get(str(item_id), [])
-                for possible_form in possible_forms:
-                    if possible_form["dex_number"] == dex_number:
-                        detected_forms.append(possible_form["form_key"])
+                detected_forms.update(index["by_item"].get((str(type_pregen_args[0]), dex), ()))
 
-        elif modifier.get("typeId") == "MEGA_BRACELET":
+        elif type_id == "MEGA_BRACELET":
             # Mega evolution access
-            mega_forms = [f for f in forms if "mega" in f.get("form_type", "").lower()]
-            detected_forms.extend([f["form_key"] for f in mega_forms])
+            detected_forms.update(index["mega"].get(dex, ()))
 
-        elif modifier.get("typeId") == "DYNAMAX_BAND":
+        elif type_id == "DYNAMAX_BAND":
             # Gigantamax access
-            gmax_forms = [f for f in forms if "gigantamax" in f.get("form_type", "").lower()]
-            detected_forms.extend([f["form_key"] for f in gmax_forms])
+            detected_forms.update(index["gigantamax"].get(dex, ()))
 
-    # If we detected specific forms, return the first one
+    # If we detected specific forms, return the first one in catalog order
     if detected_forms:
-        for form in forms:
-            if form["form_key"] in detected_forms:
+        for key, form in forms.items():
+            if key in detected_forms:
                 return form
 
     # Do not assume a non-base form purely from an index; require an item trigger
@@ -1512,32 +1797,21 @@ def get_form_for_pokemon_with_items(dex_number: int, modifiers: list, form_index
 
 def invalidate_alternative_forms_cache():
     """Invalidate the alternative forms cache."""
-    global _ALTERNATIVE_FORMS_CACHE
-    _ALTERNATIVE_FORMS_CACHE = None
+    invalidate_catalogs("alternative_forms")
 
 
 # --- Item Data System ---
 
-_ITEM_DATA_CACHE: Optional[Dict[str, object]] = None
-
-
+@_CATALOGS.catalog("item_data")
 def load_item_data() -> Dict[str, object]:
-    """Load comprehensive item data with caching."""
-    global _ITEM_DATA_CACHE
-    if isinstance(_ITEM_DATA_CACHE, dict):
-        return _ITEM_DATA_CACHE
-    
+    """Load comprehensive item data (cached in the catalog registry)."""
     if not os.path.exists(DATA_ITEM_DATA_JSON):
-        _ITEM_DATA_CACHE = {}
-        return _ITEM_DATA_CACHE
-    
+        return {}
+
     try:
-        with open(DATA_ITEM_DATA_JSON, "r", encoding="utf-8") as f:
-            _ITEM_DATA_CACHE = json.load(f)
+        return load_json_data(DATA_ITEM_DATA_JSON)
     except Exception:
-        _ITEM_DATA_CACHE = {}
-    
-    return _ITEM_DATA_CACHE
+        return {}
 
 
 def get_item_info(item_id: str) -> Optional[Dict[str, object]]:
@@ -1590,7 +1864,17 @@ def get_item_category(item_id: str) -> Optional[str]:
 
 
 def get_items_by_category(category: str) -> List[str]:
-    """Get all items in a specific category."""
+    """Get all items in a specific category (served from the prebuilt category index)."""
+    return list(load_item_category_index().items(category))
+
+
+def get_formatted_items_by_category(category: str) -> List[str]:
+    """`format_item_for_display` strings for every item in a category, in category order."""
+    return list(load_item_category_index().formatted(category))
+
+
+def _category_items_uncached(category: str) -> List[str]:
+    """Resolve a category's items from item_data.json (static lists or dynamic catalogs)."""
     data = load_item_data()
     categories = data.get("categories", {})
     category_info = categories.get(category, {})
@@ -1611,7 +1895,8 @@ def _get_dynamic_category_items(category: str) -> List[str]:
     if category == "berries":
         try:
             _, berry_i2n = load_berry_catalog()
-            return [name.lower() for name in berry_i2n.values()]
+            # Berry id order, which the item manager's berry dropdown has always used
+            return [name.lower() for _, name in sorted(berry_i2n.items())]
         except Exception:
             return []
     elif category == "type_boosters":
@@ -1646,18 +1931,26 @@ def get_pokemon_specific_items(pokemon_id: int) -> Dict[str, List[str]]:
     return result
 
 
+@_CATALOGS.catalog("form_change_item_names")
+def load_form_change_item_names() -> Dict[str, Tuple[str, ...]]:
+    """Species id (str) -> every Pokemon-specific item from item_data.json, across subcategories."""
+    pokemon_items = (load_item_data() or {}).get("pokemon_specific_items", {}) or {}
+    index: Dict[str, Tuple[str, ...]] = {}
+    for dex_key in pokemon_items:
+        names = []
+        for subcategory_items in get_pokemon_specific_items(dex_key).values():
+            names.extend(subcategory_items)
+        index[str(dex_key)] = tuple(names)
+    return index
+
+
 def get_form_change_items_for_pokemon(pokemon_id: int) -> List[str]:
     """Get all form change items available for a specific Pokemon."""
-    pokemon_items = get_pokemon_specific_items(pokemon_id)
-    form_items = []
-    
-    # Add items from all subcategories
-    for subcategory_items in pokemon_items.values():
-        form_items.extend(subcategory_items)
-    
+    form_items = list(load_form_change_item_names().get(str(pokemon_id), ()))
+
     # Add generic form change items
     form_items.extend(["RARE_FORM_CHANGE_ITEM", "GENERIC_FORM_CHANGE_ITEM"])
-    
+
     return form_items
 
 
@@ -1733,7 +2026,45 @@ def format_item_for_display(
     return " ".join(parts)
 
 
+class ItemCategoryIndex:
+    """Immutable category -> items index with ready-made display strings."""
+
+    __slots__ = ("_items", "_formatted", "_display")
+
+    def __init__(self, items: Dict[str, Tuple[str, ...]], display: Dict[str, str]):
+        self._items = items
+        self._display = display
+        self._formatted = {cat: tuple(display[i] for i in members) for cat, members in items.items()}
+
+    def categories(self) -> Tuple[str, ...]:
+        return tuple(self._items)
+
+    def items(self, category: str) -> Tuple[str, ...]:
+        return self._items.get(category, ())
+
+    def formatted(self, category: str) -> Tuple[str, ...]:
+        return self._formatted.get(category, ())
+
+    def display(self, item_id: str) -> str:
+        """Plain `format_item_for_display(item_id)`, precomputed for every indexed item."""
+        hit = self._display.get(item_id)
+        return hit if hit is not None else format_item_for_display(item_id)
+
+
+@_CATALOGS.catalog("item_category_index")
+def load_item_category_index() -> ItemCategoryIndex:
+    """Every item_data.json category resolved once, plus display strings for all known items."""
+    data = load_item_data() or {}
+    items: Dict[str, Tuple[str, ...]] = {}
+    for category in (data.get("categories") or {}):
+        items[category] = tuple(_category_items_uncached(category))
+    display: Dict[str, str] = {}
+    for item_id in list(data.get("items") or {}) + [i for members in items.values() for i in members]:
+        if item_id not in display:
+            display[item_id] = format_item_for_display(item_id)
+    return ItemCategoryIndex(items, display)
+
+
 def invalidate_item_data_cache():
     """Invalidate the item data cache."""
-    global _ITEM_DATA_CACHE
-    _ITEM_DATA_CACHE = None
+    invalidate_catalogs("item_data")
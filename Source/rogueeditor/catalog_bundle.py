@@ -0,0 +1,233 @@
+"""Compiled binary bundle of the JSON catalogs under `Source/data`.
+
+`build_catalog_bundle()` parses every `data/*.json` once and writes them into a
+single versioned file (`data/catalog_bundle.bin`): a magic header followed by a
+pickle holding, per source file, its size, mtime and content digest plus the
+parsed object pickled on its own. At startup the bundle is read with one file
+read; each catalog is then unpickled only when `load_json_data()` asks for it,
+which is several times faster than `json.load` on the text file.
+
+A bundled entry is only used while it still matches its source: same size and
+mtime, or failing that (e.g. after a fresh checkout) the same content digest.
+Anything stale, missing from the bundle, or an unreadable bundle falls back to
+parsing the JSON file, so a stale bundle can never serve outdated data.
+
+Rebuild with ``python -m rogueeditor.catalog_bundle``; `preload_all_catalogs`
+also refreshes it in place when it is stale.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .utils import repo_path
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+_MAGIC = b"RGEDCAT" + bytes([BUNDLE_FORMAT])
+# Fixed protocol so a bundle built by one supported Python loads on the others
+_PICKLE_PROTOCOL = 4
+
+DATA_DIR = repo_path("data")
+CATALOG_BUNDLE_PATH = repo_path("data", "catalog_bundle.bin")
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _source_files(data_dir: str) -> Dict[str, str]:
+    return {os.path.basename(p): p for p in sorted(glob.glob(os.path.join(data_dir, "*.json")))}
+
+
+class CatalogBundle:
+    """A loaded bundle: per-file metadata plus lazily unpickled payloads."""
+
+    def __init__(self, path: str, data_dir: str, entries: Dict[str, Dict[str, Any]], blobs: Dict[str, bytes],
+                 created_at: float = 0.0):
+        self.path = path
+        self.data_dir = os.path.normcase(os.path.abspath(data_dir))
+        self.entries = entries
+        self.blobs = blobs
+        self.created_at = created_at
+        self._verified: Dict[str, Tuple[Tuple[int, int], bool]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def read(cls, path: str = CATALOG_BUNDLE_PATH, data_dir: str = DATA_DIR) -> Optional["CatalogBundle"]:
+        """Load a bundle from disk; None when missing, from another format version, or corrupt."""
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        if not raw.startswith(_MAGIC):
+            logger.debug(f"Ignoring catalog bundle with unknown header: {path}")
+            return None
+        try:
+            payload = pickle.loads(raw[len(_MAGIC):])
+            return cls(path, data_dir, payload["entries"], payload["blobs"], payload.get("created_at", 0.0))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable catalog bundle {path}: {e}")
+            return None
+
+    def _name_for(self, source_path: str) -> Optional[str]:
+        full = os.path.normcase(os.path.abspath(source_path))
+        if os.path.dirname(full) != self.data_dir:
+            return None
+        return os.path.basename(source_path)
+
+    def _matches_source(self, name: str, source_path: str) -> bool:
+        # The source is stat'ed on every call so files rewritten at runtime are
+        # noticed; only the (costlier) digest comparison is cached, per stat key.
+        meta = self.entries.get(name)
+        if meta is None:
+            return False
+        try:
+            st = os.stat(source_path)
+        except OSError:
+            return False
+        if st.st_size != meta["size"]:
+            return False
+        if st.st_mtime_ns == meta["mtime_ns"]:
+            return True
+        key = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._verified.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            with open(source_path, "rb") as f:
+                ok = _digest(f.read()) == meta["digest"]
+        except OSError:
+            ok = False
+        with self._lock:
+            self._verified[name] = (key, ok)
+        return ok
+
+    def get(self, source_path: str) -> Any:
+        """Parsed contents for `source_path`, or raise KeyError when the bundle cannot serve it."""
+        name = self._name_for(source_path)
+        if name is None or name not in self.blobs or not self._matches_source(name, source_path):
+            self.misses += 1
+            raise KeyError(source_path)
+        self.hits += 1
+        return pickle.loads(self.blobs[name])
+
+    def is_current(self) -> bool:
+        """True when every data/*.json is bundled and matches its source."""
+        sources = _source_files(self.data_dir)
+        if set(sources) != set(self.entries):
+            return False
+        return all(self._matches_source(name, path) for name, path in sources.items())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "files": len(self.entries),
+            "bytes": sum(len(b) for b in self.blobs.values()),
+            "created_at": self.created_at,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def build_catalog_bundle(data_dir: str = DATA_DIR, out_path: str = CATALOG_BUNDLE_PATH) -> Dict[str, Any]:
+    """Compile every `data_dir/*.json` into one bundle file. Unparseable files are skipped.
+
+    Returns a summary with the bundled and skipped file names and the bundle size.
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    blobs: Dict[str, bytes] = {}
+    skipped = []
+    for name, path in _source_files(data_dir).items():
+        try:
+            st = os.stat(path)
+            with open(path, "rb") as f:
+                raw = f.read()
+            obj = json.loads(raw.decode("utf-8"))
+        except Exception as e:
+            logger.warning(f"Catalog bundle: skipping {name}: {e}")
+            skipped.append(name)
+            continue
+        entries[name] = {"digest": _digest(raw), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        blobs[name] = pickle.dumps(obj, protocol=_PICKLE_PROTOCOL)
+
+    payload = {"format": BUNDLE_FORMAT, "created_at": time.time(), "entries": entries, "blobs": blobs}
+    body = _MAGIC + pickle.dumps(payload, protocol=_PICKLE_PROTOCOL)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, out_path)
+    reset_catalog_bundle()
+    return {"path": out_path, "files": sorted(entries), "skipped": skipped, "bytes": len(body)}
+
+
+_BUNDLE: Optional[CatalogBundle] = None
+_BUNDLE_LOADED = False
+_BUNDLE_LOCK = threading.Lock()
+
+
+def get_catalog_bundle() -> Optional[CatalogBundle]:
+    """The process-wide bundle read from `CATALOG_BUNDLE_PATH`, or None when there is none."""
+    global _BUNDLE, _BUNDLE_LOADED
+    with _BUNDLE_LOCK:
+        if not _BUNDLE_LOADED:
+            _BUNDLE = CatalogBundle.read()
+            _BUNDLE_LOADED = True
+        return _BUNDLE
+
+
+def reset_catalog_bundle() -> None:
+    """Forget the loaded bundle so the next access re-reads it from disk."""
+    global _BUNDLE, _BUNDLE_LOADED
+    with _BUNDLE_LOCK:
+        _BUNDLE = None
+        _BUNDLE_LOADED = False
+
+
+def load_json_data(path: str) -> Any:
+    """Parsed JSON for a data file, served from the bundle when it is current.
+
+    Raises the same errors as opening and parsing the file directly when falling back.
+    """
+    bundle = get_catalog_bundle()
+    if bundle is not None:
+        try:
+            return bundle.get(path)
+        except KeyError:
+            pass
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def refresh_catalog_bundle_if_stale() -> bool:
+    """Rebuild the bundle when it is missing or out of date. Returns True if it was rebuilt."""
+    bundle = get_catalog_bundle()
+    if bundle is not None and bundle.is_current():
+        return False
+    try:
+        build_catalog_bundle()
+        return True
+    except Exception as e:
+        logger.warning(f"Could not refresh catalog bundle: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    summary = build_catalog_bundle()
+    print(f"Wrote {summary['path']} ({summary['bytes']} bytes, {len(summary['files'])} catalogs)")
+    if summary["skipped"]:
+        print(f"Skipped: {', '.join(summary['skipped'])}")
@@ -0,0 +1,238 @@
+"""Process-wide registry for lazily loaded catalog data.
+
+Every `load_*` function in `catalog.py` is registered here under a stable name.
+The first caller of a catalog runs its loader while holding that catalog's
+lock; concurrent callers (GUI worker threads, background cache managers) block
+on the same lock and receive the already-parsed value instead of parsing the
+JSON again. Failed loads are not cached, so the next caller retries.
+
+Every caller receives the same object, so catalogs registered with
+``read_only=True`` are stored as deep read-only views (`ReadOnlyDict` /
+`ReadOnlyList`): an in-place edit raises TypeError instead of silently changing
+the data for every other caller. Callers that need to modify a catalog copy it
+first (``dict(...)``, ``list(...)`` or `copy.deepcopy`, which yield plain
+containers).
+
+Catalogs can be invalidated individually or all at once, and `stats()` reports
+load counts, hit counts, load times and an approximate in-memory size.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class ReadOnlyDict(dict):
+    """dict that rejects mutation, so a shared cached catalog cannot be corrupted by one caller."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared catalog data is read-only; copy it with dict() before modifying")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """list counterpart of `ReadOnlyDict`."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared catalog data is read-only; copy it with list() before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(obj: Any) -> Any:
+    """Deep read-only view of a JSON-like value (dicts, lists and tuples; other objects as is)."""
+    if isinstance(obj, dict):
+        return ReadOnlyDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return ReadOnlyList(freeze(v) for v in obj)
+    if type(obj) is tuple:
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate deep size in bytes of a JSON-like structure (shared objects counted once)."""
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        oid = id(cur)
+        if oid in seen:
+            continue
+        seen.add(oid)
+        total += sys.getsizeof(cur)
+        if isinstance(cur, dict):
+            stack.extend(cur.keys())
+            stack.extend(cur.values())
+        elif isinstance(cur, (list, tuple, set, frozenset)):
+            stack.extend(cur)
+        elif hasattr(cur, "__dict__") and not isinstance(cur, type):
+            stack.append(vars(cur))
+        elif hasattr(cur, "__slots__"):
+            stack.extend(getattr(cur, s) for s in cur.__slots__ if hasattr(cur, s))
+    return total
+
+
+class _Entry:
+    __slots__ = ("name", "loader", "read_only", "lock", "value", "loads", "hits", "load_time", "loaded_at", "size")
+
+    def __init__(self, name: str, loader: Callable[[], Any], read_only: bool = False):
+        self.name = name
+        self.loader = loader
+        self.read_only = read_only
+        # Re-entrant so a loader that (indirectly) asks for itself fails loudly by recursion
+        # instead of deadlocking the GUI
+        self.lock = threading.RLock()
+        self.value: Any = _MISSING
+        self.loads = 0
+        self.hits = 0
+        self.load_time = 0.0
+        self.loaded_at = 0.0
+        self.size: Optional[int] = None
+
+
+class CatalogRegistry:
+    """Named, single-flight, lazily loaded catalogs."""
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    # --- Registration ---
+    def register(self, name: str, loader: Callable[[], Any], read_only: bool = False) -> None:
+        """Register (or replace) the loader for `name`. Replacing drops any loaded value.
+
+        With `read_only`, the loaded value is stored as a deep read-only view (see `freeze`).
+        """
+        with self._lock:
+            self._entries[name] = _Entry(name, loader, read_only)
+
+    def catalog(self, name: str, read_only: bool = False) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        """Decorator: register the function as the loader for `name` and return a cached accessor.
+
+        The undecorated loader stays reachable as ``accessor.__wrapped__``.
+        """
+        def decorator(loader: Callable[[], Any]) -> Callable[[], Any]:
+            self.register(name, loader, read_only)
+
+            @functools.wraps(loader)
+            def accessor():
+                return self.get(name)
+
+            accessor.catalog_name = name
+            return accessor
+        return decorator
+
+    def _entry(self, name: str) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown catalog: {name}")
+        return entry
+
+    # --- Access ---
+    def get(self, name: str) -> Any:
+        """Return the catalog, loading it on first use. Concurrent first calls share one load."""
+        entry = self._entry(name)
+        value = entry.value
+        if value is not _MISSING:
+            entry.hits += 1
+            return value
+        with entry.lock:
+            if entry.value is not _MISSING:
+                entry.hits += 1
+                return entry.value
+            start = time.perf_counter()
+            value = entry.loader()
+            if entry.read_only:
+                value = freeze(value)
+            entry.load_time = time.perf_counter() - start
+            entry.loaded_at = time.time()
+            entry.loads += 1
+            entry.size = None
+            entry.value = value
+            logger.debug(f"Loaded catalog '{name}' in {entry.load_time * 1000:.1f} ms")
+            return value
+
+    def peek(self, name: str) -> Optional[Any]:
+        """Loaded value for `name`, or None without triggering a load."""
+        value = self._entry(name).value
+        return None if value is _MISSING else value
+
+    def is_loaded(self, name: str) -> bool:
+        return self._entry(name).value is not _MISSING
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    # --- Invalidation ---
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop the loaded value of `name`, or of every catalog when `name` is None."""
+        names: Iterable[str] = [name] if name is not None else self.names()
+        for n in names:
+            entry = self._entry(n)
+            with entry.lock:
+                entry.value = _MISSING
+                entry.size = None
+
+    # --- Accounting ---
+    def memory_usage(self, name: str) -> int:
+        """Approximate bytes held by a loaded catalog (0 when not loaded). Computed once per load."""
+        entry = self._entry(name)
+        with entry.lock:
+            if entry.value is _MISSING:
+                return 0
+            if entry.size is None:
+                entry.size = estimate_size(entry.value)
+            return entry.size
+
+    def stats(self, include_size: bool = True) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for name in self.names():
+            entry = self._entry(name)
+            loaded = entry.value is not _MISSING
+            out[name] = {
+                "loaded": loaded,
+                "loads": entry.loads,
+                "hits": entry.hits,
+                "load_ms": round(entry.load_time * 1000, 2),
+                "bytes": self.memory_usage(name) if include_size and loaded else 0,
+            }
+        return out
+
+    def total_memory(self) -> int:
+        return sum(self.memory_usage(name) for name in self.names())
+
+
+_REGISTRY: Optional[CatalogRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_catalog_registry() -> CatalogRegistry:
+    """Process-wide catalog registry shared by every module and thread."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = CatalogRegistry()
+        return _REGISTRY
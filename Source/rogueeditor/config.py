@@ -24,12 +24,36 @@ SLOT_UPDATE_PATHS = [
     "/save/update/{i}",
 ]
 
+# Seconds a slot endpoint template that returned 404/405 is skipped before being retried
+ENDPOINT_DEAD_TTL = float(os.getenv("ROGUEEDITOR_ENDPOINT_DEAD_TTL", str(6 * 60 * 60)))
+
+# HTTP connection pooling: hosts cached per session, live connections kept per host,
+# and seconds an account's shared session may sit idle before it is rebuilt
+HTTP_POOL_CONNECTIONS = int(os.getenv("ROGUEEDITOR_HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("ROGUEEDITOR_HTTP_POOL_MAXSIZE", "16"))
+HTTP_SESSION_IDLE_TTL = float(os.getenv("ROGUEEDITOR_HTTP_SESSION_IDLE_TTL", "90"))
+
+# Client-side rate limiting per host (token bucket): ceiling and floor in requests/second
+# and burst size. The rate adapts between floor and ceiling from 429s; RPS <= 0 disables.
+RATE_LIMIT_RPS = float(os.getenv("ROGUEEDITOR_RATE_LIMIT_RPS", "8"))
+RATE_LIMIT_MIN_RPS = float(os.getenv("ROGUEEDITOR_RATE_LIMIT_MIN_RPS", "0.5"))
+RATE_LIMIT_BURST = float(os.getenv("ROGUEEDITOR_RATE_LIMIT_BURST", "8"))
+
+# Seconds a fetched slot/system payload is served from memory before revalidating; 0 disables
+RESPONSE_CACHE_TTL = float(os.getenv("ROGUEEDITOR_RESPONSE_CACHE_TTL", "20"))
+
+# Opt-in request body compression for uploads ("gzip" or "deflate"); empty disables.
+# Only enable against deployments that accept Content-Encoding on POST bodies.
+UPLOAD_ENCODING = os.getenv("ROGUEEDITOR_UPLOAD_ENCODING", "").strip().lower() or None
+
 # Optional client session id (from browser network, or login response if present)
 CLIENT_SESSION_ID = os.getenv("ROGUEEDITOR_CLIENT_SESSION_ID")
 
 # Default headers that mimic browser requests
 DEFAULT_HEADERS = {
     "accept": "application/json, text/plain, */*",
+    # Only advertise encodings the HTTP clients can always decode
+    "accept-encoding": "gzip, deflate",
     "content-type": "application/x-www-form-urlencoded",
     "sec-ch-ua": '"Google Chrome";v="139", "Chromium";v="139", "Not;A=Brand";v="99"',
     "sec-ch-ua-mobile": "?0",
@@ -42,3 +66,13 @@ DEFAULT_HEADERS = {
         "Chrome/139.0.0.0 Safari/537.36"
     ),
 }
+
+# Compression for content-addressed backup blobs: "zlib", "zstd" (needs the zstandard
+# package; falls back to zlib) or "none". Existing blobs stay readable after a change.
+BACKUP_COMPRESSION = os.getenv("ROGUEEDITOR_BACKUP_COMPRESSION", "zlib").strip().lower() or "none"
+
+# Delta snapshot mode for operation backups: each save file keeps a chain of full keyframes
+# plus JSON-patch deltas (set to 0 to store every backup as a whole-file blob instead),
+# with a keyframe at least every BACKUP_KEYFRAME_INTERVAL versions
+BACKUP_DELTA_SNAPSHOTS = os.getenv("ROGUEEDITOR_BACKUP_DELTA_SNAPSHOTS", "1").strip().lower() not in ("0", "false", "no", "off")
+BACKUP_KEYFRAME_INTERVAL = int(os.getenv("ROGUEEDITOR_BACKUP_KEYFRAME_INTERVAL", "32"))
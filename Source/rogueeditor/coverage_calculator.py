@@ -11,7 +11,7 @@ from .catalog import (
     get_move_type_name,
     is_move_offensive,
     get_move_label,
-    get_move_entry,
+    load_move_table,
 )
 from .utils import repo_path
 
@@ -172,20 +172,21 @@ def calculate_pokemon_coverage(pokemon_moves: List[int], type_matrix: Dict,
     damaging_moves = []
     move_types = set()
 
-    # Analyze each move
-    for move_id in pokemon_moves:
-        if is_move_damaging(move_id, enhanced_moves, basic_moves):
-            move_type = get_move_type(move_id, enhanced_moves, basic_moves)
-            if move_type:
-                entry = get_move_entry(move_id) or {}
-                damaging_moves.append({
-                    "id": move_id,
-                    "type": move_type,
-                    "name": get_move_label(move_id) or basic_moves.get("id_to_name", {}).get(str(move_id), f"Move_{move_id}"),
-                    "power": entry.get("power"),
-                    "accuracy": entry.get("accuracy"),
-                })
-                move_types.add(move_type)
+    # Analyze the whole moveset against the move table columns at once
+    table = load_move_table()
+    rows = zip(pokemon_moves, table.offensive_flags(pokemon_moves), table.type_names_for(pokemon_moves),
+               table.powers(pokemon_moves), table.accuracies(pokemon_moves))
+    for move_id, offensive, move_type, power, accuracy in rows:
+        # Unknown offensive flag counts as damaging (see is_move_damaging)
+        if offensive is not False and move_type:
+            damaging_moves.append({
+                "id": move_id,
+                "type": move_type,
+                "name": get_move_label(move_id) or basic_moves.get("id_to_name", {}).get(str(move_id), f"Move_{move_id}"),
+                "power": power,
+                "accuracy": accuracy,
+            })
+            move_types.add(move_type)
 
     # Calculate coverage against all types
     # Derive type list from matrix keys to avoid orientation/header issues
@@ -18,7 +18,9 @@ from .utils import (
     get_by_path,
     select_from_catalog,
 )
-from .catalog import load_move_catalog, load_ability_catalog, load_nature_catalog, load_weather_catalog, load_modifier_catalog
+from .species_profiles import get_species_profile
+from .backup_store import encode_snapshot_json, load_backup_json, write_snapshot
+from .catalog import load_move_catalog, load_ability_catalog, load_nature_catalog, load_weather_catalog, load_modifier_catalog, load_move_search_aliases
 
 
 class Editor:
@@ -40,14 +42,14 @@ class Editor:
 
     # 2. Dump trainer data
     def dump_trainer(self, path: Optional[str] = None) -> None:
-        data = self.api.get_trainer()
+        data = self.api.get_trainer(use_cache=False)
         path = path or trainer_save_path(self.api.username)
         dump_json(path, data)
         print(f"Wrote {path}")
 
     # 3. Dump slot data
     def dump_slot(self, slot: int, path: Optional[str] = None) -> None:
-        data = self.api.get_slot(slot)
+        data = self.api.get_slot(slot, use_cache=False)
         path = path or slot_save_path(self.api.username, slot)
         dump_json(path, data)
         print(f"Wrote {path}")
@@ -66,8 +68,14 @@ class Editor:
         if not isinstance(data, dict):
             print(f"{path} must contain a JSON object at the top level.")
             return
+        diff = self.api.diff_system(data, refresh=True) if self.api.client_session_id else None
+        if diff is not None and not diff.has_changes:
+            print("Trainer data matches the server; nothing to upload.")
+            return
         self.api.update_trainer(data)
         print("Your trainer data has been updated!")
+        if diff is not None:
+            print(f"Sections uploaded: {diff.summary()}")
 
     # 5. Update slot from file
     def update_slot_from_file(self, slot: int, path: Optional[str] = None) -> None:
@@ -83,8 +91,14 @@ class Editor:
         if not isinstance(data, dict):
             print(f"{path} must contain a JSON object at the top level.")
             return
+        diff = self.api.diff_slot(slot, data, refresh=True)
+        if diff is not None and not diff.has_changes:
+            print(f"Slot {slot} matches the server; nothing to upload.")
+            return
         self.api.update_slot(slot, data)
         print(f"Your save data has been updated in slot: {slot}!")
+        if diff is not None:
+            print(f"Sections uploaded: {diff.summary()}")
 
     # 6. Starter edit (interactive)
     def starter_edit_interactive(self) -> None:
@@ -323,37 +337,59 @@ class Editor:
             if "systemData" in resp:
                 print("Server system snapshot received.")
 
+    def dump_all(self) -> tuple[list[str], list[str]]:
+        """Fetch trainer and slots 1-5 concurrently and write them to the user's save dir.
+
+        Returns (successes, errors) with one entry per trainer/slot.
+        """
+        bulk = self.api.fetch_all(use_cache=False)
+        successes: list[str] = []
+        errors: list[str] = []
+        if bulk.trainer is not None:
+            if bulk.trainer.ok:
+                dump_json(trainer_save_path(self.api.username), bulk.trainer.data)
+                successes.append("trainer")
+            else:
+                errors.append(f"trainer: {bulk.trainer.error}")
+        for slot, res in sorted(bulk.slots.items()):
+            if res.ok:
+                dump_json(slot_save_path(self.api.username, slot), res.data)
+                successes.append(f"slot {slot}")
+            else:
+                errors.append(f"slot {slot}: {res.error}")
+        return successes, errors
+
     def backup_all(self) -> str:
         import datetime
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         base = os.path.join(user_save_dir(self.api.username), "backups", ts)
+        # System (trainer-like) and slots 1..5 in one concurrent batch
+        bulk = self.api.fetch_all(use_cache=False)
+        if bulk.trainer is not None and not bulk.trainer.ok:
+            raise bulk.trainer.error
         os.makedirs(base, exist_ok=True)
-        # System (trainer-like)
-        trainer = self.api.get_trainer()
-        dump_json(os.path.join(base, "trainer.json"), trainer)
-        # Slots 1..5
-        for slot in range(1, 6):
-            try:
-                s = self.api.get_slot(slot)
-                dump_json(os.path.join(base, f"slot {slot}.json"), s)
-            except Exception:
-                # Skip missing slots
-                continue
+        # Contents go to the shared blob store; the folder only keeps a manifest of hashes
+        files = {"trainer.json": encode_snapshot_json(bulk.trainer.data)}
+        for slot, res in sorted(bulk.slots.items()):
+            # Skip missing slots
+            if res.ok:
+                files[f"slot {slot}.json"] = encode_snapshot_json(res.data)
+        write_snapshot(base, files)
         print(f"Backup created at: {base}")
         return base
 
     def restore_from_backup(self, backup_dir: str, restore_slots: Optional[list[int]] = None) -> None:
         # Restore trainer
-        trainer_path = os.path.join(backup_dir, "trainer.json")
-        if os.path.exists(trainer_path):
-            trainer = load_json(trainer_path)
+        # A restore always uploads: the change tracker's baseline can be stale, and a
+        # skipped restore would silently leave the server on its current state
+        trainer = load_backup_json(backup_dir, "trainer.json")
+        if trainer is not None:
             self.api.update_trainer(trainer)
         # Restore slots
         slots = restore_slots or [1, 2, 3, 4, 5]
         for slot in slots:
-            path = os.path.join(backup_dir, f"slot {slot}.json")
-            if os.path.exists(path):
-                data = load_json(path)
+            data = load_backup_json(backup_dir, f"slot {slot}.json")
+            if data is not None:
                 try:
                     self.api.update_slot(slot, data)
                 except Exception as e:
@@ -375,7 +411,9 @@ class Editor:
                 did = str(mon.get("dexId") or mon.get("speciesId") or mon.get("pokemonId") or mon.get("species") or "?")
                 name = inv.get(did, did)
                 lvl = mon.get("level") or mon.get("lvl") or "?"
-                print(f"  {i}. {name} (dex {did}) lvl={lvl}")
+                profile = get_species_profile(did)
+                types = f" [{'/'.join(t for t in profile.types if t)}]" if profile else ""
+                print(f"  {i}. {name}{types} (dex {did}) lvl={lvl}")
 
     def edit_team_interactive(self, slot: int) -> None:
         # Load and detect
@@ -478,7 +516,7 @@ class Editor:
                 if val.isdigit():
                     mid = int(val)
                 else:
-                    res = select_from_catalog("    Search move: ", move_name_to_id)
+                    res = select_from_catalog("    Search move: ", move_name_to_id, extra_ids=load_move_search_aliases())
                     if res is None:
                         print("    Skipped; kept current")
                         continue
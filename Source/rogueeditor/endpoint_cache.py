@@ -0,0 +1,152 @@
+"""Endpoint discovery cache for slot fetch/update fallbacks.
+
+Remembers, per base URL, which slot endpoint template last worked and which
+templates the server reported as missing. Clients try the known-good template
+first and skip known-dead ones until their TTL expires, so deployments that only
+serve a non-canonical endpoint stop paying for failed requests on every call.
+
+State is persisted to `Source/.env/endpoints.json`, next to `users.json`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .config import ENDPOINT_DEAD_TTL
+from .utils import USERS_CONFIG_PATH
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_CACHE_PATH = os.path.join(os.path.dirname(USERS_CONFIG_PATH), "endpoints.json")
+
+SLOT_FETCH = "slot_fetch"
+SLOT_UPDATE = "slot_update"
+
+
+class EndpointCache:
+    """Thread-safe, file-backed record of working and dead endpoint templates.
+
+    Layout on disk::
+
+        {"https://api.example": {"slot_fetch": {"preferred": "<tmpl>",
+                                                "dead": {"<tmpl>": <expires_epoch>}}}}
+    """
+
+    def __init__(self, path: Optional[str] = ENDPOINT_CACHE_PATH, dead_ttl: float = ENDPOINT_DEAD_TTL):
+        self.path = path
+        self.dead_ttl = dead_ttl
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data: Dict[str, Dict[str, dict]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, dict]]:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable endpoint cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        self._dirty = False
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"Could not persist endpoint cache: {e}")
+
+    def _entry(self, base_url: str, kind: str) -> dict:
+        return self._data.setdefault(base_url, {}).setdefault(kind, {"preferred": None, "dead": {}})
+
+    def order(self, base_url: str, kind: str, candidates: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Reorder (template, url) candidates: preferred first, live next, dead last.
+
+        Dead templates are only attempted after every live candidate has failed.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(base_url, {}).get(kind) or {}
+            preferred = entry.get("preferred")
+            dead = {t for t, until in (entry.get("dead") or {}).items() if until > now}
+        first = [c for c in candidates if c[0] == preferred and c[0] not in dead]
+        live = [c for c in candidates if c[0] != preferred and c[0] not in dead]
+        last = [c for c in candidates if c[0] in dead]
+        return first + live + last
+
+    def _changed(self, persist: bool) -> None:
+        if persist:
+            self._save()
+        else:
+            self._dirty = True
+
+    def record_success(self, base_url: str, kind: str, template: str, persist: bool = True) -> None:
+        """Mark `template` as the one to try first. `persist=False` defers the file write to `flush()`."""
+        with self._lock:
+            entry = self._entry(base_url, kind)
+            changed = entry.get("preferred") != template or template in entry.get("dead", {})
+            entry["preferred"] = template
+            entry.get("dead", {}).pop(template, None)
+            if changed:
+                self._changed(persist)
+
+    def record_dead(self, base_url: str, kind: str, template: str, persist: bool = True) -> None:
+        with self._lock:
+            entry = self._entry(base_url, kind)
+            entry.setdefault("dead", {})[template] = time.time() + self.dead_ttl
+            if entry.get("preferred") == template:
+                entry["preferred"] = None
+            self._changed(persist)
+
+    def flush(self) -> None:
+        """Write changes recorded with `persist=False` (blocking; async callers run it in an executor)."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def is_dead(self, base_url: str, kind: str, template: str) -> bool:
+        with self._lock:
+            until = ((self._data.get(base_url, {}).get(kind) or {}).get("dead") or {}).get(template)
+        return bool(until and until > time.time())
+
+    def clear(self, base_url: Optional[str] = None) -> None:
+        """Forget learned endpoints for one base URL, or for all of them."""
+        with self._lock:
+            if base_url is None:
+                self._data = {}
+            else:
+                self._data.pop(base_url, None)
+            self._save()
+
+    @staticmethod
+    def is_missing_endpoint_error(error: Exception) -> bool:
+        """True when a failure means the endpoint does not exist (vs. auth/server/network problems)."""
+        msg = str(error)
+        return "(404)" in msg or "HTTP 405" in msg
+
+
+_DEFAULT_CACHE: Optional[EndpointCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_endpoint_cache() -> EndpointCache:
+    """Process-wide endpoint cache shared by all API clients."""
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = EndpointCache()
+        return _DEFAULT_CACHE
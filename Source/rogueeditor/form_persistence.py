@@ -159,7 +159,7 @@ def get_effective_pokemon_form(pokemon_data: Dict, slot_data: Dict, username: st
 
 def get_pokemon_display_name(pokemon_data: Dict, slot_data: Dict, username: str, slot: int) -> str:
     """Get the display name for a Pokemon considering its current form."""
-    from .catalog import load_pokemon_catalog
+    from .catalog import get_pokemon_catalog_entry
 
     species_id = pokemon_data.get("species")
     if not species_id:
@@ -172,8 +172,7 @@ def get_pokemon_display_name(pokemon_data: Dict, slot_data: Dict, username: str,
         return effective_form.get("form_name", f"Species#{species_id}")
 
     # Fallback to base species name
-    pokemon_catalog = load_pokemon_catalog()
-    catalog_entry = pokemon_catalog.get("by_dex", {}).get(str(species_id), {})
+    catalog_entry = get_pokemon_catalog_entry(species_id) or {}
     return catalog_entry.get("name", f"Species#{species_id}")
 
 
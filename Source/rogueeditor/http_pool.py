@@ -0,0 +1,137 @@
+"""Shared, tuned `requests.Session` pool keyed by account.
+
+Every `PokerogueAPI` for the same account (main window, team editor, item
+manager, starters manager, session refresh) borrows one session from the
+process-wide registry, so concurrent dialogs reuse warm keep-alive/TLS
+connections instead of opening new ones. Sessions idle longer than the
+configured TTL are closed and rebuilt, since servers drop idle keep-alive
+sockets anyway. Each `acquire()` must be paired with a `release()`; a session
+is only closed once every client of its account has released it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import BASE_URL, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_SESSION_IDLE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+def build_session(pool_connections: int = HTTP_POOL_CONNECTIONS, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """Create a session whose adapters keep up to `pool_maxsize` live connections per host.
+
+    Retries are left to `PokerogueAPI._request`, so the adapters never retry on their own.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0, pool_block=False)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _Entry:
+    __slots__ = ("session", "last_used", "refs")
+
+    def __init__(self, session: requests.Session, last_used: float):
+        self.session = session
+        self.last_used = last_used
+        self.refs = 0
+
+
+class SessionRegistry:
+    """Thread-safe registry of pooled sessions keyed by (base URL, account)."""
+
+    def __init__(self, idle_ttl: float = HTTP_SESSION_IDLE_TTL,
+                 pool_connections: int = HTTP_POOL_CONNECTIONS, pool_maxsize: int = HTTP_POOL_MAXSIZE):
+        self.idle_ttl = idle_ttl
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, str], _Entry] = {}
+
+    @staticmethod
+    def _key(account: str) -> Tuple[str, str]:
+        return BASE_URL, (account or "").strip().lower()
+
+    def acquire(self, account: str, min_pool_size: int = 0) -> requests.Session:
+        """Return the shared session for an account, creating or refreshing it as needed.
+
+        Counts a reference; pair every call with `release()`.
+        """
+        key = self._key(account)
+        now = time.monotonic()
+        stale: Optional[requests.Session] = None
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = self._sessions[key] = _Entry(
+                    build_session(self.pool_connections, max(self.pool_maxsize, min_pool_size)), now)
+            elif self.idle_ttl > 0 and now - entry.last_used > self.idle_ttl:
+                # Idle sockets are likely dead server-side; closing a Session only drops its
+                # pooled connections, so clients still holding it keep working
+                stale = entry.session
+                entry.session = build_session(self.pool_connections, max(self.pool_maxsize, min_pool_size))
+            entry.last_used = now
+            entry.refs += 1
+            session = entry.session
+        if stale is not None:
+            logger.debug(f"Closing idle HTTP session for {key[1]}")
+            stale.close()
+        return session
+
+    def touch(self, account: str) -> None:
+        """Record use of an account's session so it is not treated as idle."""
+        key = self._key(account)
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is not None:
+                entry.last_used = time.monotonic()
+
+    def release(self, account: str) -> None:
+        """Drop one reference to an account's session; the last release closes and forgets it."""
+        key = self._key(account)
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            del self._sessions[key]
+        entry.session.close()
+
+    def refs(self, account: str) -> int:
+        with self._lock:
+            entry = self._sessions.get(self._key(account))
+            return entry.refs if entry is not None else 0
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._sessions.values())
+            self._sessions.clear()
+        for entry in entries:
+            entry.session.close()
+
+    def accounts(self) -> list[str]:
+        with self._lock:
+            return sorted(account for _, account in self._sessions)
+
+
+_REGISTRY: Optional[SessionRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_session_registry() -> SessionRegistry:
+    """Process-wide session registry shared by all API clients."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = SessionRegistry()
+        return _REGISTRY
@@ -0,0 +1,173 @@
+"""Column-oriented table of the per-move numbers used by coverage and PP math.
+
+`moves_data.json` is a dict of dicts keyed by stringified move id; every
+`get_move_*` helper used to look a move up there and convert the field it
+needed. `MoveTable` flattens the numeric fields once into parallel `array`
+columns indexed directly by move id:
+
+    type_id, power, accuracy, category, base_pp, offensive,
+    ppup_extra, pp_max   (the latter two precomputed per `compute_ppup_bounds`)
+
+Missing values are stored as ``-1`` and come back as None. Batch accessors take
+a whole moveset (or team's worth of move ids) and return lists, so coverage and
+PP validation touch each column once instead of re-walking the dicts per move.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# `move_category` values in moves_data.json; index 0 means unknown
+CATEGORIES = ("", "Physical", "Special", "Status", "Z-Move", "Dynamax Move")
+_CATEGORY_CODE = {name: i for i, name in enumerate(CATEGORIES)}
+
+_MISSING = -1
+
+
+def ppup_bounds(base_pp: Optional[int]) -> Tuple[int, int]:
+    """(max_extra_pp, max_total_pp): up to 3 extra PP per 5 base PP; (0, 0) when unknown."""
+    if base_pp is None:
+        return 0, 0
+    b = int(base_pp)
+    if b < 5:
+        return 0, b
+    extra = b * 3 // 5
+    return extra, b + extra
+
+
+def _int_or_missing(v: Any) -> int:
+    try:
+        return int(v) if v is not None else _MISSING
+    except (TypeError, ValueError):
+        return _MISSING
+
+
+class MoveTable:
+    """Immutable struct-of-arrays view of moves_data.json ``by_id``."""
+
+    __slots__ = ("size", "type_id", "power", "accuracy", "category", "base_pp", "offensive",
+                 "ppup_extra", "pp_max", "type_names")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.type_id = array("h", [_MISSING]) * size
+        self.power = array("h", [_MISSING]) * size
+        self.accuracy = array("h", [_MISSING]) * size
+        self.category = array("b", [0]) * size
+        self.base_pp = array("h", [_MISSING]) * size
+        self.offensive = array("b", [_MISSING]) * size
+        self.ppup_extra = array("h", [0]) * size
+        self.pp_max = array("h", [0]) * size
+        # type id -> lowercase type name as spelled in moves_data.json
+        self.type_names: Dict[int, str] = {}
+
+    @classmethod
+    def from_moves_data(cls, data: Mapping[str, Any]) -> "MoveTable":
+        by_id = data.get("by_id") if isinstance(data, Mapping) else None
+        rows: List[Tuple[int, Mapping[str, Any]]] = []
+        for k, e in (by_id or {}).items():
+            try:
+                mid = int(k)
+            except (TypeError, ValueError):
+                continue
+            if mid >= 0 and isinstance(e, Mapping):
+                rows.append((mid, e))
+        table = cls(max((mid for mid, _ in rows), default=-1) + 1)
+        for mid, e in rows:
+            tid = _int_or_missing(e.get("type_id"))
+            table.type_id[mid] = tid
+            if tid != _MISSING and e.get("type_name"):
+                table.type_names.setdefault(tid, str(e.get("type_name")))
+            table.power[mid] = _int_or_missing(e.get("power"))
+            table.accuracy[mid] = _int_or_missing(e.get("accuracy"))
+            table.category[mid] = _CATEGORY_CODE.get(str(e.get("move_category") or ""), 0)
+            pp = _int_or_missing(e.get("pp"))
+            table.base_pp[mid] = pp
+            if e.get("is_offensive") is not None:
+                table.offensive[mid] = 1 if e.get("is_offensive") else 0
+            extra, total = ppup_bounds(None if pp == _MISSING else pp)
+            table.ppup_extra[mid] = extra
+            table.pp_max[mid] = total
+        return table
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _slot(self, move_id: Any) -> int:
+        try:
+            mid = int(move_id)
+        except (TypeError, ValueError):
+            return -1
+        return mid if 0 <= mid < self.size else -1
+
+    def _value(self, column: array, move_id: Any) -> Optional[int]:
+        i = self._slot(move_id)
+        if i < 0:
+            return None
+        v = column[i]
+        return None if v == _MISSING else v
+
+    # --- Single move ---
+    def get_type_id(self, move_id: Any) -> Optional[int]:
+        return self._value(self.type_id, move_id)
+
+    def get_type_name(self, move_id: Any) -> Optional[str]:
+        tid = self._value(self.type_id, move_id)
+        return self.type_names.get(tid) if tid is not None else None
+
+    def get_power(self, move_id: Any) -> Optional[int]:
+        return self._value(self.power, move_id)
+
+    def get_accuracy(self, move_id: Any) -> Optional[int]:
+        return self._value(self.accuracy, move_id)
+
+    def get_category(self, move_id: Any) -> Optional[str]:
+        i = self._slot(move_id)
+        return (CATEGORIES[self.category[i]] or None) if i >= 0 else None
+
+    def get_base_pp(self, move_id: Any) -> Optional[int]:
+        return self._value(self.base_pp, move_id)
+
+    def is_offensive(self, move_id: Any) -> Optional[bool]:
+        v = self._value(self.offensive, move_id)
+        return bool(v) if v is not None else None
+
+    def get_ppup_bounds(self, move_id: Any) -> Tuple[int, int]:
+        i = self._slot(move_id)
+        return (self.ppup_extra[i], self.pp_max[i]) if i >= 0 else (0, 0)
+
+    # --- Whole movesets ---
+    def type_ids(self, move_ids: Iterable[Any]) -> List[Optional[int]]:
+        return [self._value(self.type_id, m) for m in move_ids]
+
+    def type_names_for(self, move_ids: Iterable[Any]) -> List[Optional[str]]:
+        names = self.type_names
+        return [names.get(t) if t is not None else None for t in self.type_ids(move_ids)]
+
+    def powers(self, move_ids: Iterable[Any]) -> List[Optional[int]]:
+        return [self._value(self.power, m) for m in move_ids]
+
+    def accuracies(self, move_ids: Iterable[Any]) -> List[Optional[int]]:
+        return [self._value(self.accuracy, m) for m in move_ids]
+
+    def base_pps(self, move_ids: Iterable[Any]) -> List[Optional[int]]:
+        return [self._value(self.base_pp, m) for m in move_ids]
+
+    def offensive_flags(self, move_ids: Iterable[Any]) -> List[Optional[bool]]:
+        return [self.is_offensive(m) for m in move_ids]
+
+    def ppup_bounds_for(self, move_ids: Iterable[Any]) -> List[Tuple[int, int]]:
+        return [self.get_ppup_bounds(m) for m in move_ids]
+
+    def offensive_type_ids(self, move_ids: Iterable[Any]) -> List[int]:
+        """Distinct type ids of the damaging moves in `move_ids` (moves with unknown flags count as damaging)."""
+        out: List[int] = []
+        for m in move_ids:
+            i = self._slot(m)
+            if i < 0 or self.offensive[i] == 0:
+                continue
+            tid = self.type_id[i]
+            if tid != _MISSING and tid not in out:
+                out.append(tid)
+        return out
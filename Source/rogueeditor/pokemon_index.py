@@ -0,0 +1,260 @@
+"""Indexed, memory-mapped access to `pokemon_catalog.json`.
+
+Most sessions only look at a handful of species (the party, a starter or two),
+yet `load_pokemon_catalog()` decodes all ~1,000 entries into nested dicts. This
+module keeps a derived index file next to the catalog (`pokemon_catalog.idx`):
+
+    header   magic, format, entry count, metadata length, source size/mtime/digest
+    meta     compact JSON of the catalog's top-level keys other than ``by_dex``
+    table    ``count`` x (dex id, offset, length), sorted by dex id
+    entries  compact JSON of each ``by_dex`` entry, back to back
+
+The file is read through `mmap`; only the offset table is decoded up front and
+individual species are decoded on demand into a small LRU. The index is rebuilt
+automatically whenever the source JSON changes (size and mtime, then digest).
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .utils import repo_path
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT = 1
+_MAGIC = b"RGEPKIDX"
+_HEADER = struct.Struct("<8sHHIIQq16s")
+_ROW = struct.Struct("<III")
+
+DATA_POKEMON_CATALOG_JSON = repo_path("data", "pokemon_catalog.json")
+DATA_POKEMON_CATALOG_INDEX = repo_path("data", "pokemon_catalog.idx")
+
+
+def _digest_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+def build_pokemon_catalog_index(source: str = DATA_POKEMON_CATALOG_JSON,
+                                out_path: str = DATA_POKEMON_CATALOG_INDEX) -> int:
+    """Write the index for `source`. Returns the number of indexed species."""
+    st = os.stat(source)
+    with open(source, "rb") as f:
+        raw = f.read()
+    catalog = json.loads(raw.decode("utf-8"))
+    by_dex = catalog.get("by_dex") or {}
+    meta = {k: v for k, v in catalog.items() if k != "by_dex"}
+    meta_bytes = json.dumps(meta, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    rows: List[tuple] = []
+    chunks: List[bytes] = []
+    offset = 0
+    for key in sorted(by_dex, key=lambda k: int(k)):
+        blob = json.dumps(by_dex[key], separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        rows.append((int(key), offset, len(blob)))
+        chunks.append(blob)
+        offset += len(blob)
+
+    header = _HEADER.pack(_MAGIC, INDEX_FORMAT, 0, len(rows), len(meta_bytes), st.st_size, st.st_mtime_ns,
+                          hashlib.blake2b(raw, digest_size=16).digest())
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(meta_bytes)
+        for row in rows:
+            f.write(_ROW.pack(*row))
+        for blob in chunks:
+            f.write(blob)
+    os.replace(tmp, out_path)
+    return len(rows)
+
+
+class PokemonCatalogIndex:
+    """Read-only view of an index file. Decoded entries are shared; treat them as read-only."""
+
+    def __init__(self, path: str = DATA_POKEMON_CATALOG_INDEX, cache_size: int = 128):
+        self.path = path
+        self.cache_size = cache_size
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        try:
+            magic, fmt, _, count, meta_len, self.source_size, self.source_mtime_ns, self.source_digest = \
+                _HEADER.unpack_from(self._mm, 0)
+            if magic != _MAGIC or fmt != INDEX_FORMAT:
+                raise ValueError(f"not a pokemon catalog index (format {fmt})")
+            pos = _HEADER.size
+            self._meta_bytes = bytes(self._mm[pos:pos + meta_len])
+            pos += meta_len
+            self._dex: List[int] = []
+            self._spans: List[tuple] = []
+            for dex, off, length in _ROW.iter_unpack(self._mm[pos:pos + count * _ROW.size]):
+                self._dex.append(dex)
+                self._spans.append((off, length))
+            self._data_start = pos + count * _ROW.size
+        except Exception:
+            self.close()
+            raise
+        self._lru: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.decoded = 0
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        finally:
+            self._file.close()
+
+    def matches(self, source: str) -> bool:
+        """True when the index was built from the current contents of `source`."""
+        try:
+            st = os.stat(source)
+        except OSError:
+            return False
+        if st.st_size != self.source_size:
+            return False
+        if st.st_mtime_ns == self.source_mtime_ns:
+            return True
+        return _digest_file(source) == self.source_digest
+
+    def __len__(self) -> int:
+        return len(self._dex)
+
+    def __contains__(self, dex: object) -> bool:
+        try:
+            return self._position(int(dex)) is not None
+        except (TypeError, ValueError):
+            return False
+
+    def dex_ids(self) -> List[int]:
+        return list(self._dex)
+
+    def meta(self) -> Dict[str, Any]:
+        """Top-level catalog keys other than ``by_dex`` (e.g. ``source``)."""
+        return json.loads(self._meta_bytes.decode("utf-8"))
+
+    def _position(self, dex: int) -> Optional[int]:
+        i = bisect.bisect_left(self._dex, dex)
+        if i < len(self._dex) and self._dex[i] == dex:
+            return i
+        return None
+
+    def entry(self, dex: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """Decoded ``by_dex`` entry for a dex id, or None."""
+        try:
+            key = int(dex)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            hit = self._lru.get(key)
+            if hit is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return hit
+        i = self._position(key)
+        if i is None:
+            return None
+        off, length = self._spans[i]
+        start = self._data_start + off
+        value = json.loads(self._mm[start:start + length].decode("utf-8"))
+        with self._lock:
+            self.decoded += 1
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+        return value
+
+    def entries(self, dex_ids) -> Dict[int, Optional[Dict[str, Any]]]:
+        return {int(d): self.entry(d) for d in dex_ids}
+
+    @property
+    def by_dex(self) -> "LazyByDex":
+        """Read-only mapping shaped like the catalog's ``by_dex`` (string dex keys)."""
+        return LazyByDex(self)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"species": len(self._dex), "cached": len(self._lru), "hits": self.hits, "decoded": self.decoded}
+
+
+class LazyByDex(Mapping):
+    """``by_dex``-compatible mapping that decodes entries through the index on access."""
+
+    def __init__(self, index: PokemonCatalogIndex):
+        self._index = index
+
+    def __getitem__(self, key: Any) -> Dict[str, Any]:
+        entry = self._index.entry(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return (str(d) for d in self._index.dex_ids())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+_INDEX: Optional[PokemonCatalogIndex] = None
+_INDEX_CHECKED = False
+_INDEX_LOCK = threading.Lock()
+
+
+def _open_index(source: str, path: str) -> Optional[PokemonCatalogIndex]:
+    try:
+        idx = PokemonCatalogIndex(path)
+        if idx.matches(source):
+            return idx
+        idx.close()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Rebuilding unreadable pokemon catalog index: {e}")
+    build_pokemon_catalog_index(source, path)
+    return PokemonCatalogIndex(path)
+
+
+def get_pokemon_catalog_index() -> Optional[PokemonCatalogIndex]:
+    """Process-wide index, built or refreshed on first use. None when unavailable (caller falls back to JSON)."""
+    global _INDEX, _INDEX_CHECKED
+    with _INDEX_LOCK:
+        if not _INDEX_CHECKED:
+            _INDEX_CHECKED = True
+            if os.path.exists(DATA_POKEMON_CATALOG_JSON):
+                try:
+                    _INDEX = _open_index(DATA_POKEMON_CATALOG_JSON, DATA_POKEMON_CATALOG_INDEX)
+                except Exception as e:
+                    logger.warning(f"Pokemon catalog index unavailable, using JSON: {e}")
+                    _INDEX = None
+        return _INDEX
+
+
+def reset_pokemon_catalog_index() -> None:
+    """Drop the index; the next access re-validates (and if needed rebuilds) it.
+
+    The old mapping is left for the garbage collector so views still held by dialogs keep working.
+    """
+    global _INDEX, _INDEX_CHECKED
+    with _INDEX_LOCK:
+        _INDEX = None
+        _INDEX_CHECKED = False
@@ -0,0 +1,148 @@
+"""Client-side adaptive rate limiting for Pokerogue requests.
+
+A token bucket per host, shared by every thread and client in the process.
+Callers reserve a token before each request and wait out the returned delay
+(blocking `time.sleep` for the sync client, `asyncio.sleep` for the async one),
+so bursts such as "upload all" or multi-account scripts are paced instead of
+triggering 429 storms.
+
+The refill rate adapts AIMD-style: each 429 halves it and pauses the bucket for
+the server's `Retry-After` (or the caller's backoff), and each success raises it
+slowly back towards the configured ceiling.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from .config import RATE_LIMIT_BURST, RATE_LIMIT_MIN_RPS, RATE_LIMIT_RPS
+
+
+class TokenBucket:
+    """Reservation-based token bucket with an adaptive refill rate."""
+
+    def __init__(self, rate: float, capacity: float, min_rate: float, increase_step: float = 0.1,
+                 decrease_factor: float = 0.5):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min(min_rate, rate)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        # Observations
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            wait = max(wait, self._blocked_until - now)
+            self.requests += 1
+            self.total_wait += wait
+            return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttled(self, retry_after: Optional[float]) -> None:
+        """Back off after a 429: shrink the rate and pause until `retry_after` elapses."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            # Drop any accumulated burst so the pause is not followed by a stampede
+            self._tokens = min(self._tokens, 0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "throttle_ratio": round(self.throttled / self.requests, 4) if self.requests else 0.0,
+                "total_wait": round(self.total_wait, 3),
+                "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+            }
+
+
+class RateLimiter:
+    """Per-host token buckets. A non-positive rate disables limiting."""
+
+    def __init__(self, rate: float = RATE_LIMIT_RPS, burst: float = RATE_LIMIT_BURST, min_rate: float = RATE_LIMIT_MIN_RPS):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            b = self._buckets.get(host)
+            if b is None:
+                b = self._buckets[host] = TokenBucket(self.rate, max(1.0, self.burst), self.min_rate)
+            return b
+
+    def reserve(self, url: str) -> float:
+        if not self.enabled:
+            return 0.0
+        return self.bucket(url).reserve()
+
+    def acquire(self, url: str) -> float:
+        """Blocking reserve: sleep until the request may be sent. Returns the time waited."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def observe(self, url: str, status_code: int, retry_after: Optional[float] = None) -> None:
+        """Feed a response back so the host's rate adapts."""
+        if not self.enabled:
+            return
+        if status_code == 429:
+            self.bucket(url).on_throttled(retry_after)
+        elif status_code < 400:
+            self.bucket(url).on_success()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: b.snapshot() for host, b in buckets.items()}
+
+
+_LIMITER: Optional[RateLimiter] = None
+_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter shared by all API clients and threads."""
+    global _LIMITER
+    with _LIMITER_LOCK:
+        if _LIMITER is None:
+            _LIMITER = RateLimiter()
+        return _LIMITER
@@ -0,0 +1,151 @@
+"""In-memory cache for slot/system GET responses.
+
+Entries are keyed by the full request URL (endpoint plus clientSessionId) and
+tagged (e.g. ``"system"``, ``"slot:0"``) so uploads can invalidate them. Within
+`ttl` seconds a cached body is served without touching the network; after that
+the client revalidates with ``If-None-Match``/``If-Modified-Since`` when the
+server supplied an ``ETag``/``Last-Modified``, and re-downloads otherwise.
+
+Bodies are stored as raw bytes and decoded on every hit, so callers always get
+an independent object they are free to mutate.
+
+Every invalidation bumps a per-tag generation. A GET captures `generation(tag)`
+before it is sent and hands it to `resolve`, which drops the body when an upload
+invalidated the tag meanwhile; otherwise a request still in flight during an
+upload could store the pre-upload body after the upload's invalidation.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .config import RESPONSE_CACHE_TTL
+
+
+class RevalidationMiss(RuntimeError):
+    """A 304 arrived for a URL whose cached body was dropped meanwhile; repeat the GET unconditionally."""
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    tag: str
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseCache:
+    """Thread-safe URL -> response body cache with TTL and tag invalidation. `ttl <= 0` disables it."""
+
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        # Bumped by invalidate(): `_epoch` for everything, `_generations[tag]` per tag
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+        self.dropped = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def fresh(self, urls: Iterable[str]) -> Optional[Any]:
+        """Decoded body of the first entry among `urls` still within its TTL, if any."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for url in urls:
+                entry = self._entries.get(url)
+                if entry is not None and now - entry.stored_at < self.ttl:
+                    self.hits += 1
+                    content = entry.content
+                    break
+            else:
+                return None
+        return json.loads(content)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a cached URL (empty when nothing to revalidate)."""
+        if not self.enabled:
+            return {}
+        with self._lock:
+            entry = self._entries.get(url)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["if-none-match"] = entry.etag
+            if entry.last_modified:
+                headers["if-modified-since"] = entry.last_modified
+        return headers
+
+    def generation(self, tag: str) -> Tuple[int, int]:
+        """Token to capture before sending a GET for `tag` and pass to `resolve`."""
+        with self._lock:
+            return self._epoch, self._generations.get(tag, 0)
+
+    def resolve(self, url: str, tag: str, resp: Any, generation: Optional[Tuple[int, int]] = None) -> Optional[Any]:
+        """Handle a GET response: serve the cached body on 304, otherwise remember the new body.
+
+        Returns the decoded body for a 304 hit, or None when the caller should decode `resp` itself.
+        A new body is not stored when `generation` (from `generation(tag)` before the request)
+        is older than the tag's current one, i.e. the tag was invalidated while it was in flight.
+        Raises `RevalidationMiss` for a 304 with nothing cached (e.g. invalidated by an
+        upload while the request was in flight), whose empty body cannot be decoded.
+        """
+        if not self.enabled:
+            if resp.status_code == 304:
+                raise RevalidationMiss(f"304 Not Modified without a cached body: {url}")
+            return None
+        now = time.monotonic()
+        with self._lock:
+            if resp.status_code == 304:
+                entry = self._entries.get(url)
+                if entry is None:
+                    raise RevalidationMiss(f"304 Not Modified without a cached body: {url}")
+                entry.stored_at = now
+                self.revalidated += 1
+                content = entry.content
+            else:
+                self.misses += 1
+                if generation is not None and generation != (self._epoch, self._generations.get(tag, 0)):
+                    self.dropped += 1
+                    return None
+                self._entries[url] = CacheEntry(
+                    content=resp.content,
+                    tag=tag,
+                    stored_at=now,
+                    etag=resp.headers.get("etag"),
+                    last_modified=resp.headers.get("last-modified"),
+                )
+                return None
+        return json.loads(content)
+
+    def invalidate(self, tag: Optional[str] = None) -> None:
+        """Drop entries with the given tag, or everything when `tag` is None."""
+        with self._lock:
+            if tag is None:
+                self._epoch += 1
+                self._entries.clear()
+            else:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for url in [u for u, e in self._entries.items() if e.tag == tag]:
+                    del self._entries[url]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "revalidated": self.revalidated,
+                    "misses": self.misses, "dropped": self.dropped}
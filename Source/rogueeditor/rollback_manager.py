@@ -28,7 +28,7 @@ class RecoveryOption:
     """Represents a recovery option for the user."""
     recovery_id: str
     description: str
-    recovery_type: str  # "backup_restore", "operation_rollback", "emergency_restore"
+    recovery_type: str  # "backup_restore", "operation_rollback", "emergency_restore", "history_restore"
     timestamp: str
     affected_files: List[str]
     risk_level: str  # "low", "medium", "high"
@@ -58,12 +58,31 @@ class RollbackManager:
         self.backup_manager = EnhancedBackupManager(username)
         self.corruption_prevention = SaveCorruptionPreventionSystem(username)
 
-    def get_recovery_options(self, crisis_mode: bool = False) -> List[RecoveryOption]:
+    @staticmethod
+    def _risk_for_timestamp(timestamp: str) -> Tuple[str, str]:
+        """(risk_level, recommendation) from the age of a ``YYYYmmdd_HHMMSS...`` timestamp."""
+        try:
+            backup_time = time.mktime(time.strptime(timestamp[:15], "%Y%m%d_%H%M%S"))
+            age_hours = (time.time() - backup_time) / 3600
+        except Exception:
+            age_hours = 999
+
+        if age_hours < 1:
+            return "low", "Safe - Recent backup with minimal data loss"
+        if age_hours < 24:
+            return "medium", "Acceptable - May lose recent progress"
+        return "high", "High data loss - Only use if necessary"
+
+    def get_recovery_options(self, crisis_mode: bool = False, include_history: bool = False,
+                             history_limit: Optional[int] = None) -> List[RecoveryOption]:
         """
         Get available recovery options for the user.
 
         Args:
             crisis_mode: If True, includes more aggressive recovery options
+            include_history: If True, also lists every version kept in the per-file
+                delta snapshot chains (read from the chain logs; nothing is rebuilt)
+            history_limit: Optional cap on history versions listed per file
 
         Returns:
             List of recovery options sorted by recommendation
@@ -71,30 +90,14 @@ class RollbackManager:
         options: List[RecoveryOption] = []
 
         # Get recent backups
-        recent_backups = self.backup_manager.list_backups(since_days=30)
+        recent_backups = self.backup_manager.list_backups(since_days=30, limit=10)
 
         # Create backup-based recovery options
-        for backup in recent_backups[:10]:  # Show up to 10 recent backups
+        for backup in recent_backups:  # Show up to 10 recent backups
             backup_id = f"{backup.timestamp}_{backup.operation_type}"
 
-            # Determine risk level based on backup age and operation type
-            try:
-                backup_time = time.mktime(time.strptime(
-                    backup.timestamp[:15], "%Y%m%d_%H%M%S"
-                ))
-                age_hours = (time.time() - backup_time) / 3600
-            except Exception:
-                age_hours = 999
-
-            if age_hours < 1:
-                risk_level = "low"
-                recommendation = "Safe - Recent backup with minimal data loss"
-            elif age_hours < 24:
-                risk_level = "medium"
-                recommendation = "Acceptable - May lose recent progress"
-            else:
-                risk_level = "high"
-                recommendation = "High data loss - Only use if necessary"
+            # Determine risk level based on backup age
+            risk_level, recommendation = self._risk_for_timestamp(backup.timestamp)
 
             option = RecoveryOption(
                 recovery_id=backup_id,
@@ -110,9 +113,8 @@ class RollbackManager:
         # In crisis mode, add emergency options
         if crisis_mode:
             # Emergency: restore from any available backup
-            all_backups = self.backup_manager.list_backups()
-            if all_backups:
-                latest = all_backups[0]
+            latest = self.backup_manager.get_latest_backup()
+            if latest:
                 latest_id = f"{latest.timestamp}_{latest.operation_type}"
 
                 emergency_option = RecoveryOption(
@@ -126,6 +128,21 @@ class RollbackManager:
                 )
                 options.append(emergency_option)
 
+        if include_history:
+            for file_name, versions in self.backup_manager.list_history_versions().items():
+                for version in versions[:history_limit]:
+                    risk_level, recommendation = self._risk_for_timestamp(version.timestamp)
+                    options.append(RecoveryOption(
+                        recovery_id=f"history:{file_name}:{version.version}",
+                        description=f"Restore {file_name} version {version.version}"
+                                    + (f" ({version.operation})" if version.operation else ""),
+                        recovery_type="history_restore",
+                        timestamp=version.timestamp,
+                        affected_files=[os.path.join(self.backup_manager.base_dir, file_name)],
+                        risk_level=risk_level,
+                        recommendation=recommendation
+                    ))
+
         # Sort by risk level and age (lower risk first, newer first)
         risk_order = {"low": 0, "medium": 1, "high": 2}
         options.sort(key=lambda opt: (risk_order.get(opt.risk_level, 3), opt.timestamp), reverse=True)
@@ -146,7 +163,8 @@ class RollbackManager:
         """
         # Find the recovery option
         recovery_option = None
-        for option in self.get_recovery_options(crisis_mode=True):
+        include_history = recovery_id.startswith("history:")
+        for option in self.get_recovery_options(crisis_mode=True, include_history=include_history):
             if option.recovery_id == recovery_id:
                 recovery_option = option
                 break
@@ -174,6 +192,8 @@ class RollbackManager:
                 return self._execute_backup_restore(recovery_option)
             elif recovery_option.recovery_type == "operation_rollback":
                 return self._execute_operation_rollback(recovery_option)
+            elif recovery_option.recovery_type == "history_restore":
+                return self._execute_history_restore(recovery_option)
             else:
                 return RecoveryResult(
                     success=False,
@@ -263,6 +283,42 @@ class RollbackManager:
                 warnings=warnings
             )
 
+    def _execute_history_restore(self, recovery_option: RecoveryOption) -> RecoveryResult:
+        """Rebuild one file version from its delta chain and restore it."""
+        _, file_name, version = recovery_option.recovery_id.split(":", 2)
+        warnings = []
+
+        target = recovery_option.affected_files[0]
+        if os.path.exists(target):
+            try:
+                safety_backup_id = self.backup_manager.create_operation_backup(
+                    operation_type="pre_recovery",
+                    description=f"Safety backup before recovery {recovery_option.recovery_id}",
+                    files_to_backup=[target],
+                    session_info={"recovery_operation": True}
+                )
+                warnings.append(f"Created safety backup: {safety_backup_id}")
+            except Exception as e:
+                warnings.append(f"Could not create safety backup: {e}")
+
+        try:
+            self.backup_manager.restore_history_version(file_name, int(version), target)
+        except Exception as e:
+            return RecoveryResult(
+                success=False,
+                recovery_type=recovery_option.recovery_type,
+                files_restored=[],
+                error_message=f"Restore failed: {e}",
+                warnings=warnings
+            )
+
+        return RecoveryResult(
+            success=True,
+            recovery_type=recovery_option.recovery_type,
+            files_restored=[target],
+            warnings=warnings
+        )
+
     def _execute_operation_rollback(self, recovery_option: RecoveryOption) -> RecoveryResult:
         """Execute operation-based rollback."""
         # This would be used for rolling back specific operations
@@ -309,8 +365,8 @@ class RollbackManager:
             recovery_info["recommendations"].append("File does not exist")
 
         # Find backups containing this file
-        all_backups = self.backup_manager.list_backups()
-        for backup in all_backups:
+        file_backups = self.backup_manager.list_backups(file_path=file_path)
+        for backup in file_backups:
             if file_path in backup.files_backed_up:
                 backup_id = f"{backup.timestamp}_{backup.operation_type}"
 
@@ -321,9 +377,9 @@ class RollbackManager:
                     for entry in entries:
                         if entry.original_path == file_path:
                             try:
-                                if os.path.exists(entry.backup_path):
-                                    with open(entry.backup_path, 'r', encoding='utf-8') as f:
-                                        json.load(f)
+                                if (self.backup_manager.blob_store.has(entry.blob_hash)
+                                        if entry.blob_hash else os.path.exists(entry.backup_path)):
+                                    json.loads(self.backup_manager.read_entry_bytes(entry).decode('utf-8'))
                                     recovery_info["recovery_options"].append({
                                         "backup_id": backup_id,
                                         "timestamp": backup.timestamp,
@@ -388,19 +444,20 @@ class RollbackManager:
         report["system_status"] = integrity_check
 
         # Analyze backup coverage
-        all_backups = self.backup_manager.list_backups()
-        recent_backups = self.backup_manager.list_backups(since_days=7)
+        latest_backup = self.backup_manager.get_latest_backup()
+        recent_count = self.backup_manager.count_backups(since_days=7)
+        recent_backups = self.backup_manager.list_backups(since_days=7, limit=5)
 
         report["recovery_readiness"] = {
-            "total_backups": len(all_backups),
-            "recent_backups": len(recent_backups),
-            "latest_backup": all_backups[0].timestamp if all_backups else None,
+            "total_backups": self.backup_manager.count_backups(),
+            "recent_backups": recent_count,
+            "latest_backup": latest_backup.timestamp if latest_backup else None,
             "backup_integrity": "unknown"
         }
 
         # Check backup integrity for recent backups
         intact_count = 0
-        for backup in recent_backups[:5]:  # Check up to 5 recent backups
+        for backup in recent_backups:  # Check up to 5 recent backups
             backup_id = f"{backup.timestamp}_{backup.operation_type}"
             is_intact, _ = self.backup_manager.verify_backup_integrity(backup_id)
             if is_intact:
@@ -419,9 +476,9 @@ class RollbackManager:
                 report["recommendations"].append("Critical backup integrity issues - immediate attention needed")
 
         # General recommendations
-        if len(recent_backups) == 0:
+        if recent_count == 0:
             report["recommendations"].append("No recent backups - consider creating a backup")
-        elif len(recent_backups) < 3:
+        elif recent_count < 3:
             report["recommendations"].append("Limited backup history - consider more frequent backups")
 
         if integrity_check["overall_status"] != "ok":
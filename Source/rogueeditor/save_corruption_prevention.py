@@ -13,13 +13,16 @@ from __future__ import annotations
 import logging
 import os
 import time
+from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Generator, Callable
 
 from .save_validation import SaveValidator, ValidationResult, ValidationSeverity, ValidationIssue
-from .atomic_saves import AtomicSaveManager, SaveOperation
+from .atomic_saves import AtomicSaveManager, SaveOperation, serialize_json
+from .backup_store import verify_checksum
 from .enhanced_backup import EnhancedBackupManager, BackupMetadata
+from .save_writer import get_save_writer
 from .utils import trainer_save_path, slot_save_path
 
 logger = logging.getLogger(__name__)
@@ -51,6 +54,7 @@ class SaveCorruptionPreventionSystem:
     - Transaction support for multi-file operations
     - Comprehensive rollback capabilities
     - User-friendly error reporting
+    - Background writes with per-file coalescing (`*_async` methods)
     """
 
     def __init__(self, username: str):
@@ -78,12 +82,34 @@ class SaveCorruptionPreventionSystem:
         Returns:
             SaveOperationResult with operation details
         """
-        return self._safe_save_single_file(
+        return self.safe_save_trainer_async(trainer_data, operation_description).result()
+
+    def safe_save_trainer_async(self, trainer_data: Dict[str, Any],
+                                operation_description: str = "trainer_update",
+                                callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        Queue a trainer save on the background writer.
+
+        Validation and serialization happen immediately on the calling thread (so
+        later changes to `trainer_data` do not leak into the save); the backup and
+        atomic write run off-thread. A queued save of the same file that has not
+        started yet is replaced by this one.
+
+        Args:
+            trainer_data: Trainer data to save
+            operation_description: Human-readable operation description
+            callback: Optional callable receiving the finished future (runs on the writer thread; must not touch Tk)
+
+        Returns:
+            Future resolving to a SaveOperationResult
+        """
+        return self._submit_single_file(
             file_path=trainer_save_path(self.username),
             data=trainer_data,
             operation_type="trainer_save",
             operation_description=operation_description,
-            validation_type="trainer"
+            validation_type="trainer",
+            callback=callback
         )
 
     def safe_save_slot(self, slot: int, slot_data: Dict[str, Any],
@@ -99,14 +125,30 @@ class SaveCorruptionPreventionSystem:
         Returns:
             SaveOperationResult with operation details
         """
-        return self._safe_save_single_file(
+        return self.safe_save_slot_async(slot, slot_data, operation_description).result()
+
+    def safe_save_slot_async(self, slot: int, slot_data: Dict[str, Any],
+                             operation_description: str = "slot_update",
+                             callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        Queue a slot save on the background writer (see `safe_save_trainer_async`).
+
+        Returns:
+            Future resolving to a SaveOperationResult
+        """
+        return self._submit_single_file(
             file_path=slot_save_path(self.username, slot),
             data=slot_data,
             operation_type="slot_save",
             operation_description=f"{operation_description}_slot_{slot}",
-            validation_type="slot"
+            validation_type="slot",
+            callback=callback
         )
 
+    def flush_pending_saves(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued background saves to finish. Returns False on timeout."""
+        return get_save_writer().flush(timeout)
+
     @contextmanager
     def safe_transaction(self, operation_type: str,
                         operation_description: str) -> Generator[str, None, None]:
@@ -125,6 +167,9 @@ class SaveCorruptionPreventionSystem:
                 system.safe_save_trainer_in_transaction(trainer_data, tx_id)
                 system.safe_save_slot_in_transaction(1, slot_data, tx_id)
         """
+        # Queued background saves must land before the transaction snapshots and rewrites files
+        self.flush_pending_saves()
+
         # Create backup before starting transaction
         backup_id = None
         if self.auto_backup:
@@ -317,7 +362,7 @@ class SaveCorruptionPreventionSystem:
 
         # Check backup manager
         try:
-            self.backup_manager.list_backups()
+            self.backup_manager.list_backups(limit=1)
         except Exception as e:
             results["backup_manager"]["status"] = "error"
             results["backup_manager"]["issues"].append(str(e))
@@ -330,12 +375,38 @@ class SaveCorruptionPreventionSystem:
             results["atomic_manager"]["status"] = "error"
             results["atomic_manager"]["issues"].append(f"File system access: {e}")
 
+        # Re-hash local save files against the checksums recorded when they were written
+        results["save_files"] = {"status": "ok", "issues": [], "verified": 0, "unchecked": 0}
+        try:
+            for path, ok in self.verify_save_checksums().items():
+                if ok is None:
+                    results["save_files"]["unchecked"] += 1
+                elif ok:
+                    results["save_files"]["verified"] += 1
+                else:
+                    results["save_files"]["status"] = "error"
+                    results["save_files"]["issues"].append(f"Checksum mismatch: {path}")
+        except Exception as e:
+            results["save_files"]["status"] = "error"
+            results["save_files"]["issues"].append(str(e))
+
         # Overall status
         if any(component["status"] != "ok" for component in results.values() if isinstance(component, dict)):
             results["overall_status"] = "degraded"
 
         return results
 
+    def verify_save_checksums(self) -> Dict[str, Optional[bool]]:
+        """
+        Check local save files against their ``.sha256`` checksums by streaming re-hash.
+
+        Returns:
+            Mapping of existing save file path -> True/False, or None when no current
+            checksum is recorded (e.g. the file was written by a legacy path)
+        """
+        paths = [trainer_save_path(self.username)] + [slot_save_path(self.username, i) for i in range(1, 6)]
+        return {path: verify_checksum(path) for path in paths if os.path.exists(path)}
+
     def cleanup_old_data(self, keep_days: int = 30) -> Dict[str, int]:
         """
         Clean up old backups and temporary files.
@@ -377,30 +448,58 @@ class SaveCorruptionPreventionSystem:
 
         return results
 
-    def _safe_save_single_file(self, file_path: str, data: Dict[str, Any],
-                             operation_type: str, operation_description: str,
-                             validation_type: str) -> SaveOperationResult:
-        """Internal method for safe single file saving."""
-        operation_id = None
-        backup_id = None
+    def _submit_single_file(self, file_path: str, data: Dict[str, Any],
+                            operation_type: str, operation_description: str,
+                            validation_type: str,
+                            callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """Validate and serialize on the caller's thread, then queue the write."""
         validation_result = None
-        rollback_performed = False
-
+        text = None
+        error_message = None
         try:
-            # Validate data if enabled
+            # Validate data if enabled; invalid states never enter the queue, so they
+            # cannot displace a valid save that is still waiting
             if self.validate_before_save:
                 validation_result = self.validate_data(data, validation_type)
                 if validation_result.has_errors:
                     errors = [issue.message for issue in validation_result.get_errors()]
-                    return SaveOperationResult(
-                        success=False,
-                        operation_id=None,
-                        backup_id=None,
-                        validation_result=validation_result,
-                        files_saved=[],
-                        error_message=f"Validation failed: {'; '.join(errors)}"
-                    )
+                    error_message = f"Validation failed: {'; '.join(errors)}"
+            if error_message is None:
+                text = serialize_json(data)
+        except Exception as e:
+            error_message = f"Save operation failed: {e}"
+            logger.error(error_message)
+
+        if error_message is not None:
+            future: Future = Future()
+            if callback is not None:
+                future.add_done_callback(callback)
+            future.set_result(SaveOperationResult(
+                success=False,
+                operation_id=None,
+                backup_id=None,
+                validation_result=validation_result,
+                files_saved=[],
+                error_message=error_message
+            ))
+            return future
+
+        return get_save_writer().submit(
+            os.path.abspath(file_path),
+            lambda: self._safe_save_single_file(file_path, text, operation_type,
+                                                operation_description, validation_result),
+            callback=callback
+        )
+
+    def _safe_save_single_file(self, file_path: str, text: str,
+                             operation_type: str, operation_description: str,
+                             validation_result: Optional[ValidationResult]) -> SaveOperationResult:
+        """Internal method for safe single file saving (runs on the save writer thread)."""
+        operation_id = None
+        backup_id = None
+        rollback_performed = False
 
+        try:
             # Create backup if enabled and file exists
             if self.auto_backup and os.path.exists(file_path):
                 backup_id = self.backup_manager.create_operation_backup(
@@ -411,12 +510,11 @@ class SaveCorruptionPreventionSystem:
                 )
 
             # Perform atomic save
-            backup_info = self.atomic_manager.safe_write_json(
+            backup_info = self.atomic_manager.safe_write_serialized(
                 file_path=file_path,
-                data=data,
+                text=text,
                 operation=operation_description,
-                create_backup=False,  # We created our own backup above
-                validate=False  # Already validated above
+                create_backup=False  # We created our own backup above
             )
 
             return SaveOperationResult(
@@ -455,7 +553,7 @@ class SaveCorruptionPreventionSystem:
             "validation_enabled": self.validate_before_save,
             "cleanup_enabled": self.cleanup_temp_files,
             "system_integrity": self.verify_system_integrity(),
-            "recent_backups": len(self.backup_manager.list_backups(since_days=7)),
+            "recent_backups": self.backup_manager.count_backups(since_days=7),
             "username": self.username
         }
 
@@ -544,4 +642,32 @@ class SafeSaveManager:
         if not result.success:
             raise RuntimeError(f"Save failed: {result.error_message}")
 
-        return result.backup_id or "No backup created"
\ No newline at end of file
+        return result.backup_id or "No backup created"
+
+    def safe_dump_json_async(self, file_path: str, data: Dict[str, Any],
+                             operation_description: str = "Save operation",
+                             username: Optional[str] = None,
+                             callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        Queue a trainer/slot save on the background writer without blocking the caller.
+
+        Args:
+            file_path: Path to save the file (trainer.json or slot N.json)
+            data: JSON data to save
+            operation_description: Description of the operation for backup records
+            username: Username for the operation (uses default if not provided)
+            callback: Optional callable receiving the finished future; it runs on the
+                writer thread and must not touch Tk (poll ``future.done()`` from the Tk
+                thread instead)
+
+        Returns:
+            Future resolving to a SaveOperationResult
+        """
+        system = self._get_system(username)
+        name = os.path.basename(file_path)
+        if name == 'trainer.json':
+            return system.safe_save_trainer_async(data, operation_description, callback)
+        for i in range(1, 6):
+            if name == f'slot {i}.json':
+                return system.safe_save_slot_async(i, data, operation_description, callback)
+        raise ValueError(f"Background saves only support trainer and slot files: {file_path}")
\ No newline at end of file
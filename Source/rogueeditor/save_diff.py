@@ -0,0 +1,114 @@
+"""Section-level change detection for slot and system save documents.
+
+The server only accepts whole documents, so the savings come from not uploading
+at all when nothing changed and from knowing exactly what did. Each top-level
+section (`party`, `modifiers`, `dexData`, `starterData`, ...) is reduced to a
+digest of its canonical JSON; comparing digests against the last state seen on
+the server yields a `SaveDiff`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def section_digests(doc: Dict[str, Any]) -> Dict[str, str]:
+    """Map each top-level key of a save document to a digest of its canonical JSON."""
+    return {str(key): hashlib.blake2b(_canonical(value), digest_size=16).hexdigest() for key, value in doc.items()}
+
+
+@dataclass
+class SaveDiff:
+    """Top-level sections added, removed or changed relative to a baseline."""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def touched(self) -> List[str]:
+        return sorted(self.added + self.removed + self.changed)
+
+    def summary(self) -> str:
+        if not self.has_changes:
+            return "no changes"
+        parts = []
+        if self.changed:
+            parts.append("changed: " + ", ".join(sorted(self.changed)))
+        if self.added:
+            parts.append("added: " + ", ".join(sorted(self.added)))
+        if self.removed:
+            parts.append("removed: " + ", ".join(sorted(self.removed)))
+        return "; ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "has_changes": self.has_changes,
+            "added": sorted(self.added),
+            "removed": sorted(self.removed),
+            "changed": sorted(self.changed),
+            "unchanged_count": len(self.unchanged),
+        }
+
+
+def diff_digests(baseline: Dict[str, str], current: Dict[str, str]) -> SaveDiff:
+    diff = SaveDiff()
+    for key, digest in current.items():
+        if key not in baseline:
+            diff.added.append(key)
+        elif baseline[key] != digest:
+            diff.changed.append(key)
+        else:
+            diff.unchanged.append(key)
+    diff.removed = [key for key in baseline if key not in current]
+    return diff
+
+
+def diff_documents(old: Dict[str, Any], new: Dict[str, Any]) -> SaveDiff:
+    """Compare two save documents section by section."""
+    return diff_digests(section_digests(old), section_digests(new))
+
+
+class ServerStateTracker:
+    """Thread-safe record of the last known server-side digests per document.
+
+    Keys are ``"system"`` or ``"slot:<n>"`` (1-based, as in the UI).
+    """
+
+    def __init__(self):
+        self._digests: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def remember(self, key: str, doc: Any) -> None:
+        if not isinstance(doc, dict):
+            return
+        digests = section_digests(doc)
+        with self._lock:
+            self._digests[key] = digests
+
+    def forget(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._digests.clear()
+            else:
+                self._digests.pop(key, None)
+
+    def diff(self, key: str, doc: Dict[str, Any]) -> Optional[SaveDiff]:
+        """Changes in `doc` relative to the last known server state, or None without a baseline."""
+        with self._lock:
+            baseline = self._digests.get(key)
+        if baseline is None:
+            return None
+        return diff_digests(baseline, section_digests(doc))
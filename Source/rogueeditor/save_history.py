@@ -0,0 +1,415 @@
+"""Delta snapshot chains (keyframes + JSON patches) for backed-up save files.
+
+Consecutive backups of ``slot N.json`` usually differ in a handful of fields,
+so whole-file blobs still add up over a long session. `SaveHistory` keeps one
+chain per file under ``backups/history/<file name>/``:
+
+- ``log.jsonl``: one small JSON line per version (timestamp, kind, size,
+  content hash, blob reference), appended as versions are recorded. Listing
+  versions reads only this file, so thousands of versions are cheap to browse.
+- Keyframes (the full file) and deltas (an RFC 6902 patch against the
+  previous version) live in the content-addressed blob store from
+  `backup_store`, so keyframes still dedupe against ordinary backups.
+
+A keyframe is written every `BACKUP_KEYFRAME_INTERVAL` versions, and whenever a
+patch would not be much smaller than the file. Every patch is checked by
+applying it before it is recorded. Version N is rebuilt from the nearest
+keyframe at or before N plus the patches after it.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .backup_store import BlobStore, atomic_write_bytes, encode_snapshot_json, get_blob_store, hash_bytes
+from .config import BACKUP_KEYFRAME_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIR = "history"
+_LOG_NAME = "log.jsonl"
+
+KIND_KEYFRAME = "key"
+KIND_DELTA = "delta"
+
+
+# --- JSON patch (add / remove / replace subset of RFC 6902) ---
+
+def _pointer_escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _pointer_parts(path: str) -> List[str]:
+    if not path:
+        return []
+    return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+
+
+def _same(a: Any, b: Any) -> bool:
+    # Strict equality: plain == treats 1, 1.0 and True as equal, also inside containers
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return len(a) == len(b) and all(k in b and _same(v, b[k]) for k, v in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _diff_into(old: Any, new: Any, path: str, ops: List[Dict[str, Any]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_pointer_escape(key)}"})
+        for key, value in new.items():
+            sub = f"{path}/{_pointer_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": sub, "value": value})
+            elif not _same(old[key], value):
+                _diff_into(old[key], value, sub, ops)
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for i in range(common):
+            if not _same(old[i], new[i]):
+                _diff_into(old[i], new[i], f"{path}/{i}", ops)
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        return
+    ops.append({"op": "replace", "path": path, "value": new})
+
+
+def make_json_patch(old: Any, new: Any) -> List[Dict[str, Any]]:
+    """Patch operations turning `old` into `new` (lists are diffed by index)."""
+    ops: List[Dict[str, Any]] = []
+    if not _same(old, new):
+        _diff_into(old, new, "", ops)
+    return ops
+
+
+def apply_json_patch(doc: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply `ops` to `doc` in place and return the result (the root may be replaced)."""
+    for op in ops:
+        parts = _pointer_parts(op["path"])
+        if not parts:
+            if op["op"] == "remove":
+                raise ValueError("cannot remove the document root")
+            doc = op["value"]
+            continue
+        parent = doc
+        for part in parts[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        last = parts[-1]
+        if isinstance(parent, list):
+            idx = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(idx, op["value"])
+            elif op["op"] == "remove":
+                del parent[idx]
+            else:
+                parent[idx] = op["value"]
+        else:
+            if op["op"] == "remove":
+                del parent[last]
+            else:
+                parent[last] = op["value"]
+    return doc
+
+
+def _doc_digest(doc: Any) -> str:
+    canonical = json.dumps(doc, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# --- History chains ---
+
+@dataclass
+class HistoryVersion:
+    """One recorded version of a file in its delta chain."""
+    version: int
+    timestamp: str
+    kind: str
+    size_bytes: int
+    content_hash: str
+    doc_hash: str
+    blob: str
+    operation: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "HistoryVersion":
+        return cls(
+            version=int(d["v"]),
+            timestamp=str(d.get("ts") or ""),
+            kind=str(d.get("kind") or KIND_KEYFRAME),
+            size_bytes=int(d.get("size") or 0),
+            content_hash=str(d.get("hash") or ""),
+            doc_hash=str(d.get("doc") or ""),
+            blob=str(d.get("blob") or ""),
+            operation=str(d.get("op") or ""),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"v": self.version, "ts": self.timestamp, "kind": self.kind, "size": self.size_bytes,
+                "hash": self.content_hash, "doc": self.doc_hash, "blob": self.blob, "op": self.operation}
+
+
+def _timestamp() -> str:
+    return time.strftime("%Y%m%d_%H%M%S") + f"_{int(time.time() * 1000) % 1000:03d}"
+
+
+class SaveHistory:
+    """Keyframe + delta chain for one save file (e.g. ``slot 1.json``). Thread-safe."""
+
+    def __init__(self, backup_root: str, file_name: str, keyframe_interval: Optional[int] = None):
+        self.file_name = file_name
+        self.dir = os.path.join(backup_root, HISTORY_DIR, file_name)
+        self.log_path = os.path.join(self.dir, _LOG_NAME)
+        self.store: BlobStore = get_blob_store(backup_root)
+        self.keyframe_interval = max(1, int(keyframe_interval or BACKUP_KEYFRAME_INTERVAL))
+        self._lock = threading.RLock()
+        self._versions: Optional[List[HistoryVersion]] = None
+        self._log_mtime: Optional[float] = None
+        # (version, parsed document) of the newest version, to diff the next record against
+        self._tip: Optional[Tuple[int, Any]] = None
+
+    # Log access
+    def _load(self) -> List[HistoryVersion]:
+        try:
+            mtime = os.path.getmtime(self.log_path)
+        except OSError:
+            self._versions, self._log_mtime = [], None
+            return self._versions
+        if self._versions is not None and self._log_mtime == mtime:
+            return self._versions
+        versions: List[HistoryVersion] = []
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    versions.append(HistoryVersion.from_dict(json.loads(line)))
+                except (ValueError, KeyError, TypeError) as e:
+                    # A torn final line from an interrupted append is skipped, not fatal
+                    logger.warning(f"Skipping unreadable history entry in {self.log_path}: {e}")
+        self._versions, self._log_mtime = versions, mtime
+        if self._tip is not None and (not versions or versions[-1].version != self._tip[0]):
+            self._tip = None
+        return versions
+
+    def _append(self, entry: HistoryVersion) -> None:
+        os.makedirs(self.dir, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if self._versions is None:
+            self._versions = []
+        self._versions.append(entry)
+        self._log_mtime = os.path.getmtime(self.log_path)
+
+    def versions(self) -> List[HistoryVersion]:
+        """All recorded versions, oldest first (reads only the log)."""
+        with self._lock:
+            return list(self._load())
+
+    def latest(self) -> Optional[HistoryVersion]:
+        with self._lock:
+            versions = self._load()
+            return versions[-1] if versions else None
+
+    def get(self, version: int) -> Optional[HistoryVersion]:
+        with self._lock:
+            for v in reversed(self._load()):
+                if v.version == version:
+                    return v
+        return None
+
+    # Recording
+    def record(self, content: bytes, operation: str = "") -> HistoryVersion:
+        """Add `content` as the next version; unchanged content returns the latest version as-is."""
+        content_hash = hash_bytes(content)
+        with self._lock:
+            versions = self._load()
+            last = versions[-1] if versions else None
+            if last is not None and last.content_hash == content_hash:
+                return last
+
+            doc = json.loads(content.decode("utf-8"))
+            doc_hash = _doc_digest(doc)
+            number = last.version + 1 if last is not None else 1
+            since_key = 0
+            for v in reversed(versions):
+                if v.kind == KIND_KEYFRAME:
+                    break
+                since_key += 1
+
+            entry: Optional[HistoryVersion] = None
+            if last is not None and since_key + 1 < self.keyframe_interval:
+                entry = self._try_delta(last, doc, doc_hash, content, number, operation)
+            if entry is None:
+                entry = HistoryVersion(number, _timestamp(), KIND_KEYFRAME, len(content), content_hash,
+                                       doc_hash, self.store.put_bytes(content), operation)
+            self._append(entry)
+            self._tip = (number, doc)
+            return entry
+
+    def _try_delta(self, last: HistoryVersion, doc: Any, doc_hash: str, content: bytes,
+                   number: int, operation: str) -> Optional[HistoryVersion]:
+        # A delta version is restored by re-serializing its document, which only
+        # reproduces the original bytes for files written in that exact format
+        # (e.g. not CRLF output from a text-mode dump on Windows)
+        if encode_snapshot_json(doc) != content:
+            return None
+        try:
+            prev = self._tip[1] if self._tip is not None and self._tip[0] == last.version \
+                else self.document(last.version)
+            ops = make_json_patch(prev, doc)
+            patch = json.dumps(ops, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            # A patch that is not clearly smaller than the file is not worth a chain link
+            if len(patch) * 2 > len(content):
+                return None
+            if _doc_digest(apply_json_patch(copy.deepcopy(prev), ops)) != doc_hash:
+                return None
+        except Exception as e:
+            logger.debug(f"Delta for {self.file_name} v{number} failed, writing keyframe: {e}")
+            return None
+        return HistoryVersion(number, _timestamp(), KIND_DELTA, len(content), hash_bytes(content),
+                              doc_hash, self.store.put_bytes(patch), operation)
+
+    # Reconstruction
+    def document(self, version: int) -> Any:
+        """Parsed document of `version`, rebuilt from its keyframe and the deltas after it."""
+        with self._lock:
+            versions = self._load()
+            pos = next((i for i in range(len(versions) - 1, -1, -1) if versions[i].version == version), None)
+            if pos is None:
+                raise KeyError(f"{self.file_name}: no version {version}")
+            if self._tip is not None and self._tip[0] == version:
+                return copy.deepcopy(self._tip[1])
+            start = pos
+            while start >= 0 and versions[start].kind != KIND_KEYFRAME:
+                start -= 1
+            if start < 0:
+                raise RuntimeError(f"{self.file_name}: no keyframe before version {version}")
+            doc = json.loads(self.store.get_bytes(versions[start].blob).decode("utf-8"))
+            for v in versions[start + 1:pos + 1]:
+                doc = apply_json_patch(doc, json.loads(self.store.get_bytes(v.blob).decode("utf-8")))
+            if _doc_digest(doc) != versions[pos].doc_hash:
+                raise RuntimeError(f"{self.file_name}: version {version} failed verification after rebuild")
+            return doc
+
+    def content(self, version: int) -> bytes:
+        """File bytes of `version`: the stored bytes for keyframes, re-serialized JSON for deltas.
+
+        Deltas are only recorded for files in the `encode_snapshot_json` format, so
+        both kinds reproduce the original bytes. Deltas recorded before that rule
+        may not; they still rebuild the verified document, which is returned.
+        """
+        entry = self.get(version)
+        if entry is None:
+            raise KeyError(f"{self.file_name}: no version {version}")
+        if entry.kind == KIND_KEYFRAME:
+            return self.store.get_bytes(entry.blob)
+        data = encode_snapshot_json(self.document(version))
+        if hash_bytes(data) != entry.content_hash:
+            logger.warning(f"{self.file_name} v{version}: restoring re-serialized document "
+                           f"(original file formatting differed)")
+        return data
+
+    def restore(self, version: int, dest_path: str) -> int:
+        """Atomically write `version` to `dest_path`. Returns the number of bytes written."""
+        data = self.content(version)
+        atomic_write_bytes(dest_path, data, checksum=True)
+        return len(data)
+
+    def verify(self, version: int, rebuild: bool = False) -> bool:
+        """Check that `version` can be rebuilt.
+
+        By default every blob in its chain (keyframe plus deltas) is re-hashed in
+        chunks against its content address, which is enough to catch damaged or
+        missing files without parsing anything. `rebuild=True` also replays the
+        chain and checks the resulting document hash.
+        """
+        if rebuild:
+            try:
+                self.document(version)
+                return True
+            except Exception:
+                return False
+        with self._lock:
+            versions = self._load()
+            pos = next((i for i in range(len(versions) - 1, -1, -1) if versions[i].version == version), None)
+            if pos is None:
+                return False
+            start = pos
+            while start >= 0 and versions[start].kind != KIND_KEYFRAME:
+                start -= 1
+            if start < 0:
+                return False
+            chain = versions[start:pos + 1]
+        return all(self.store.verify(v.blob) for v in chain)
+
+    # Maintenance
+    def referenced_blobs(self) -> Set[str]:
+        return {v.blob for v in self.versions() if v.blob}
+
+    def truncate_before(self, version: int) -> int:
+        """Drop versions older than `version`, re-keying it if it is a delta. Returns the count dropped."""
+        with self._lock:
+            versions = self._load()
+            pos = next((i for i, v in enumerate(versions) if v.version >= version), None)
+            if not pos:
+                return 0
+            kept = versions[pos:]
+            head = kept[0]
+            if head.kind != KIND_KEYFRAME:
+                data = self.content(head.version)
+                kept[0] = HistoryVersion(head.version, head.timestamp, KIND_KEYFRAME, head.size_bytes,
+                                         head.content_hash, head.doc_hash, self.store.put_bytes(data),
+                                         head.operation)
+            body = "".join(json.dumps(v.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n"
+                           for v in kept)
+            atomic_write_bytes(self.log_path, body.encode("utf-8"))
+            self._versions, self._log_mtime = kept, os.path.getmtime(self.log_path)
+            return pos
+
+    def stats(self) -> Dict[str, int]:
+        versions = self.versions()
+        return {
+            "versions": len(versions),
+            "keyframes": sum(1 for v in versions if v.kind == KIND_KEYFRAME),
+            "logical_bytes": sum(v.size_bytes for v in versions),
+        }
+
+
+_HISTORIES: Dict[Tuple[str, str], SaveHistory] = {}
+_HISTORIES_LOCK = threading.Lock()
+
+
+def get_save_history(backup_root: str, file_name: str) -> SaveHistory:
+    """Shared chain for `file_name` under a ``backups`` directory (one instance per process)."""
+    key = (os.path.abspath(backup_root), file_name)
+    with _HISTORIES_LOCK:
+        history = _HISTORIES.get(key)
+        if history is None:
+            history = _HISTORIES[key] = SaveHistory(key[0], file_name)
+        return history
+
+
+def list_histories(backup_root: str) -> List[SaveHistory]:
+    root = os.path.join(backup_root, HISTORY_DIR)
+    if not os.path.isdir(root):
+        return []
+    return [get_save_history(backup_root, name) for name in sorted(os.listdir(root))
+            if os.path.exists(os.path.join(root, name, _LOG_NAME))]
@@ -85,10 +85,10 @@ class SaveValidator:
         """Load reference catalogs for validation."""
         try:
             from .catalog import (
-                load_pokemon_catalog, load_move_catalog,
+                load_pokemon_catalog_view, load_move_catalog,
                 load_ability_catalog, load_nature_catalog
             )
-            self.pokemon_catalog = load_pokemon_catalog()
+            self.pokemon_catalog = load_pokemon_catalog_view()
             self.move_catalog, _ = load_move_catalog()
             self.ability_catalog, _ = load_ability_catalog()
             self.nature_catalog, _ = load_nature_catalog()
@@ -0,0 +1,160 @@
+"""Background persistence queue for local save files.
+
+`SaveCorruptionPreventionSystem` saves (operation backup, atomic JSON write,
+read-back check, rename) used to run on the caller's thread, often the Tk
+thread. `BackgroundSaveWriter` runs them on a single worker thread instead:
+
+- Jobs are keyed by target file. A job submitted while an earlier job for the
+  same file is still queued replaces it (only the latest state is written),
+  and every coalesced caller's future resolves with the result of the write
+  that actually ran.
+- One worker runs jobs in submission order, so writes to a file never reorder
+  and never race each other.
+- A future resolves only after the job has finished (backup written, file
+  renamed into place), exactly as the synchronous call returned before.
+  Pending jobs are drained at interpreter exit.
+
+Callbacks passed to `submit()` run on the worker thread and must not touch Tk:
+with threaded Tcl a widget call from another thread waits for the main loop,
+which deadlocks if the Tk thread is itself blocked on a synchronous save
+queued behind that callback. GUI code polls ``future.done()`` from the Tk
+thread instead (see ``RogueManagerGUI._when_done`` in ``gui.py``).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    __slots__ = ("fn", "futures")
+
+    def __init__(self, fn: Callable[[], Any], future: Future):
+        self.fn = fn
+        self.futures: List[Future] = [future]
+
+
+class BackgroundSaveWriter:
+    """Single-thread, per-file coalescing job queue."""
+
+    def __init__(self, name: str = "rogueeditor-save-writer"):
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[str, _Job]" = OrderedDict()
+        self._running: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.submitted = 0
+        self.coalesced = 0
+        self.completed = 0
+
+    def in_worker(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, key: str, fn: Callable[[], Any],
+               callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """Queue `fn` as the next write of `key`, replacing a queued (not yet running) one."""
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        if self.in_worker():
+            # Re-entrant submit (e.g. from a callback): run now rather than wait on ourselves
+            self._run(_Job(fn, future))
+            return future
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Save writer is shut down")
+            self.submitted += 1
+            job = self._pending.get(key)
+            if job is not None:
+                job.fn = fn
+                job.futures.append(future)
+                self.coalesced += 1
+            else:
+                self._pending[key] = _Job(fn, future)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    def _run(self, job: _Job) -> None:
+        futures = [f for f in job.futures if f.set_running_or_notify_cancel()]
+        if not futures:
+            return
+        try:
+            result = job.fn()
+        except BaseException as e:
+            logger.error(f"Background save failed: {e}")
+            for f in futures:
+                f.set_exception(e)
+        else:
+            for f in futures:
+                f.set_result(result)
+        self.completed += 1
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                key, job = self._pending.popitem(last=False)
+                self._running = key
+            try:
+                self._run(job)
+            finally:
+                with self._cond:
+                    self._running = None
+                    self._cond.notify_all()
+
+    def is_pending(self, key: Optional[str] = None) -> bool:
+        with self._cond:
+            if key is None:
+                return bool(self._pending) or self._running is not None
+            return key in self._pending or self._running == key
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued write has finished. Returns False on timeout."""
+        if self.in_worker():
+            return not self._pending
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and self._running is None, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait and self._thread is not None and not self.in_worker():
+            self._thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "completed": self.completed,
+                "pending": len(self._pending) + (1 if self._running is not None else 0),
+            }
+
+
+_WRITER: Optional[BackgroundSaveWriter] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_save_writer() -> BackgroundSaveWriter:
+    """Process-wide save writer (pending saves are flushed at exit)."""
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = BackgroundSaveWriter()
+            atexit.register(_WRITER.shutdown)
+        return _WRITER
@@ -0,0 +1,187 @@
+"""Shared search index for name -> id catalogs (moves, abilities, species, ...).
+
+Pickers used to rescan every name and run `difflib.get_close_matches` over the
+whole catalog on each keystroke. `CatalogSearchIndex` is built once per catalog:
+
+- a sorted key list answers prefix queries with `bisect`;
+- a trigram inverted index narrows substring queries to a few candidates;
+- padded trigrams give ranked fuzzy matches (Dice overlap, then a
+  `difflib` ratio over the best few) for typos.
+
+Results are ranked exact, prefix, word-prefix, substring; fuzzy matches are
+only offered when none of those match. Extra search
+labels (e.g. move display labels next to enum names) can be attached with
+`extra_ids`; hits on them resolve to the catalog names carrying the same id.
+`get_search_index()` keeps recently used indexes so the CLI selector and all
+GUI pickers share them.
+"""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+
+def normalize_key(s: str) -> str:
+    """Search key: lowercase, spaces/dashes as underscores, apostrophes and dots dropped."""
+    return str(s).strip().lower().replace(" ", "_").replace("-", "_").replace("'", "").replace(".", "")
+
+
+def _trigrams(s: str) -> Set[str]:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def _padded_trigrams(s: str) -> Set[str]:
+    return _trigrams(f"  {s} ")
+
+
+class CatalogSearchIndex:
+    """Immutable prefix/trigram index over the names of one catalog."""
+
+    FUZZY_CANDIDATES = 24
+    FUZZY_MIN_DICE = 0.3
+    FUZZY_CUTOFF = 0.6
+
+    def __init__(self, name_to_id: Mapping[str, int], extra_ids: Optional[Mapping[str, int]] = None):
+        self.names: List[str] = sorted(name_to_id)
+        by_id: Dict[object, List[int]] = {}
+        for pos, name in enumerate(self.names):
+            by_id.setdefault(name_to_id[name], []).append(pos)
+
+        # Searchable keys: each catalog name, plus extra labels pointing at names with the same id
+        keys: List[Tuple[str, Tuple[int, ...]]] = [(normalize_key(n), (pos,)) for pos, n in enumerate(self.names)]
+        seen = {k for k, _ in keys}
+        for label, iid in (extra_ids or {}).items():
+            targets = by_id.get(iid)
+            k = normalize_key(label)
+            if targets and k and k not in seen:
+                keys.append((k, tuple(targets)))
+                seen.add(k)
+        keys.sort(key=lambda kv: kv[0])
+        self._keys: List[str] = [k for k, _ in keys]
+        self._targets: List[Tuple[int, ...]] = [t for _, t in keys]
+
+        self._tri: Dict[str, List[int]] = {}
+        self._fuzzy: Dict[str, List[int]] = {}
+        self._fuzzy_sizes: List[int] = []
+        self._word_starts: List[Tuple[str, int]] = []
+        for kpos, k in enumerate(self._keys):
+            for g in _trigrams(k):
+                self._tri.setdefault(g, []).append(kpos)
+            padded = _padded_trigrams(k)
+            self._fuzzy_sizes.append(len(padded))
+            for g in padded:
+                self._fuzzy.setdefault(g, []).append(kpos)
+            for i, ch in enumerate(k):
+                if i > 0 and k[i - 1] == "_" and ch != "_":
+                    self._word_starts.append((k[i:], kpos))
+        self._word_starts.sort()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # --- Matching tiers (each returns key positions in key order) ---
+    def _prefix(self, k: str) -> List[int]:
+        out = []
+        i = bisect.bisect_left(self._keys, k)
+        while i < len(self._keys) and self._keys[i].startswith(k):
+            out.append(i)
+            i += 1
+        return out
+
+    def _word_prefix(self, k: str) -> List[int]:
+        out = []
+        i = bisect.bisect_left(self._word_starts, (k, -1))
+        while i < len(self._word_starts) and self._word_starts[i][0].startswith(k):
+            out.append(self._word_starts[i][1])
+            i += 1
+        return sorted(set(out))
+
+    def _substring(self, k: str) -> List[int]:
+        grams = _trigrams(k)
+        if not grams:
+            return [i for i, key in enumerate(self._keys) if k in key]
+        postings = sorted((self._tri.get(g, ()) for g in grams), key=len)
+        if not postings[0]:
+            return []
+        cand = set(postings[0])
+        for p in postings[1:]:
+            cand.intersection_update(p)
+            if not cand:
+                return []
+        return sorted(i for i in cand if k in self._keys[i])
+
+    def _fuzzy_matches(self, k: str) -> List[int]:
+        grams = _padded_trigrams(k)
+        counts: Dict[int, int] = {}
+        for g in grams:
+            for kpos in self._fuzzy.get(g, ()):
+                counts[kpos] = counts.get(kpos, 0) + 1
+        scored = []
+        for kpos, shared in counts.items():
+            dice = 2.0 * shared / (len(grams) + self._fuzzy_sizes[kpos])
+            if dice >= self.FUZZY_MIN_DICE:
+                scored.append((dice, kpos))
+        scored.sort(reverse=True)
+        ranked = []
+        for _, kpos in scored[:self.FUZZY_CANDIDATES]:
+            ratio = difflib.SequenceMatcher(None, k, self._keys[kpos]).ratio()
+            if ratio >= self.FUZZY_CUTOFF:
+                ranked.append((ratio, kpos))
+        ranked.sort(key=lambda rk: (-rk[0], self._keys[rk[1]]))
+        return [kpos for _, kpos in ranked]
+
+    # --- Public API ---
+    def search(self, query: str, limit: Optional[int] = 50, fuzzy: bool = True) -> List[str]:
+        """Catalog names matching `query`, best first. An empty query lists the catalog in order.
+
+        `limit=None` returns every match.
+        """
+        k = normalize_key(query)
+        if not k:
+            return self.names[:limit] if limit else list(self.names)
+        out: List[str] = []
+        seen: Set[int] = set()
+
+        def take(kpositions) -> bool:
+            for kpos in kpositions:
+                for pos in self._targets[kpos]:
+                    if pos not in seen:
+                        seen.add(pos)
+                        out.append(self.names[pos])
+                        if limit and len(out) >= limit:
+                            return True
+            return False
+
+        prefix = self._prefix(k)
+        exact = [kpos for kpos in prefix if self._keys[kpos] == k]
+        if take(exact) or take(prefix) or take(self._word_prefix(k)) or take(self._substring(k)):
+            return out
+        if fuzzy and not out and len(k) >= 3:
+            take(self._fuzzy_matches(k))
+        return out
+
+
+_CACHE: "OrderedDict[Tuple[int, int], Tuple[Mapping, Optional[Mapping], int, CatalogSearchIndex]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_SIZE = 16
+
+
+def get_search_index(name_to_id: Mapping[str, int], extra_ids: Optional[Mapping[str, int]] = None) -> CatalogSearchIndex:
+    """Shared index for a catalog mapping, rebuilt only when a different (or resized) mapping is passed."""
+    key = (id(name_to_id), id(extra_ids))
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None and hit[0] is name_to_id and hit[1] is extra_ids and hit[2] == len(name_to_id):
+            _CACHE.move_to_end(key)
+            return hit[3]
+    index = CatalogSearchIndex(name_to_id, extra_ids)
+    with _CACHE_LOCK:
+        _CACHE[key] = (name_to_id, extra_ids, len(name_to_id), index)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return index
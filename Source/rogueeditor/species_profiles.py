@@ -0,0 +1,261 @@
+"""Per-species profiles combining every static fact the editors need about a species.
+
+The team editor, CLI listings and coverage code used to assemble a species
+from several catalogs on every selection: `pokemon_catalog` (name, types,
+stats, thumbnails), `base_stats` as a fallback, the growth group map and the
+alternative forms catalog (form types/stats/abilities). `SpeciesProfile` holds
+all of that in one compact `__slots__` record, built in a single pass over
+those sources the first time a species is requested and shared process-wide
+through `get_species_profile()`.
+
+Profiles are read-only snapshots; type names are lowercase and base stats are
+``(hp, atk, def, spa, spd, spe)`` tuples. The store is registered in the
+catalog registry as ``species_profiles``, so `invalidate_catalogs()` drops it
+together with the catalogs it was built from.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .catalog_registry import get_catalog_registry
+
+_STAT_KEYS = ("hp", "attack", "defense", "sp_atk", "sp_def", "speed")
+
+Types = Tuple[str, Optional[str]]
+Stats = Tuple[int, int, int, int, int, int]
+
+
+def _types_of(raw: Any) -> Optional[Types]:
+    if not isinstance(raw, dict) or not raw.get("type1"):
+        return None
+    t1 = str(raw.get("type1")).strip().lower()
+    t2 = str(raw.get("type2")).strip().lower() if raw.get("type2") else None
+    return (t1, t2)
+
+
+def _stats_of(raw: Any) -> Optional[Stats]:
+    if isinstance(raw, dict):
+        try:
+            return tuple(int(raw.get(k) or 0) for k in _STAT_KEYS)  # type: ignore[return-value]
+        except (TypeError, ValueError):
+            return None
+    if isinstance(raw, (list, tuple)) and len(raw) == 6:
+        try:
+            return tuple(int(x) for x in raw)  # type: ignore[return-value]
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _ability_key(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.strip().lower()).strip("_")
+
+
+class FormProfile:
+    """One alternative form of a species. Unknown facts are None (use the species value)."""
+
+    __slots__ = ("slug", "display_name", "types", "base_stats", "thumbnail", "ability_id")
+
+    def __init__(self, slug: str, display_name: str, types: Optional[Types], base_stats: Optional[Stats],
+                 thumbnail: Optional[str], ability_id: Optional[int]):
+        self.slug = slug
+        self.display_name = display_name
+        self.types = types
+        self.base_stats = base_stats
+        self.thumbnail = thumbnail
+        self.ability_id = ability_id
+
+    def __repr__(self) -> str:
+        return f"FormProfile({self.slug!r}, {self.display_name!r})"
+
+
+class SpeciesProfile:
+    """Static data for one species: types, base stats, growth index, forms, thumbnail and ability ids."""
+
+    __slots__ = ("dex", "name", "types", "base_stats", "base_stats_source", "growth_index",
+                 "forms", "thumbnail", "ability_ids")
+
+    def __init__(self, dex: int, name: str, types: Types, base_stats: Optional[Stats],
+                 base_stats_source: Optional[str], growth_index: Optional[int],
+                 forms: Tuple[FormProfile, ...], thumbnail: Optional[str], ability_ids: Tuple[int, ...]):
+        self.dex = dex
+        self.name = name
+        self.types = types
+        self.base_stats = base_stats
+        self.base_stats_source = base_stats_source
+        self.growth_index = growth_index
+        self.forms = forms
+        self.thumbnail = thumbnail
+        self.ability_ids = ability_ids
+
+    def __repr__(self) -> str:
+        return f"SpeciesProfile({self.dex}, {self.name!r}, types={self.types})"
+
+    def form(self, slug: Optional[str]) -> Optional[FormProfile]:
+        if not slug:
+            return None
+        for f in self.forms:
+            if f.slug == slug:
+                return f
+        return None
+
+    def types_for(self, form_slug: Optional[str] = None) -> Types:
+        f = self.form(form_slug)
+        return f.types if f is not None and f.types else self.types
+
+    def base_stats_for(self, form_slug: Optional[str] = None) -> Optional[Stats]:
+        f = self.form(form_slug)
+        return f.base_stats if f is not None and f.base_stats else self.base_stats
+
+    def thumbnail_for(self, form_slug: Optional[str] = None) -> Optional[str]:
+        f = self.form(form_slug)
+        return f.thumbnail if f is not None and f.thumbnail else self.thumbnail
+
+    def display_name(self, form_slug: Optional[str] = None) -> str:
+        """``"Name (Form)"`` for a known form, else the species name."""
+        f = self.form(form_slug)
+        return f"{self.name} ({f.display_name})" if f is not None and f.display_name else self.name
+
+
+def build_species_profile(dex: int) -> Optional[SpeciesProfile]:
+    """Assemble the profile for `dex` from the cached catalogs; None when the species is unknown."""
+    from .catalog import (
+        get_pokemon_catalog_entry,
+        get_pokemon_alternative_forms,
+        load_ability_catalog,
+        load_growth_group_map,
+    )
+    from .base_stats import get_base_stats_by_species_id
+
+    dex = int(dex)
+    entry = get_pokemon_catalog_entry(dex) or {}
+    base_stats = _stats_of(entry.get("stats"))
+    base_stats_source = "catalog (by dex)" if base_stats else None
+    if base_stats is None:
+        base_stats = _stats_of(get_base_stats_by_species_id(dex))
+        base_stats_source = "fallback" if base_stats else None
+    if not entry and base_stats is None:
+        return None
+
+    try:
+        growth = load_growth_group_map().get(dex)
+    except Exception:
+        growth = None
+
+    try:
+        ability_n2i = load_ability_catalog()[0]
+    except Exception:
+        ability_n2i = {}
+
+    def ability_id(name: Any) -> Optional[int]:
+        if not name:
+            return None
+        iid = ability_n2i.get(_ability_key(str(name)))
+        return int(iid) if iid is not None else None
+
+    thumbs = entry.get("thumbnails") or {}
+    thumb_forms = thumbs.get("forms") or {}
+    forms: List[FormProfile] = []
+    by_display: Dict[str, int] = {}
+    for slug, f in (entry.get("forms") or {}).items():
+        if not isinstance(f, dict):
+            continue
+        by_display[str(f.get("display_name") or "").strip().lower()] = len(forms)
+        forms.append(FormProfile(str(slug), str(f.get("display_name") or slug), _types_of(f.get("types")),
+                                 _stats_of(f.get("stats")), f.get("thumbnail") or thumb_forms.get(slug), None))
+
+    # Alternative forms carry the form abilities; merge them into the catalog forms by display name
+    ability_ids: List[int] = []
+    try:
+        alt = get_pokemon_alternative_forms(dex) or {}
+    except Exception:
+        alt = {}
+    for af in alt.get("forms") or []:
+        if not isinstance(af, dict):
+            continue
+        aid = ability_id(af.get("ability"))
+        if aid is not None and aid not in ability_ids:
+            ability_ids.append(aid)
+        pos = by_display.get(str(af.get("form_name") or "").strip().lower())
+        if pos is not None:
+            forms[pos].ability_id = aid
+            if forms[pos].types is None:
+                forms[pos].types = _types_of(af.get("types"))
+            if forms[pos].base_stats is None:
+                forms[pos].base_stats = _stats_of(af.get("stats"))
+        else:
+            slug = str(af.get("form_key") or af.get("form_name") or "")
+            if slug:
+                forms.append(FormProfile(slug, str(af.get("form_name") or slug), _types_of(af.get("types")),
+                                         _stats_of(af.get("stats")), None, aid))
+
+    return SpeciesProfile(
+        dex=dex,
+        name=str(entry.get("name") or f"#{dex}"),
+        types=_types_of(entry.get("types")) or ("unknown", None),
+        base_stats=base_stats,
+        base_stats_source=base_stats_source,
+        growth_index=int(growth) if growth is not None else None,
+        forms=tuple(forms),
+        thumbnail=thumbs.get("default"),
+        ability_ids=tuple(ability_ids),
+    )
+
+
+class SpeciesProfileStore:
+    """Lazily filled dex -> SpeciesProfile map. Thread-safe; unknown species are remembered as None."""
+
+    def __init__(self):
+        self._profiles: Dict[int, Optional[SpeciesProfile]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._profiles)
+
+    def get(self, dex: Any) -> Optional[SpeciesProfile]:
+        try:
+            key = int(dex)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            if key in self._profiles:
+                return self._profiles[key]
+        try:
+            profile = build_species_profile(key)
+        except Exception:
+            profile = None
+        with self._lock:
+            return self._profiles.setdefault(key, profile)
+
+    def many(self, dex_ids: Iterable[Any]) -> Dict[int, Optional[SpeciesProfile]]:
+        out: Dict[int, Optional[SpeciesProfile]] = {}
+        for d in dex_ids:
+            try:
+                out[int(d)] = self.get(d)
+            except (TypeError, ValueError):
+                continue
+        return out
+
+    def build_all(self) -> int:
+        """Build every species in the catalog up front. Returns the number of known profiles."""
+        from .catalog import load_pokemon_catalog_view
+        by_dex = (load_pokemon_catalog_view() or {}).get("by_dex") or {}
+        return sum(1 for p in self.many(by_dex).values() if p is not None)
+
+
+_CATALOGS = get_catalog_registry()
+
+
+@_CATALOGS.catalog("species_profiles")
+def get_species_profile_store() -> SpeciesProfileStore:
+    """Process-wide profile store (cached in the catalog registry)."""
+    return SpeciesProfileStore()
+
+
+def get_species_profile(dex: Any) -> Optional[SpeciesProfile]:
+    """Shared profile for a dex id, or None when the species is unknown."""
+    return get_species_profile_store().get(dex)
@@ -6,7 +6,6 @@ from typing import Optional, Any
 import secrets
 import base64
 from collections.abc import Mapping
-import difflib
 
 
 def repo_path(*parts: str) -> str:
@@ -97,9 +96,12 @@ def dump_json(path: str, data: Any) -> None:
     This function directly overwrites files without backup or validation.
     Use safe_dump_json() or the SaveCorruptionPreventionSystem for new code.
     """
+    from .backup_store import discard_checksum
+
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    discard_checksum(path)
 
 
 def safe_dump_json(path: str, data: Any, operation_description: str = "save_operation") -> bool:
@@ -299,25 +301,19 @@ def normalize_name(name: str) -> str:
     return name.strip().lower().replace(" ", "_")
 
 
-def suggest_from_catalog(query: str, name_to_id: dict[str, int], limit: int = 10) -> list[str]:
-    key = normalize_name(query)
-    names = list(name_to_id.keys())
-    # Substring matches first
-    subs = [n for n in names if key in n]
-    # Add close matches next
-    close = difflib.get_close_matches(key, names, n=limit, cutoff=0.6)
-    merged = []
-    for n in subs + close:
-        if n not in merged:
-            merged.append(n)
-        if len(merged) >= limit:
-            break
-    return merged
+def suggest_from_catalog(query: str, name_to_id: dict[str, int], limit: int = 10,
+                         extra_ids: Optional[dict[str, int]] = None) -> list[str]:
+    """Ranked catalog names for a partial or misspelled query (prefix, substring, then fuzzy)."""
+    from .search_index import get_search_index
+    return get_search_index(name_to_id, extra_ids).search(query, limit=limit)
 
 
-def select_from_catalog(prompt: str, name_to_id: dict[str, int]) -> int | None:
+def select_from_catalog(prompt: str, name_to_id: dict[str, int],
+                        extra_ids: Optional[dict[str, int]] = None) -> int | None:
     """Interactive selector: accepts id, or shows suggestions for partial names.
 
+    `extra_ids` adds alternative searchable labels (e.g. move display names).
+
     - Enter numeric id to accept directly
     - Enter name (partial) to get a suggestion list to pick by number
     - Enter blank to cancel (returns None)
@@ -331,7 +327,7 @@ def select_from_catalog(prompt: str, name_to_id: dict[str, int]) -> int | None:
         key = normalize_name(raw)
         if key in name_to_id:
             return name_to_id[key]
-        suggestions = suggest_from_catalog(raw, name_to_id, limit=10)
+        suggestions = suggest_from_catalog(raw, name_to_id, limit=10, extra_ids=extra_ids)
         if not suggestions:
             print("No matches; try again or enter id.")
             continue
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Make `rogueeditor` importable when pytest is run from the repository root
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SOURCE_DIR not in sys.path:
+    sys.path.insert(0, SOURCE_DIR)
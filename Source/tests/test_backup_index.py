@@ -0,0 +1,170 @@
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from rogueeditor.backup_index import INDEX_FILE, BackupIndex, timestamp_epoch
+
+
+def _meta(ts, op="team_edit", files=("slot 1.json",), size=100):
+    return {"timestamp": ts, "operation_type": op, "files_backed_up": list(files), "total_size_bytes": size}
+
+
+def _write_backup(root, backup_id, metadata, entries=None):
+    meta_dir = root / "metadata"
+    meta_dir.mkdir(parents=True, exist_ok=True)
+    (meta_dir / f"{backup_id}.json").write_text(json.dumps(metadata), encoding="utf-8")
+    if entries is not None:
+        op_dir = root / "operations" / backup_id
+        op_dir.mkdir(parents=True, exist_ok=True)
+        (op_dir / "backup_entries.json").write_text(json.dumps(entries), encoding="utf-8")
+
+
+@pytest.fixture
+def root(tmp_path):
+    return tmp_path / "backups"
+
+
+def _open(root):
+    return BackupIndex(str(root), str(root / "metadata"), str(root / "operations"))
+
+
+def test_timestamp_epoch():
+    assert timestamp_epoch("20260101_120000_123") == timestamp_epoch("20260101_120000")
+    assert timestamp_epoch("garbage") == 0.0
+
+
+def test_query_filters_newest_first(root):
+    index = _open(root)
+    index.add("a", _meta("20260101_000000", "team_edit", ["slot 1.json"]), entries=[])
+    index.add("b", _meta("20260105_000000", "item_edit", ["trainer.json"]), entries=[])
+    index.add("c", _meta("20260110_000000", "team_edit", ["slot 1.json", "trainer.json"]), entries=[])
+    assert [m["timestamp"][:8] for m in index.query()] == ["20260110", "20260105", "20260101"]
+    assert len(index.query(operation_type="team_edit")) == 2
+    assert len(index.query(file_path="trainer.json")) == 2
+    assert len(index.query(since_epoch=timestamp_epoch("20260104_000000"))) == 2
+    assert index.query(limit=1)[0]["operation_type"] == "team_edit"
+    assert index.count(operation_type="item_edit") == 1
+    index.remove("c")
+    assert index.count() == 2
+    index.close()
+
+
+def test_reindex_round_trips_metadata_and_entries(root):
+    for i in range(5):
+        _write_backup(root, f"b{i}", _meta(f"2026010{i + 1}_000000", files=["slot 1.json"]),
+                      entries=[{"original_path": "slot 1.json", "history_version": i + 3}])
+    index = _open(root)
+    assert index.count() == 5
+    assert index.history_floors() == {"slot 1.json": 3}
+    assert index.query(limit=1)[0] == _meta("20260105_000000", files=["slot 1.json"])
+    index.close()
+    # A metadata file added behind the index's back triggers a rebuild on open
+    _write_backup(root, "b9", _meta("20260109_000000"), entries=[{"original_path": "slot 1.json", "history_version": 1}])
+    index = _open(root)
+    assert index.count() == 6
+    assert index.history_floors() == {"slot 1.json": 1}
+    index.close()
+
+
+def test_unreadable_metadata_is_skipped(root):
+    _write_backup(root, "ok", _meta("20260101_000000"))
+    (root / "metadata" / "bad.json").write_text("{", encoding="utf-8")
+    index = _open(root)
+    assert index.reindex() == 1
+    index.close()
+
+
+def test_old_schema_is_rebuilt(root):
+    _write_backup(root, "a", _meta("20260101_000000"), entries=[{"original_path": "slot 1.json", "history_version": 2}])
+    root.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(root / INDEX_FILE))
+    conn.executescript("CREATE TABLE backup_files (backup_id TEXT, path TEXT); PRAGMA user_version = 1;")
+    conn.close()
+    index = _open(root)
+    assert index.history_floors() == {"slot 1.json": 2}
+    index.close()
+
+
+def test_history_floors_follow_removals(root):
+    index = _open(root)
+    index.add("old", _meta("20260101_000000"), entries=[{"original_path": "slot 1.json", "history_version": 4}])
+    index.add("new", _meta("20260102_000000"), entries=[{"original_path": "slot 1.json", "history_version": 9}])
+    index.add("none", _meta("20260103_000000", files=["trainer.json"]), entries=[])
+    assert index.history_floors() == {"slot 1.json": 4}
+    index.remove("old")
+    assert index.history_floors() == {"slot 1.json": 9}
+    index.close()
+
+
+def test_oldest_ids_and_summary(root):
+    index = _open(root)
+    for i in range(1, 6):
+        index.add(f"b{i}", _meta(f"2026010{i}_000000", "team_edit" if i % 2 else "item_edit", size=10), entries=[])
+    assert index.oldest_ids(timestamp_epoch("20260105_000000"), keep_newest=2) == ["b1", "b2", "b3"]
+    assert index.oldest_ids(timestamp_epoch("20260105_000000"), keep_newest=4) == ["b1"]
+    # Backups without a parseable timestamp are never expired by age
+    index.add("undated", _meta("bad", size=10), entries=[])
+    assert "undated" not in index.oldest_ids(timestamp_epoch("20270101_000000"), keep_newest=0)
+    summary = index.summary()
+    assert summary["total_backups"] == 6
+    assert summary["total_size_bytes"] == 60
+    assert summary["operation_statistics"]["item_edit"] == {
+        "count": 2, "total_size_bytes": 20, "latest_timestamp": "20260104_000000"}
+    index.close()
+
+
+def test_concurrent_adds_and_queries(root):
+    index = _open(root)
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def writer(k):
+        barrier.wait()
+        try:
+            for i in range(25):
+                index.add(f"w{k}_{i}", _meta(f"202601{k + 10:02d}_0000{i:02d}"),
+                          entries=[{"original_path": "slot 1.json", "history_version": k * 100 + i + 1}])
+                index.query(limit=5)
+                index.history_floors()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert index.count() == 200
+    assert index.history_floors() == {"slot 1.json": 1}
+    index.close()
+
+
+def test_reopen_rebuilds_when_metadata_rewritten_with_same_count(root):
+    _write_backup(root, "a", _meta("20260101_000000", "team_edit"))
+    _write_backup(root, "b", _meta("20260102_000000", "team_edit"))
+    index = _open(root)
+    assert index.count(operation_type="team_edit") == 2
+    index.close()
+    # Same number of files, but one swapped and one rewritten by an older build
+    (root / "metadata" / "a.json").unlink()
+    _write_backup(root, "c", _meta("20260103_000000", "item_edit"))
+    _write_backup(root, "b", _meta("20260102_000000", "item_edit", size=12345))
+    index = _open(root)
+    assert index.count() == 2
+    assert index.count(operation_type="item_edit") == 2
+    assert [m["timestamp"][:8] for m in index.query()] == ["20260103", "20260102"]
+    index.close()
+
+
+def test_reopen_keeps_index_in_sync_with_add(root, monkeypatch):
+    index = _open(root)
+    _write_backup(root, "a", _meta("20260101_000000"))
+    index.add("a", _meta("20260101_000000"), entries=[])
+    index.close()
+    monkeypatch.setattr(BackupIndex, "reindex", lambda self: pytest.fail("unexpected rebuild"))
+    index = _open(root)
+    assert index.count() == 1
+    index.close()
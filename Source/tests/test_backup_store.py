@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from rogueeditor import backup_store
+from rogueeditor.backup_store import (
+    BlobStore,
+    atomic_write_bytes,
+    backup_file_exists,
+    hash_bytes,
+    list_snapshot_dirs,
+    load_backup_json,
+    read_backup_file,
+    read_checksum,
+    referenced_digests,
+    verify_checksum,
+    write_snapshot,
+)
+
+PAYLOAD = json.dumps({"party": list(range(500))}, indent=2).encode("utf-8")
+
+
+def _age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "zstd"])
+def test_round_trip_each_codec(tmp_path, compression):
+    store = BlobStore(str(tmp_path), compression=compression)
+    digest = store.put_bytes(PAYLOAD)
+    assert digest == hash_bytes(PAYLOAD)
+    assert store.get_bytes(digest) == PAYLOAD
+    assert store.verify(digest)
+    dest = tmp_path / "out" / "slot 1.json"
+    assert store.restore_to(digest, str(dest)) == len(PAYLOAD)
+    assert dest.read_bytes() == PAYLOAD
+    assert verify_checksum(str(dest)) is True
+
+
+def test_blobs_written_with_any_codec_stay_readable(tmp_path):
+    digest = BlobStore(str(tmp_path), compression="zlib").put_bytes(PAYLOAD)
+    assert BlobStore(str(tmp_path), compression="none").get_bytes(digest) == PAYLOAD
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = BlobStore(str(tmp_path), compression="zlib")
+    path = store.path_for(store.put_bytes(PAYLOAD))
+    _age(path, 500)
+    before = os.path.getmtime(path)
+    store.put_bytes(PAYLOAD)
+    assert os.path.getmtime(path) > before
+    assert store.stats()["objects"] == 1
+
+
+def test_corrupt_blob_is_detected(tmp_path):
+    store = BlobStore(str(tmp_path), compression="none")
+    digest = store.put_bytes(PAYLOAD)
+    with open(store.path_for(digest), "r+b") as f:
+        f.seek(10)
+        f.write(b"X")
+    assert not store.verify(digest)
+    with pytest.raises(RuntimeError):
+        store.get_bytes(digest)
+    assert not store.verify("0" * 64)
+
+
+def test_prune_keeps_live_and_recent_blobs(tmp_path):
+    store = BlobStore(str(tmp_path))
+    live = store.put_bytes(b"live")
+    old = store.put_bytes(b"old")
+    fresh = store.put_bytes(b"fresh")
+    for digest in (live, old):
+        _age(store.path_for(digest), 2 * 86400)
+    assert store.prune({live}, older_than_days=1) == 1
+    assert store.has(live) and store.has(fresh) and not store.has(old)
+    # The grace period protects unreferenced blobs even with a zero age limit
+    assert store.prune({live}, older_than_days=0) == 0
+    assert store.has(fresh)
+
+
+def test_put_after_prune_rewrites_blob(tmp_path):
+    store = BlobStore(str(tmp_path))
+    digest = store.put_bytes(PAYLOAD)
+    _age(store.path_for(digest), 2 * 3600)
+    assert store.prune(set()) == 1
+    assert store.put_bytes(PAYLOAD) == digest
+    assert store.get_bytes(digest) == PAYLOAD
+
+
+def test_concurrent_puts(tmp_path):
+    store = BlobStore(str(tmp_path), compression="zlib")
+    payloads = [PAYLOAD + bytes([i % 4]) for i in range(64)]
+    digests = [None] * len(payloads)
+    barrier = threading.Barrier(8)
+
+    def worker(offset):
+        barrier.wait()
+        for i in range(offset, len(payloads), 8):
+            digests[i] = store.put_bytes(payloads[i])
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert store.stats()["objects"] == 4
+    for data, digest in zip(payloads, digests):
+        assert store.get_bytes(digest) == data
+    leftovers = [n for _, _, files in os.walk(store.root) for n in files if n.endswith(".tmp")]
+    assert leftovers == []
+
+
+def test_concurrent_put_and_prune(tmp_path, monkeypatch):
+    # Prune sees every blob as past the grace period, so it races each put
+    real_time = time.time
+    monkeypatch.setattr(backup_store, "time", type("Clock", (), {"time": staticmethod(lambda: real_time() + 7200)}))
+    store = BlobStore(str(tmp_path))
+    digest = hash_bytes(PAYLOAD)
+    stop = threading.Event()
+    errors = []
+
+    def pruner():
+        while not stop.is_set():
+            store.prune(set())
+
+    def reader():
+        while not stop.is_set():
+            try:
+                assert store.get_bytes(digest) == PAYLOAD
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=pruner), threading.Thread(target=reader)]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(300):
+            assert store.put_bytes(PAYLOAD) == digest
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+    assert errors == []
+    store.put_bytes(PAYLOAD)
+    assert store.get_bytes(digest) == PAYLOAD
+    leftovers = [n for _, _, files in os.walk(store.root) for n in files if n.endswith(".tmp")]
+    assert leftovers == []
+
+
+def test_snapshot_manifest_round_trip(tmp_path):
+    backup_root = tmp_path / "backups"
+    snap = backup_root / "20260101_120000"
+    files = {"trainer.json": b'{"a": 1}', "slot 1.json": b'{"b": 2}'}
+    hashes = write_snapshot(str(snap), files)
+    assert not (snap / "trainer.json").exists()
+    assert read_backup_file(str(snap), "slot 1.json") == files["slot 1.json"]
+    assert load_backup_json(str(snap), "trainer.json") == {"a": 1}
+    assert backup_file_exists(str(snap), "trainer.json")
+    assert not backup_file_exists(str(snap), "slot 2.json")
+    assert read_backup_file(str(snap), "slot 2.json") is None
+    assert set(hashes.values()) <= referenced_digests(str(backup_root))
+
+
+def test_legacy_snapshot_folders(tmp_path):
+    snap = tmp_path / "backups" / "20250101_000000"
+    snap.mkdir(parents=True)
+    (snap / "trainer.json").write_bytes(b'{"legacy": true}')
+    assert load_backup_json(str(snap), "trainer.json") == {"legacy": True}
+
+
+def test_list_snapshot_dirs_ignores_internal_folders(tmp_path):
+    root = tmp_path / "backups"
+    for name in ("20260102_000000", "20260101_000000", "objects", "history", "operations", "2026_bad"):
+        (root / name).mkdir(parents=True)
+    (root / "20260103_000000").write_text("not a folder")
+    assert list_snapshot_dirs(str(root)) == ["20260101_000000", "20260102_000000"]
+    assert list_snapshot_dirs(str(tmp_path / "missing")) == []
+
+
+def test_checksum_sidecars(tmp_path):
+    path = tmp_path / "slot 1.json"
+    atomic_write_bytes(str(path), PAYLOAD, checksum=True)
+    assert read_checksum(str(path)) == (hash_bytes(PAYLOAD), len(PAYLOAD))
+    assert verify_checksum(str(path)) is True
+    path.write_bytes(PAYLOAD.replace(b"1", b"2"))
+    assert verify_checksum(str(path)) is False
+    backup_store.discard_checksum(str(path))
+    assert verify_checksum(str(path)) is None
@@ -0,0 +1,78 @@
+import copy
+import json
+import threading
+
+import pytest
+
+from rogueeditor import catalog
+from rogueeditor.catalog_registry import CatalogRegistry, ReadOnlyDict, ReadOnlyList, freeze
+
+
+def test_concurrent_first_calls_share_one_load():
+    registry = CatalogRegistry()
+    calls = []
+    gate = threading.Event()
+
+    def loader():
+        calls.append(1)
+        gate.wait(1)
+        return {"a": 1}
+
+    registry.register("demo", loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("demo"))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    registry.invalidate("demo")
+    registry.get("demo")
+    assert len(calls) == 2
+
+
+def test_read_only_catalog_rejects_in_place_edits():
+    registry = CatalogRegistry()
+
+    @registry.catalog("matrix", read_only=True)
+    def load_matrix():
+        return {"attack_vs": {"fire": {"grass": 2.0}}, "types": ["fire", "grass"]}, {0: "FIRE"}
+
+    matrix, i2n = load_matrix()
+    assert isinstance(matrix, dict) and isinstance(matrix["types"], list)
+    with pytest.raises(TypeError):
+        matrix["attack_vs"]["fire"]["grass"] = 4.0
+    with pytest.raises(TypeError):
+        matrix["types"].append("water")
+    with pytest.raises(TypeError):
+        matrix.setdefault("defense_from", {})
+    with pytest.raises(TypeError):
+        i2n[1] = "WATER"
+    assert load_matrix()[0]["attack_vs"]["fire"]["grass"] == 2.0
+    # Copies are plain, mutable containers
+    mutable = copy.deepcopy(matrix)
+    mutable["attack_vs"]["fire"]["grass"] = 4.0
+    mutable["types"].append("water")
+    assert type(mutable["attack_vs"]) is dict and type(mutable["types"]) is list
+    assert type(dict(i2n)) is dict and type(list(matrix["types"])) is list
+    assert json.loads(json.dumps(matrix)) == {"attack_vs": {"fire": {"grass": 2.0}}, "types": ["fire", "grass"]}
+
+
+def test_freeze_leaves_other_objects_alone():
+    marker = object()
+    frozen = freeze({"x": [marker, (1, {"y": 2})]})
+    assert isinstance(frozen, ReadOnlyDict) and isinstance(frozen["x"], ReadOnlyList)
+    assert frozen["x"][0] is marker
+    assert isinstance(frozen["x"][1], tuple) and isinstance(frozen["x"][1][1], ReadOnlyDict)
+
+
+def test_shared_catalogs_are_read_only():
+    matrix = catalog.load_type_matrix_v2()
+    assert catalog.load_type_matrix_v2() is matrix
+    with pytest.raises(TypeError):
+        matrix["injected"] = {}
+    n2i, _ = catalog.load_types_catalog()
+    with pytest.raises(TypeError):
+        n2i["injected"] = 99
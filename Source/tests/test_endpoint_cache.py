@@ -0,0 +1,75 @@
+import json
+
+from rogueeditor import endpoint_cache
+from rogueeditor.endpoint_cache import SLOT_FETCH, EndpointCache
+
+BASE = "https://api.example"
+CANDIDATES = [("a", "u-a"), ("b", "u-b"), ("c", "u-c")]
+
+
+def test_preferred_first_and_dead_last(tmp_path):
+    cache = EndpointCache(str(tmp_path / "endpoints.json"), dead_ttl=60)
+    assert cache.order(BASE, SLOT_FETCH, CANDIDATES) == CANDIDATES
+    cache.record_success(BASE, SLOT_FETCH, "c")
+    cache.record_dead(BASE, SLOT_FETCH, "a")
+    assert cache.order(BASE, SLOT_FETCH, CANDIDATES) == [("c", "u-c"), ("b", "u-b"), ("a", "u-a")]
+    assert cache.is_dead(BASE, SLOT_FETCH, "a")
+
+
+def test_dead_entries_expire(tmp_path, monkeypatch):
+    cache = EndpointCache(str(tmp_path / "endpoints.json"), dead_ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr(endpoint_cache.time, "time", lambda: now[0])
+    cache.record_dead(BASE, SLOT_FETCH, "a")
+    assert cache.is_dead(BASE, SLOT_FETCH, "a")
+    now[0] += 61
+    assert not cache.is_dead(BASE, SLOT_FETCH, "a")
+    assert cache.order(BASE, SLOT_FETCH, CANDIDATES)[0] == ("a", "u-a")
+
+
+def test_success_revives_dead_template(tmp_path):
+    cache = EndpointCache(str(tmp_path / "endpoints.json"), dead_ttl=60)
+    cache.record_dead(BASE, SLOT_FETCH, "b")
+    cache.record_success(BASE, SLOT_FETCH, "b")
+    assert not cache.is_dead(BASE, SLOT_FETCH, "b")
+    assert cache.order(BASE, SLOT_FETCH, CANDIDATES)[0] == ("b", "u-b")
+
+
+def test_state_round_trips_through_file(tmp_path):
+    path = tmp_path / "endpoints.json"
+    cache = EndpointCache(str(path), dead_ttl=60)
+    cache.record_success(BASE, SLOT_FETCH, "b")
+    cache.record_dead(BASE, SLOT_FETCH, "c")
+    reloaded = EndpointCache(str(path), dead_ttl=60)
+    assert reloaded.order(BASE, SLOT_FETCH, CANDIDATES) == [("b", "u-b"), ("a", "u-a"), ("c", "u-c")]
+
+
+def test_deferred_writes_wait_for_flush(tmp_path):
+    path = tmp_path / "endpoints.json"
+    cache = EndpointCache(str(path), dead_ttl=60)
+    cache.record_success(BASE, SLOT_FETCH, "b", persist=False)
+    assert not path.exists()
+    cache.flush()
+    assert json.loads(path.read_text())[BASE][SLOT_FETCH]["preferred"] == "b"
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    path = tmp_path / "endpoints.json"
+    path.write_text("{not json")
+    cache = EndpointCache(str(path), dead_ttl=60)
+    assert cache.order(BASE, SLOT_FETCH, CANDIDATES) == CANDIDATES
+
+
+def test_clear_one_base_url(tmp_path):
+    cache = EndpointCache(str(tmp_path / "endpoints.json"), dead_ttl=60)
+    cache.record_dead(BASE, SLOT_FETCH, "a")
+    cache.record_dead("https://other.example", SLOT_FETCH, "a")
+    cache.clear(BASE)
+    assert not cache.is_dead(BASE, SLOT_FETCH, "a")
+    assert cache.is_dead("https://other.example", SLOT_FETCH, "a")
+
+
+def test_missing_endpoint_error_detection():
+    assert EndpointCache.is_missing_endpoint_error(RuntimeError("Not found (404)"))
+    assert EndpointCache.is_missing_endpoint_error(RuntimeError("HTTP 405 Method Not Allowed"))
+    assert not EndpointCache.is_missing_endpoint_error(RuntimeError("HTTP 401"))
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from rogueeditor import catalog
+from rogueeditor.catalog import ExpEngine, _calibrated_extrapolation
+
+# Quadratic-ish table, a two-entry table (linear fallback) and an empty group
+TABLES = [
+    [0, 15, 52, 122, 237, 406, 637, 942, 1326, 1800],
+    [0, 100],
+    [],
+]
+
+
+@pytest.fixture
+def engine():
+    return ExpEngine(TABLES, {}, extra_levels=200)
+
+
+def test_table_levels_are_exact(engine):
+    for gi in (0, 1):
+        for level, exp in enumerate(TABLES[gi], start=1):
+            assert engine.exp_for_level(gi, level) == exp
+    assert engine.exp_for_level(0, 0) == 0
+    assert engine.table_length(0) == 10
+    assert engine.table_length(7) == 0
+
+
+def test_extrapolation_matches_direct_model(engine):
+    for level in (11, 12, 50, 150, 210):
+        assert engine.exp_for_level(0, level) == _calibrated_extrapolation(TABLES[0], 0, level, {})
+    # Beyond the precomputed horizon the direct model is used
+    assert engine.exp_for_level(0, 500) == _calibrated_extrapolation(TABLES[0], 0, 500, {})
+
+
+def test_level_exp_round_trip(engine):
+    for level in range(1, 200):
+        exp = engine.exp_for_level(0, level)
+        assert engine.level_from_exp(0, exp) == level
+        if level > 1 and exp > engine.exp_for_level(0, level - 1):
+            assert engine.level_from_exp(0, exp - 1) == level - 1
+
+
+def test_level_from_exp_against_linear_scan(engine):
+    rng = random.Random(15)
+    curve = [engine.exp_for_level(0, L) for L in range(1, 211)]
+    for _ in range(300):
+        exp = rng.randrange(0, curve[-1])
+        expected = max(L for L, e in enumerate(curve, start=1) if e <= exp)
+        assert engine.level_from_exp(0, exp) == min(expected, 10 + 199)
+
+
+def test_short_and_empty_tables(engine):
+    assert engine.level_from_exp(1, 350) == 4
+    assert engine.exp_for_level(1, 4) == 300
+    assert engine.level_from_exp(2, 1000) == 1
+    assert engine.exp_for_level(2, 10) == 0
+    assert engine.level_from_exp(9, 1000) == 1
+    assert engine.level_from_exp(0, -5) == 1
+
+
+def test_anchor_calibration(monkeypatch):
+    monkeypatch.setattr(catalog, "_growth_name_key_for_index", lambda gi: "fast_growth" if gi == 0 else None)
+    anchors = {"fast_growth": {"level_20": 9000}}
+    engine = ExpEngine(TABLES, anchors, extra_levels=50)
+    assert engine.exp_for_level(0, 20) == 9000
+    assert engine.level_from_exp(0, 9000) == 20
+    assert engine.exp_for_level(0, 15) == _calibrated_extrapolation(TABLES[0], 0, 15, anchors)
+
+
+def test_batch_helpers(engine):
+    pairs = [(0, 5), (1, 2), (0, 30)]
+    exps = engine.exp_for_levels(pairs)
+    assert exps == [engine.exp_for_level(g, lv) for g, lv in pairs]
+    assert engine.levels_from_exp([(g, e) for (g, _), e in zip(pairs, exps)]) == [5, 2, 30]
+    party = [{"species": 1, "exp": 237}, {"species": 2, "exp": 100}, {"species": None}]
+    assert engine.party_levels(party, growth_map={1: 0, 2: 1}) == [5, 2, None]
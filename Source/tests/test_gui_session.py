@@ -0,0 +1,50 @@
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from rogueeditor.api import PokerogueAPI
+from rogueeditor.editor import Editor
+from rogueeditor.http_pool import get_session_registry
+
+
+@pytest.fixture(scope="module")
+def gui_app():
+    # gui.py shares its name with the gui/ package, so load it from its path
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "gui.py")
+    spec = importlib.util.spec_from_file_location("rogue_manager_gui", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.RogueManagerGUI
+
+
+class FakeWindow:
+    def __init__(self):
+        self.api = None
+        self.editor = None
+        self.logged = []
+
+    def _log(self, msg):
+        self.logged.append(msg)
+
+
+def test_replacing_the_client_releases_its_session(gui_app):
+    account = "refresh_tester"
+    registry = get_session_registry()
+    window = FakeWindow()
+
+    first = PokerogueAPI(account, "pw")
+    gui_app._replace_api(window, first)
+    assert window.api is first and isinstance(window.editor, Editor) and window.editor.api is first
+    assert registry.refs(account) == 1
+
+    for _ in range(3):
+        refreshed = PokerogueAPI(account, "pw")
+        gui_app._replace_api(window, refreshed)
+        assert window.editor.api is refreshed
+        assert registry.refs(account) == 1
+
+    window.api.close()
+    assert registry.refs(account) == 0
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from rogueeditor import http_pool
+from rogueeditor.http_pool import SessionRegistry, build_session
+
+
+class FakeClock:
+    now = 100.0
+
+    @classmethod
+    def monotonic(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    FakeClock.now = 100.0
+    monkeypatch.setattr(http_pool, "time", FakeClock)
+    return FakeClock
+
+
+@pytest.fixture
+def closed(monkeypatch):
+    """Record every session passed to Session.close()."""
+    seen = []
+    original = http_pool.requests.Session.close
+
+    def close(self):
+        seen.append(self)
+        original(self)
+
+    monkeypatch.setattr(http_pool.requests.Session, "close", close)
+    return seen
+
+
+def test_build_session_sizes_adapter_pool():
+    session = build_session(pool_connections=3, pool_maxsize=7)
+    adapter = session.get_adapter("https://example.com")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 0
+
+
+def test_same_account_shares_one_session(clock, closed):
+    registry = SessionRegistry(idle_ttl=60)
+    a = registry.acquire("Trainer")
+    b = registry.acquire(" trainer ")
+    assert a is b
+    assert registry.refs("trainer") == 2
+    assert registry.acquire("other") is not a
+    assert registry.accounts() == ["other", "trainer"]
+
+
+def test_release_closes_only_on_last_reference(clock, closed):
+    registry = SessionRegistry(idle_ttl=60)
+    session = registry.acquire("trainer")
+    registry.acquire("trainer")
+    registry.release("trainer")
+    assert registry.refs("trainer") == 1
+    assert closed == []
+    registry.release("trainer")
+    assert registry.refs("trainer") == 0
+    assert closed == [session]
+    # Extra releases are harmless
+    registry.release("trainer")
+    assert registry.acquire("trainer") is not session
+
+
+def test_idle_session_is_replaced_but_refs_survive(clock, closed):
+    registry = SessionRegistry(idle_ttl=30)
+    old = registry.acquire("trainer")
+    clock.now += 31
+    new = registry.acquire("trainer")
+    assert new is not old
+    assert closed == [old]
+    assert registry.refs("trainer") == 2
+
+
+def test_touch_keeps_session_warm(clock, closed):
+    registry = SessionRegistry(idle_ttl=30)
+    session = registry.acquire("trainer")
+    clock.now += 20
+    registry.touch("trainer")
+    clock.now += 20
+    assert registry.acquire("trainer") is session
+
+
+def test_concurrent_acquire_release_balances(clock, closed):
+    registry = SessionRegistry(idle_ttl=0)
+    sessions = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(16)
+
+    def worker():
+        barrier.wait()
+        s = registry.acquire("trainer")
+        with lock:
+            sessions.append(s)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in sessions}) == 1
+    assert registry.refs("trainer") == 16
+
+    threads = [threading.Thread(target=registry.release, args=("trainer",)) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert registry.refs("trainer") == 0
+    assert closed == [sessions[0]]
@@ -0,0 +1,41 @@
+import pytest
+
+from rogueeditor import catalog
+
+ITEM_DATA = {
+    "categories": {
+        "berries": {"items": "dynamic_from_catalog"},
+        "vitamins": {"items": ["HP_UP", "PROTEIN", "CALCIUM"]},
+    },
+    "items": {},
+}
+# Catalog order deliberately differs from id order
+BERRY_I2N = {2: "ENIGMA", 0: "SITRUS", 1: "LUM"}
+
+
+@pytest.fixture
+def patched_catalogs(monkeypatch):
+    monkeypatch.setattr(catalog, "load_item_data", lambda: ITEM_DATA)
+    monkeypatch.setattr(catalog, "load_berry_catalog",
+                        lambda: ({n.lower(): i for i, n in BERRY_I2N.items()}, dict(BERRY_I2N)))
+    catalog.invalidate_catalogs("item_category_index")
+    yield
+    catalog.invalidate_catalogs("item_category_index")
+
+
+def test_berries_follow_berry_id_order(patched_catalogs):
+    assert catalog.get_items_by_category("berries") == ["sitrus", "lum", "enigma"]
+    # Same strings and order the item manager built from load_berry_catalog() sorted by id
+    n2i, _ = catalog.load_berry_catalog()
+    expected = [catalog.format_item_for_display(name) for name, _ in sorted(n2i.items(), key=lambda kv: kv[1])]
+    assert catalog.get_formatted_items_by_category("berries") == expected
+
+
+def test_static_category_order_and_unknown_category(patched_catalogs):
+    assert catalog.get_items_by_category("vitamins") == ["HP_UP", "PROTEIN", "CALCIUM"]
+    assert catalog.get_formatted_items_by_category("vitamins") == [
+        catalog.format_item_for_display(i) for i in ("HP_UP", "PROTEIN", "CALCIUM")]
+    assert catalog.get_items_by_category("nope") == []
+    # Callers get copies, not the index's own storage
+    catalog.get_items_by_category("vitamins").append("X")
+    assert catalog.get_items_by_category("vitamins") == ["HP_UP", "PROTEIN", "CALCIUM"]
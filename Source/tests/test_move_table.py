@@ -0,0 +1,69 @@
+from rogueeditor.move_table import MoveTable, ppup_bounds
+
+MOVES_DATA = {
+    "by_id": {
+        "1": {"type_id": 0, "type_name": "normal", "power": 40, "accuracy": 100, "pp": 35,
+              "move_category": "Physical", "is_offensive": True},
+        "3": {"type_id": 9, "type_name": "fire", "power": None, "accuracy": "n/a", "pp": 15,
+              "move_category": "Status", "is_offensive": False},
+        "4": {"type_id": 10, "type_name": "water", "power": 110, "accuracy": 80, "pp": 5,
+              "move_category": "Special"},
+        "bogus": {"type_id": 1},
+        "-2": {"type_id": 1},
+    }
+}
+
+
+def test_ppup_bounds():
+    assert ppup_bounds(None) == (0, 0)
+    assert ppup_bounds(1) == (0, 1)
+    assert ppup_bounds(5) == (3, 8)
+    assert ppup_bounds(35) == (21, 56)
+
+
+def test_from_moves_data_round_trips_fields():
+    table = MoveTable.from_moves_data(MOVES_DATA)
+    assert len(table) == 5
+    assert table.get_type_id(1) == 0
+    assert table.get_type_name("1") == "normal"
+    assert table.get_power(1) == 40
+    assert table.get_accuracy(1) == 100
+    assert table.get_category(1) == "Physical"
+    assert table.get_base_pp(1) == 35
+    assert table.is_offensive(1) is True
+    assert table.get_ppup_bounds(1) == (21, 56)
+
+
+def test_missing_values_come_back_as_none():
+    table = MoveTable.from_moves_data(MOVES_DATA)
+    assert table.get_power(3) is None
+    assert table.get_accuracy(3) is None
+    assert table.is_offensive(4) is None
+    # Gap and out-of-range ids
+    for mid in (2, 99, -1, "x", None):
+        assert table.get_type_id(mid) is None
+        assert table.get_category(mid) is None
+        assert table.get_ppup_bounds(mid) == (0, 0)
+
+
+def test_batch_accessors_match_single_lookups():
+    table = MoveTable.from_moves_data(MOVES_DATA)
+    moves = [1, 3, 4, 2]
+    assert table.type_ids(moves) == [table.get_type_id(m) for m in moves]
+    assert table.type_names_for(moves) == ["normal", "fire", "water", None]
+    assert table.powers(moves) == [40, None, 110, None]
+    assert table.accuracies(moves) == [100, None, 80, None]
+    assert table.base_pps(moves) == [35, 15, 5, None]
+    assert table.offensive_flags(moves) == [True, False, None, None]
+    assert table.ppup_bounds_for(moves) == [(21, 56), (9, 24), (3, 8), (0, 0)]
+
+
+def test_offensive_type_ids_skip_status_and_duplicates():
+    table = MoveTable.from_moves_data(MOVES_DATA)
+    assert table.offensive_type_ids([1, 3, 4, 1, 2]) == [0, 10]
+
+
+def test_empty_or_malformed_data():
+    assert len(MoveTable.from_moves_data({})) == 0
+    assert len(MoveTable.from_moves_data(None)) == 0
+    assert MoveTable.from_moves_data({}).get_power(1) is None
@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+
+import pytest
+
+from rogueeditor import pokemon_index
+from rogueeditor.pokemon_index import PokemonCatalogIndex, build_pokemon_catalog_index
+
+CATALOG = {
+    "source": "test",
+    "by_dex": {
+        "25": {"name": "Pikachu", "types": ["electric"]},
+        "1": {"name": "Bulbasaur", "types": ["grass", "poison"]},
+        "150": {"name": "Mewtwo", "types": ["psychic"]},
+    },
+}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    source = tmp_path / "pokemon_catalog.json"
+    source.write_text(json.dumps(CATALOG), encoding="utf-8")
+    return str(source), str(tmp_path / "pokemon_catalog.idx")
+
+
+def test_round_trip(catalog):
+    source, path = catalog
+    assert build_pokemon_catalog_index(source, path) == 3
+    index = PokemonCatalogIndex(path)
+    try:
+        assert index.dex_ids() == [1, 25, 150]
+        assert index.meta() == {"source": "test"}
+        for key, entry in CATALOG["by_dex"].items():
+            assert index.entry(key) == entry
+            assert index.entry(int(key)) == entry
+        assert index.entry(2) is None
+        assert index.entry("x") is None
+        assert dict(index.by_dex) == CATALOG["by_dex"]
+        assert "25" in index.by_dex and 7 not in index
+    finally:
+        index.close()
+
+
+def test_lru_caches_decoded_entries(catalog):
+    source, path = catalog
+    build_pokemon_catalog_index(source, path)
+    index = PokemonCatalogIndex(path, cache_size=1)
+    try:
+        index.entry(1)
+        index.entry(1)
+        index.entry(25)
+        index.entry(1)
+        assert index.stats() == {"species": 3, "cached": 1, "hits": 1, "decoded": 3}
+    finally:
+        index.close()
+
+
+def test_matches_detects_source_changes(catalog):
+    source, path = catalog
+    build_pokemon_catalog_index(source, path)
+    index = PokemonCatalogIndex(path)
+    try:
+        assert index.matches(source)
+        # Same bytes, new mtime: digest still matches
+        st = os.stat(source)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+        assert index.matches(source)
+        changed = dict(CATALOG, source="tset")
+        with open(source, "w", encoding="utf-8") as f:
+            json.dump(changed, f)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 20_000_000))
+        assert not index.matches(source)
+    finally:
+        index.close()
+
+
+def test_open_index_rebuilds_stale_or_corrupt(catalog):
+    source, path = catalog
+    with open(path, "wb") as f:
+        f.write(b"garbage" * 10)
+    index = pokemon_index._open_index(source, path)
+    try:
+        assert index.entry(150)["name"] == "Mewtwo"
+    finally:
+        index.close()
+
+
+def test_concurrent_reads(catalog):
+    source, path = catalog
+    build_pokemon_catalog_index(source, path)
+    index = PokemonCatalogIndex(path, cache_size=2)
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(200):
+                for key, entry in CATALOG["by_dex"].items():
+                    assert index.entry(key) == entry
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    index.close()
+    assert errors == []
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from rogueeditor import rate_limit
+from rogueeditor.rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def test_burst_is_free_then_paced(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3, min_rate=0.5)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_tokens_refill_over_time(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2, min_rate=0.5)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_throttle_halves_rate_and_honours_retry_after(clock):
+    bucket = TokenBucket(rate=4.0, capacity=4, min_rate=1.0)
+    bucket.on_throttled(retry_after=3.0)
+    assert bucket.rate == 2.0
+    assert bucket.reserve() == pytest.approx(3.0)
+    bucket.on_throttled(None)
+    bucket.on_throttled(None)
+    assert bucket.rate == 1.0  # never below min_rate
+
+
+def test_success_recovers_rate_up_to_ceiling(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1, min_rate=0.1, increase_step=0.3)
+    bucket.on_throttled(None)
+    for _ in range(10):
+        bucket.on_success()
+    assert bucket.rate == 1.0
+
+
+def test_limiter_keeps_one_bucket_per_host(clock):
+    limiter = RateLimiter(rate=1.0, burst=1, min_rate=0.1)
+    assert limiter.acquire("https://a.example/x") == 0.0
+    assert limiter.acquire("https://b.example/x") == 0.0
+    assert limiter.acquire("https://A.example/y") == pytest.approx(1.0)
+    assert clock.slept == [pytest.approx(1.0)]
+    assert set(limiter.stats()) == {"a.example", "b.example"}
+
+
+def test_observe_feeds_429_back(clock):
+    limiter = RateLimiter(rate=4.0, burst=4, min_rate=1.0)
+    limiter.observe("https://a.example/", 429, 2.0)
+    assert limiter.bucket("https://a.example/").rate == 2.0
+    assert limiter.reserve("https://a.example/") == pytest.approx(2.0)
+
+
+def test_disabled_limiter_never_waits(clock):
+    limiter = RateLimiter(rate=0, burst=1, min_rate=0.1)
+    assert not limiter.enabled
+    assert all(limiter.acquire("https://a.example/") == 0.0 for _ in range(50))
+    assert limiter.stats() == {}
+
+
+def test_concurrent_reservations_are_serialized(clock):
+    bucket = TokenBucket(rate=10.0, capacity=5, min_rate=1.0)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(25):
+            w = bucket.reserve()
+            with lock:
+                waits.append(w)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # With the clock frozen, the n-th reservation waits (n - capacity) / rate
+    expected = [max(0.0, (n - 5) / 10.0) for n in range(1, 201)]
+    assert sorted(waits) == pytest.approx(expected)
+    assert bucket.snapshot()["requests"] == 200
@@ -0,0 +1,146 @@
+import json
+
+import pytest
+
+from rogueeditor import response_cache
+from rogueeditor.api import _PokerogueClientBase
+from rogueeditor.response_cache import ResponseCache, RevalidationMiss
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.content = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeClock:
+    now = 50.0
+
+    @classmethod
+    def monotonic(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    FakeClock.now = 50.0
+    monkeypatch.setattr(response_cache, "time", FakeClock)
+    return FakeClock
+
+
+URL = "https://api.example/savedata/slot/get?slot=0"
+
+
+def test_fresh_hit_returns_independent_copies(clock):
+    cache = ResponseCache(ttl=10)
+    assert cache.resolve(URL, "slot:0", FakeResponse(body={"party": [1]})) is None
+    first = cache.fresh([URL])
+    first["party"].append(2)
+    assert cache.fresh([URL]) == {"party": [1]}
+    assert cache.stats()["hits"] == 2
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ResponseCache(ttl=10)
+    cache.resolve(URL, "slot:0", FakeResponse(body={}))
+    clock.now += 10
+    assert cache.fresh([URL]) is None
+
+
+def test_validators_and_304_revalidation(clock):
+    cache = ResponseCache(ttl=10)
+    headers = {"etag": '"v1"', "last-modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+    cache.resolve(URL, "slot:0", FakeResponse(body={"a": 1}, headers=headers))
+    assert cache.validators(URL) == {
+        "if-none-match": '"v1"',
+        "if-modified-since": "Tue, 01 Sep 2026 00:00:00 GMT",
+    }
+    clock.now += 30
+    assert cache.fresh([URL]) is None
+    assert cache.resolve(URL, "slot:0", FakeResponse(status_code=304)) == {"a": 1}
+    # Revalidation restarts the TTL
+    assert cache.fresh([URL]) == {"a": 1}
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_304_without_entry_raises_revalidation_miss(clock):
+    cache = ResponseCache(ttl=10)
+    cache.resolve(URL, "slot:0", FakeResponse(body={"a": 1}, headers={"etag": "x"}))
+    cache.invalidate("slot:0")
+    with pytest.raises(RevalidationMiss):
+        cache.resolve(URL, "slot:0", FakeResponse(status_code=304))
+
+
+def test_disabled_cache_stores_nothing(clock):
+    cache = ResponseCache(ttl=0)
+    assert cache.resolve(URL, "slot:0", FakeResponse(body={}, headers={"etag": "x"})) is None
+    assert cache.fresh([URL]) is None
+    assert cache.validators(URL) == {}
+    with pytest.raises(RevalidationMiss):
+        cache.resolve(URL, "slot:0", FakeResponse(status_code=304))
+
+
+def test_invalidate_by_tag_and_all(clock):
+    cache = ResponseCache(ttl=10)
+    system_url = "https://api.example/savedata/system/get"
+    cache.resolve(URL, "slot:0", FakeResponse(body={"s": 0}))
+    cache.resolve(system_url, "system", FakeResponse(body={"sys": 1}))
+    cache.invalidate("slot:0")
+    assert cache.fresh([URL]) is None
+    assert cache.fresh([URL, system_url]) == {"sys": 1}
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
+
+
+def test_body_in_flight_across_invalidation_is_not_stored(clock):
+    cache = ResponseCache(ttl=10)
+    generation = cache.generation("slot:0")
+    # An upload finishes and invalidates the slot while the GET is still in flight
+    cache.invalidate("slot:0")
+    assert cache.resolve(URL, "slot:0", FakeResponse(body={"party": "old"}), generation) is None
+    assert cache.fresh([URL]) is None
+    assert cache.stats()["dropped"] == 1
+    # A GET sent after the invalidation is cached as usual
+    cache.resolve(URL, "slot:0", FakeResponse(body={"party": "new"}), cache.generation("slot:0"))
+    assert cache.fresh([URL]) == {"party": "new"}
+
+
+def test_generation_is_per_tag_and_bumped_by_full_invalidation(clock):
+    cache = ResponseCache(ttl=10)
+    system_url = "https://api.example/savedata/system/get"
+    slot_gen, system_gen = cache.generation("slot:0"), cache.generation("system")
+    cache.invalidate("slot:1")
+    cache.resolve(URL, "slot:0", FakeResponse(body={"s": 0}), slot_gen)
+    assert cache.fresh([URL]) == {"s": 0}
+    cache.invalidate()
+    cache.resolve(system_url, "system", FakeResponse(body={"sys": 1}), system_gen)
+    assert cache.fresh([system_url]) is None
+
+
+class _RacingClient(_PokerogueClientBase):
+    """Just enough of a client for `_get_cacheable`; an upload lands while each GET is in flight."""
+
+    def __init__(self):
+        self.response_cache = ResponseCache(ttl=10)
+        self.bodies = [{"party": "old"}, {"party": "new"}]
+
+    def _auth_headers(self, json_content=False):
+        return {}
+
+    def _request(self, method, url, **kwargs):
+        body = self.bodies.pop(0)
+        if body["party"] == "old":
+            self.invalidate_cache(slot=1)
+        return FakeResponse(body=body)
+
+
+def test_client_does_not_cache_body_fetched_during_upload(clock):
+    client = _RacingClient()
+    assert client._get_cacheable(URL, "slot:0") == {"party": "old"}
+    assert client.response_cache.fresh([URL]) is None
+    assert client._get_cacheable(URL, "slot:0") == {"party": "new"}
+    assert client.response_cache.fresh([URL]) == {"party": "new"}
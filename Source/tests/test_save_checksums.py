@@ -0,0 +1,170 @@
+import hashlib
+import io
+import os
+
+import pytest
+
+from rogueeditor import atomic_saves, utils
+from rogueeditor.atomic_saves import AtomicSaveManager, serialize_json
+from rogueeditor.backup_store import (
+    BlobStore,
+    atomic_write_bytes,
+    encode_snapshot_json,
+    hash_bytes,
+    read_checksum,
+    verify_checksum,
+    write_hashed,
+)
+from rogueeditor.enhanced_backup import EnhancedBackupManager
+from rogueeditor.save_corruption_prevention import SaveCorruptionPreventionSystem
+from rogueeditor.save_history import KIND_DELTA
+
+
+@pytest.fixture
+def saves_root(tmp_path, monkeypatch):
+    """Point every per-user save path at a temporary directory."""
+    monkeypatch.setattr(utils, "repo_path", lambda *parts: os.path.join(str(tmp_path), *parts))
+    return tmp_path
+
+
+def _slot(money):
+    return {"party": [{"id": i, "species": 25, "level": 5} for i in range(6)],
+            "modifiers": [], "waveIndex": 1, "money": money}
+
+
+def test_write_hashed_streams_and_hashes():
+    data = os.urandom(200_000)  # spans several chunks
+    out = io.BytesIO()
+    assert write_hashed(out, data) == hashlib.sha256(data).hexdigest()
+    assert out.getvalue() == data
+
+
+def test_safe_write_records_checksum(tmp_path):
+    path = str(tmp_path / "slot 1.json")
+    manager = AtomicSaveManager()
+    text = serialize_json(_slot(1))
+    assert manager.safe_write_serialized(path, text, "test") is None
+    assert read_checksum(path) == (hash_bytes(text.encode("utf-8")), len(text.encode("utf-8")))
+    assert verify_checksum(path) is True
+    # A second write backs up the old content and moves the sidecar along
+    backup = manager.safe_write_serialized(path, serialize_json(_slot(2)), "test")
+    assert backup is not None and backup.blob_hash == hash_bytes(text.encode("utf-8"))
+    assert verify_checksum(path) is True
+
+
+def test_edit_outside_the_writer_is_detected(tmp_path):
+    path = tmp_path / "slot 1.json"
+    AtomicSaveManager().safe_write_serialized(str(path), serialize_json(_slot(1)), "test")
+    path.write_text(serialize_json(_slot(999)), encoding="utf-8")
+    assert verify_checksum(str(path)) is False
+
+
+def test_short_write_is_caught_before_the_rename(tmp_path, monkeypatch):
+    path = tmp_path / "slot 1.json"
+    manager = AtomicSaveManager()
+    original = serialize_json(_slot(1))
+    manager.safe_write_serialized(str(path), original, "test")
+
+    def truncated(f, data):
+        f.write(data[:-10])
+        return hashlib.sha256(data).hexdigest()
+
+    monkeypatch.setattr(atomic_saves, "write_hashed", truncated)
+    with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        manager.safe_write_serialized(str(path), serialize_json(_slot(2)), "test", create_backup=False)
+    assert path.read_text(encoding="utf-8") == original
+    assert verify_checksum(str(path)) is True
+    assert [n for n in os.listdir(tmp_path) if n.endswith(".tmp")] == []
+
+
+def test_rehash_mismatch_is_caught_before_the_rename(tmp_path, monkeypatch):
+    path = tmp_path / "slot 1.json"
+    manager = AtomicSaveManager()
+    original = serialize_json(_slot(1))
+    manager.safe_write_serialized(str(path), original, "test")
+    monkeypatch.setattr(atomic_saves, "hash_file", lambda p: "0" * 64)
+    with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        manager.safe_write_serialized(str(path), serialize_json(_slot(2)), "test", create_backup=False)
+    assert path.read_text(encoding="utf-8") == original
+
+
+def test_rollback_rewrites_the_sidecar(tmp_path):
+    path = str(tmp_path / "slot 1.json")
+    manager = AtomicSaveManager()
+    original = serialize_json(_slot(1))
+    manager.safe_write_serialized(path, original, "test")
+    with pytest.raises(RuntimeError):
+        with manager.transaction("edit") as op_id:
+            manager.safe_write_json_in_transaction(path, _slot(2), op_id)
+            raise RuntimeError("abort")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == original
+    assert verify_checksum(path) is True
+
+
+def test_atomic_write_bytes_sidecar(tmp_path):
+    path = str(tmp_path / "trainer.json")
+    atomic_write_bytes(path, b'{"a": 1}', checksum=True)
+    assert verify_checksum(path) is True
+    # Without checksum=True the sidecar is left alone (callers discard it themselves)
+    atomic_write_bytes(path, b'{"a": 2}')
+    assert verify_checksum(path) is False
+
+
+def test_dump_json_removes_the_sidecar(tmp_path):
+    path = str(tmp_path / "slot 1.json")
+    AtomicSaveManager().safe_write_serialized(path, serialize_json(_slot(1)), "test")
+    utils.dump_json(path, _slot(2))
+    assert read_checksum(path) is None
+    assert verify_checksum(path) is None
+
+
+def test_blob_restore_leaves_a_current_sidecar(tmp_path):
+    store = BlobStore(str(tmp_path / "backups"))
+    old = encode_snapshot_json(_slot(1))
+    digest = store.put_bytes(old)
+    path = str(tmp_path / "slot 1.json")
+    atomic_write_bytes(path, encode_snapshot_json(_slot(2)), checksum=True)
+    store.restore_to(digest, path)
+    assert read_checksum(path) == (digest, len(old))
+    assert verify_checksum(path) is True
+
+
+@pytest.mark.parametrize("delta_snapshots", [True, False])
+def test_backup_restore_leaves_a_current_sidecar(saves_root, delta_snapshots):
+    manager = EnhancedBackupManager("tester", delta_snapshots=delta_snapshots)
+    path = utils.slot_save_path("tester", 1)
+    ids = []
+    for money in range(4):
+        atomic_write_bytes(path, encode_snapshot_json(_slot(money)), checksum=True)
+        ids.append(manager.create_operation_backup("team_edit", f"money {money}", [path]))
+    if delta_snapshots:
+        history = manager._history(path)
+        assert history.get(3).kind == KIND_DELTA
+    atomic_write_bytes(path, encode_snapshot_json(_slot(99)), checksum=True)
+
+    assert manager.restore_backup(ids[2])
+    with open(path, "rb") as f:
+        assert f.read() == encode_snapshot_json(_slot(2))
+    assert verify_checksum(path) is True
+
+
+def test_verify_save_checksums(saves_root):
+    system = SaveCorruptionPreventionSystem("tester")
+    assert system.safe_save_slot(1, _slot(1)).success
+    assert system.safe_save_trainer({"dexData": {}, "starterData": {}}).success
+    slot_path = utils.slot_save_path("tester", 1)
+    trainer_path = utils.trainer_save_path("tester")
+    assert system.verify_save_checksums() == {trainer_path: True, slot_path: True}
+
+    with open(slot_path, "a", encoding="utf-8") as f:
+        f.write(" ")
+    utils.dump_json(utils.slot_save_path("tester", 2), _slot(2))
+    assert system.verify_save_checksums() == {
+        trainer_path: True,
+        slot_path: False,
+        utils.slot_save_path("tester", 2): None,
+    }
+    report = system.verify_system_integrity()["save_files"]
+    assert report["verified"] == 1 and report["unchecked"] == 1
+    assert report["status"] != "ok" and report["issues"]
@@ -0,0 +1,46 @@
+from rogueeditor.save_diff import ServerStateTracker, diff_documents, section_digests
+
+
+def test_section_digests_ignore_key_order():
+    a = section_digests({"party": [{"species": 1, "level": 5}]})
+    b = section_digests({"party": [{"level": 5, "species": 1}]})
+    assert a == b
+
+
+def test_diff_documents_reports_added_removed_changed():
+    old = {"party": [1], "modifiers": [], "gameMode": 0}
+    new = {"party": [1, 2], "gameMode": 0, "weather": None}
+    diff = diff_documents(old, new)
+    assert diff.changed == ["party"]
+    assert diff.added == ["weather"]
+    assert diff.removed == ["modifiers"]
+    assert diff.unchanged == ["gameMode"]
+    assert diff.has_changes
+    assert diff.touched == ["modifiers", "party", "weather"]
+
+
+def test_identical_documents_have_no_changes():
+    doc = {"party": [{"species": 25}], "money": 100}
+    diff = diff_documents(doc, dict(doc))
+    assert not diff.has_changes
+    assert diff.summary() == "no changes"
+
+
+def test_tracker_without_baseline_returns_none():
+    tracker = ServerStateTracker()
+    assert tracker.diff("slot:1", {"party": []}) is None
+
+
+def test_tracker_diffs_against_remembered_state():
+    tracker = ServerStateTracker()
+    tracker.remember("slot:1", {"party": [1], "money": 5})
+    assert not tracker.diff("slot:1", {"party": [1], "money": 5}).has_changes
+    assert tracker.diff("slot:1", {"party": [1], "money": 6}).changed == ["money"]
+    tracker.forget("slot:1")
+    assert tracker.diff("slot:1", {"party": [1]}) is None
+
+
+def test_tracker_ignores_non_dict_documents():
+    tracker = ServerStateTracker()
+    tracker.remember("system", ["not", "a", "dict"])
+    assert tracker.diff("system", {}) is None
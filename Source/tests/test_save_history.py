@@ -0,0 +1,152 @@
+import copy
+import random
+import threading
+
+import pytest
+
+from rogueeditor.backup_store import encode_snapshot_json, hash_bytes, verify_checksum
+from rogueeditor.save_history import (
+    KIND_DELTA,
+    KIND_KEYFRAME,
+    SaveHistory,
+    apply_json_patch,
+    make_json_patch,
+)
+
+
+def _slot(money, party_size=6):
+    return {
+        "money": money,
+        "party": [{"id": i, "species": 25 + i, "moveset": [{"moveId": 85, "ppUsed": 0}] * 4}
+                  for i in range(party_size)],
+        "modifiers": [{"typeId": f"MOD_{i}", "stackCount": 1} for i in range(40)],
+        "flags": {"a/b": True, "c~d": None},
+    }
+
+
+def test_patch_round_trip_edge_cases():
+    rng = random.Random(22)
+    base = _slot(100)
+    for _ in range(50):
+        new = copy.deepcopy(base)
+        new["money"] = rng.randrange(10_000)
+        del new["party"][rng.randrange(len(new["party"]))]
+        new["modifiers"].append({"typeId": "NEW", "stackCount": rng.randrange(5)})
+        new["flags"]["e/f~g"] = rng.random()
+        new["flags"].pop("a/b")
+        assert apply_json_patch(copy.deepcopy(base), make_json_patch(base, new)) == new
+    # Type changes that compare equal in Python still produce a patch
+    assert make_json_patch({"a": 1}, {"a": True}) == [{"op": "replace", "path": "/a", "value": True}]
+    assert make_json_patch({"a": [{"b": 1}]}, {"a": [{"b": 1.0}]}) == [
+        {"op": "replace", "path": "/a/0/b", "value": 1.0}]
+    assert apply_json_patch([1], make_json_patch([1], {"root": 1})) == {"root": 1}
+
+
+def test_record_and_restore_every_version(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 1.json", keyframe_interval=4)
+    contents = [encode_snapshot_json(_slot(m)) for m in range(10)]
+    for data in contents:
+        history.record(data, operation="edit")
+    versions = history.versions()
+    assert [v.version for v in versions] == list(range(1, 11))
+    assert [v.kind for v in versions] == ([KIND_KEYFRAME] + [KIND_DELTA] * 3) * 2 + [KIND_KEYFRAME, KIND_DELTA]
+    fresh = SaveHistory(str(tmp_path), "slot 1.json", keyframe_interval=4)
+    for v, data in zip(versions, contents):
+        assert fresh.content(v.version) == data
+        assert fresh.verify(v.version) and fresh.verify(v.version, rebuild=True)
+    dest = tmp_path / "restored.json"
+    assert fresh.restore(7, str(dest)) == len(contents[6])
+    assert dest.read_bytes() == contents[6]
+    assert verify_checksum(str(dest)) is True
+
+
+def test_unchanged_content_is_not_recorded_twice(tmp_path):
+    history = SaveHistory(str(tmp_path), "trainer.json")
+    data = encode_snapshot_json(_slot(1))
+    first = history.record(data)
+    assert history.record(data) == first
+    assert len(history.versions()) == 1
+
+
+def test_nested_type_change_is_stored_as_delta(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 6.json", keyframe_interval=10)
+    old = _slot(1)
+    history.record(encode_snapshot_json(old))
+    new = copy.deepcopy(old)
+    new["party"][0]["moveset"][0] = {"moveId": 85, "ppUsed": False}
+    entry = history.record(encode_snapshot_json(new))
+    assert entry.kind == KIND_DELTA
+    assert SaveHistory(str(tmp_path), "slot 6.json").content(2) == encode_snapshot_json(new)
+
+
+def test_foreign_formatting_is_kept_byte_exact(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 2.json", keyframe_interval=10)
+    history.record(encode_snapshot_json(_slot(1)))
+    crlf = encode_snapshot_json(_slot(2)).replace(b"\n", b"\r\n")
+    entry = history.record(crlf)
+    assert entry.kind == KIND_KEYFRAME
+    assert history.content(entry.version) == crlf
+
+
+def test_truncate_rekeys_delta_head(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 3.json", keyframe_interval=10)
+    contents = [encode_snapshot_json(_slot(m)) for m in range(5)]
+    for data in contents:
+        history.record(data)
+    assert history.truncate_before(3) == 2
+    versions = history.versions()
+    assert [v.version for v in versions] == [3, 4, 5]
+    assert versions[0].kind == KIND_KEYFRAME
+    fresh = SaveHistory(str(tmp_path), "slot 3.json")
+    for v, data in zip(versions, contents[2:]):
+        assert fresh.content(v.version) == data
+
+
+def test_damaged_blob_fails_verification(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 4.json", keyframe_interval=10)
+    for m in range(3):
+        history.record(encode_snapshot_json(_slot(m)))
+    delta = history.get(2)
+    with open(history.store.path_for(delta.blob), "wb") as f:
+        f.write(b"\x00[]")
+    assert history.verify(1)
+    assert not history.verify(3)
+    fresh = SaveHistory(str(tmp_path), "slot 4.json")
+    with pytest.raises(RuntimeError):
+        fresh.document(3)
+
+
+def test_torn_log_line_is_skipped(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 5.json")
+    history.record(encode_snapshot_json(_slot(1)))
+    with open(history.log_path, "a", encoding="utf-8") as f:
+        f.write('{"v": 2, "ts"')
+    assert [v.version for v in SaveHistory(str(tmp_path), "slot 5.json").versions()] == [1]
+
+
+def test_concurrent_records_keep_a_consistent_chain(tmp_path):
+    history = SaveHistory(str(tmp_path), "slot 1.json", keyframe_interval=5)
+    barrier = threading.Barrier(6)
+    recorded = {}
+    lock = threading.Lock()
+
+    def worker(k):
+        barrier.wait()
+        for i in range(10):
+            data = encode_snapshot_json(_slot(k * 100 + i))
+            entry = history.record(data)
+            with lock:
+                recorded[entry.version] = data
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    versions = SaveHistory(str(tmp_path), "slot 1.json").versions()
+    assert [v.version for v in versions] == list(range(1, 61))
+    fresh = SaveHistory(str(tmp_path), "slot 1.json")
+    for v in versions:
+        data = fresh.content(v.version)
+        assert hash_bytes(data) == v.content_hash
+        assert data == recorded[v.version]
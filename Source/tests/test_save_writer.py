@@ -0,0 +1,133 @@
+import json
+import threading
+
+import pytest
+
+from rogueeditor.backup_store import atomic_write_bytes
+from rogueeditor.save_writer import BackgroundSaveWriter
+
+
+@pytest.fixture
+def writer():
+    w = BackgroundSaveWriter(name="test-save-writer")
+    yield w
+    w.shutdown()
+
+
+def _block(writer, key="blocker"):
+    """Occupy the worker until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5)
+
+    writer.submit(key, job)
+    assert started.wait(5)
+    return release
+
+
+def test_result_and_callback(writer):
+    seen = []
+    future = writer.submit("a", lambda: 42, callback=lambda f: seen.append(f.result()))
+    assert future.result(5) == 42
+    assert writer.flush(5)
+    assert seen == [42]
+
+
+def test_queued_jobs_for_same_file_coalesce(writer):
+    release = _block(writer)
+    ran = []
+    futures = [writer.submit("slot 1", lambda i=i: ran.append(i) or i) for i in range(5)]
+    assert writer.is_pending("slot 1")
+    release.set()
+    assert [f.result(5) for f in futures] == [4] * 5
+    assert ran == [4]
+    assert writer.stats()["coalesced"] == 4
+
+
+def test_jobs_run_in_submission_order(writer):
+    release = _block(writer)
+    ran = []
+    for key in ("b", "a", "c"):
+        writer.submit(key, lambda key=key: ran.append(key))
+    writer.submit("b", lambda: ran.append("b2"))
+    release.set()
+    assert writer.flush(5)
+    # The coalesced "b" keeps its original queue position
+    assert ran == ["b2", "a", "c"]
+    assert not writer.is_pending()
+
+
+def test_exceptions_reach_every_coalesced_caller(writer):
+    release = _block(writer)
+
+    def boom():
+        raise OSError("disk full")
+
+    futures = [writer.submit("slot 2", boom) for _ in range(3)]
+    release.set()
+    for f in futures:
+        with pytest.raises(OSError, match="disk full"):
+            f.result(5)
+    # The worker survives a failed job
+    assert writer.submit("slot 2", lambda: "ok").result(5) == "ok"
+
+
+def test_reentrant_submit_runs_inline(writer):
+    def outer():
+        inner = writer.submit("inner", lambda: "inner-done")
+        assert inner.done()
+        assert writer.flush() is True
+        return inner.result()
+
+    assert writer.submit("outer", outer).result(5) == "inner-done"
+
+
+def test_shutdown_drains_pending_jobs():
+    writer = BackgroundSaveWriter()
+    release = _block(writer)
+    future = writer.submit("slot 3", lambda: "written")
+    threading.Timer(0.05, release.set).start()
+    writer.shutdown(wait=True)
+    assert future.result(0) == "written"
+    with pytest.raises(RuntimeError):
+        writer.submit("slot 3", lambda: None)
+
+
+def test_flush_times_out_while_busy(writer):
+    release = _block(writer)
+    assert writer.flush(timeout=0.05) is False
+    release.set()
+    assert writer.flush(5)
+
+
+def test_concurrent_writers_round_trip_latest_state(writer, tmp_path):
+    files = [tmp_path / f"slot {n}.json" for n in range(3)]
+    last = {}
+    order_lock = threading.Lock()
+    barrier = threading.Barrier(6)
+
+    def client(k):
+        barrier.wait()
+        for i in range(40):
+            path = files[(k + i) % len(files)]
+            payload = {"writer": k, "seq": i, "party": list(range(i))}
+            data = json.dumps(payload).encode("utf-8")
+            with order_lock:
+                # Submission order under the lock defines which state must win
+                writer.submit(str(path), lambda p=path, d=data: atomic_write_bytes(str(p), d))
+                last[str(path)] = payload
+
+    threads = [threading.Thread(target=client, args=(k,)) for k in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert writer.flush(10)
+    for path in files:
+        assert json.loads(path.read_text(encoding="utf-8")) == last[str(path)]
+    stats = writer.stats()
+    assert stats["submitted"] == 240
+    assert stats["pending"] == 0
+    assert stats["completed"] + stats["coalesced"] == 240
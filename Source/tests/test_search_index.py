@@ -0,0 +1,72 @@
+from rogueeditor.search_index import CatalogSearchIndex, get_search_index, normalize_key
+
+MOVES = {
+    "thunderbolt": 85,
+    "thunder": 87,
+    "thunder_punch": 9,
+    "fire_punch": 7,
+    "ice_punch": 8,
+    "mega_punch": 5,
+    "tackle": 33,
+    "solar_beam": 76,
+}
+
+
+def test_normalize_key():
+    assert normalize_key(" Farfetch'd ") == "farfetchd"
+    assert normalize_key("Mr. Mime") == "mr_mime"
+    assert normalize_key("Ho-Oh") == "ho_oh"
+
+
+def test_empty_query_lists_catalog_in_order():
+    index = CatalogSearchIndex(MOVES)
+    assert index.search("") == sorted(MOVES)
+    assert index.search("", limit=2) == sorted(MOVES)[:2]
+    assert len(index) == len(MOVES)
+
+
+def test_ranking_exact_prefix_word_prefix_substring():
+    index = CatalogSearchIndex(MOVES)
+    assert index.search("thunder") == ["thunder", "thunder_punch", "thunderbolt"]
+    assert index.search("punch") == ["fire_punch", "ice_punch", "mega_punch", "thunder_punch"]
+    assert index.search("unc") == ["fire_punch", "ice_punch", "mega_punch", "thunder_punch"]
+    assert index.search("bolt") == ["thunderbolt"]
+
+
+def test_limit_and_no_fuzzy_when_direct_hits_exist():
+    index = CatalogSearchIndex(MOVES)
+    assert index.search("punch", limit=2) == ["fire_punch", "ice_punch"]
+    assert index.search("punch", limit=None) == index.search("punch", limit=50)
+
+
+def test_fuzzy_matches_typos():
+    index = CatalogSearchIndex(MOVES)
+    assert index.search("thunderbolr")[0] == "thunderbolt"
+    assert index.search("solarbeem") == ["solar_beam"]
+    assert index.search("solarbeem", fuzzy=False) == []
+    assert index.search("zz") == []
+
+
+def test_extra_labels_resolve_to_catalog_names():
+    index = CatalogSearchIndex(MOVES, extra_ids={"Body Slam Label": 33, "Orphan": 999})
+    assert index.search("body slam") == ["tackle"]
+    assert index.search("orphan") == []
+
+
+def test_brute_force_agreement():
+    names = {f"{a}_{b}": i for i, (a, b) in enumerate(
+        (a, b) for a in ("fire", "water", "grass", "dark") for b in ("fang", "pulse", "blast", "storm"))}
+    index = CatalogSearchIndex(names)
+    for q in ("a", "ar", "st", "ter_p", "k_f", "pulse"):
+        expected = {n for n in names if q in n}
+        assert set(index.search(q, limit=None, fuzzy=False)) == expected
+
+
+def test_shared_index_is_reused_until_mapping_changes():
+    mapping = dict(MOVES)
+    first = get_search_index(mapping)
+    assert get_search_index(mapping) is first
+    mapping["ember"] = 52
+    rebuilt = get_search_index(mapping)
+    assert rebuilt is not first
+    assert rebuilt.search("ember") == ["ember"]
@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("tkinter")
+
+from gui.dialogs.team_editor import BackgroundCacheManager
+from rogueeditor import form_persistence
+from rogueeditor.catalog import load_type_matchups
+
+
+class FakeAPI:
+    username = "tester"
+
+    def __init__(self, slot_data):
+        self.slot_data = slot_data
+
+    def get_slot(self, slot):
+        return self.slot_data
+
+
+@pytest.fixture
+def no_form_state(monkeypatch):
+    # Keep the computation off the per-user form persistence files
+    monkeypatch.setattr(form_persistence, "enrich_pokemon_with_form_data", lambda mon, *a: dict(mon))
+    monkeypatch.setattr(form_persistence, "get_pokemon_effective_types", lambda *a: None)
+    monkeypatch.setattr(form_persistence, "get_pokemon_display_name", lambda *a: "Unknown")
+
+
+def test_background_team_analysis_computes_once(no_form_state):
+    # Pikachu with Thunderbolt (85) and Surf (57)
+    party = [{"id": 1, "species": 25, "level": 50, "moveset": [{"moveId": 85}, {"moveId": 57}]}]
+    manager = BackgroundCacheManager()
+    result = manager._compute_team_analysis_background(FakeAPI({"party": party}), 1, "test_team_analysis")
+
+    assert "error" not in result
+    assert manager.get_cached_data("test_team_analysis") is result
+    assert result["party_matchups"][0]["species_name"] == "Pikachu"
+    assert "ground" in result["party_matchups"][0]["matchups"]["x2"]
+
+    offensive = result["team_offensive"]
+    assert offensive["analysis_complete"] is True
+    assert sorted(offensive["all_team_moves"]) == ["electric", "water"]
+    chart = load_type_matchups()
+    water = offensive["coverage_analysis"]["Water"]
+    assert water["best_coverage"]["effectiveness"] == chart.multiplier("electric", "water") == 2.0
+    assert water["super_effective"]["types"] == ["electric"]
+    assert offensive["coverage_analysis"]["Ground"]["super_effective"]["types"] == ["water"]
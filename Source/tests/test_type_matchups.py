@@ -0,0 +1,66 @@
+import pytest
+
+from rogueeditor.catalog import TypeMatchups
+
+# Defensive orientation: MATRIX[def_type][att_type]
+MATRIX = {
+    "Water": {"fire": 0.5, "grass": 2.0, "water": 0.5, "electric": 2},
+    "Fire": {"water": 2.0, "fire": 0.5, "grass": 0.5},
+    "Grass": {"fire": 2.0, "water": 0.5, "grass": 0.5, "electric": "bad"},
+}
+
+
+@pytest.fixture
+def chart():
+    return TypeMatchups.from_defense_matrix(MATRIX)
+
+
+def test_orientations_agree(chart):
+    assert set(chart.types) == {"water", "fire", "grass", "electric"}
+    for de, row in MATRIX.items():
+        for att, val in row.items():
+            expected = 1.0 if val == "bad" else float(val)
+            a, d = chart.index[att], chart.index[de.lower()]
+            assert chart.table[a][d] == expected
+            assert chart.attack_vs[att][de.lower()] == expected
+            assert chart.defense_from[de.lower()][att] == expected
+
+
+def test_missing_pairs_default_to_neutral(chart):
+    assert chart.multiplier("electric", "fire") == 1.0
+    assert chart.defense_from["electric"]["water"] == 1.0
+    assert chart.multiplier("dragon", "water") == 1.0
+    assert chart.multiplier("FIRE ", "Grass") == 2.0
+
+
+def test_dual_types_multiply(chart):
+    assert chart.against("grass", "water", "fire") == 1.0
+    assert chart.against("electric", "water", "grass") == 2.0
+    assert chart.against("fire", "grass", None) == 2.0
+    assert chart.against("unknown", "grass") == 1.0
+
+
+def test_defensive_profile(chart):
+    assert chart.defensive_profile("water", "grass") == {
+        "water": 0.25,
+        "fire": 1.0,
+        "grass": 1.0,
+        "electric": 2.0,
+    }
+    assert chart.defensive_profile() == {t: 1.0 for t in chart.types}
+
+
+def test_views_are_read_only(chart):
+    with pytest.raises(TypeError):
+        chart.defense_from["water"]["fire"] = 4.0
+    with pytest.raises(TypeError):
+        chart.attack_vs.pop("fire")
+    with pytest.raises(TypeError):
+        chart.index.update(dragon=9)
+    assert dict(chart.attack_vs["fire"]) == dict(zip(chart.types, chart.table[chart.index["fire"]]))
+
+
+def test_empty_matrix():
+    chart = TypeMatchups.from_defense_matrix({})
+    assert len(chart) == 0
+    assert chart.against("fire", "water") == 1.0